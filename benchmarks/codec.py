@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import pickle
+import time
+import typing
+import uuid
+
+from freedom.domain import event as event_
+from freedom.infrastructure import codec as codec_impl
+
+EVENTS: typing.Final[int] = 50_000
+
+
+class Deposited(event_.Event):
+    def __init__(
+        self,
+        account_id: uuid.UUID,
+        amount: float,
+        currency: str,
+        sequence: int,
+        tags: typing.List[str],
+        note: typing.Optional[str] = None,
+    ) -> None:
+        self.account_id = account_id
+        self.amount = amount
+        self.currency = currency
+        self.sequence = sequence
+        self.tags = tags
+        self.note = note
+
+
+class NaiveJsonCodec:
+    # json.dumps of the attributes, the hand-written alternative.
+    def encode(self, event: Deposited) -> bytes:
+        return json.dumps(
+            {
+                "account_id": str(event.account_id),
+                "amount": event.amount,
+                "currency": event.currency,
+                "sequence": event.sequence,
+                "tags": event.tags,
+                "note": event.note,
+            }
+        ).encode()
+
+    def decode(self, data: bytes) -> Deposited:
+        fields = json.loads(data)
+        fields["account_id"] = uuid.UUID(fields["account_id"])
+        return Deposited(**fields)
+
+
+def measure(name: str, codec: typing.Any, events: typing.List[Deposited]) -> None:
+    started = time.perf_counter()
+    encoded = [codec.encode(event) for event in events]
+    encoding = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for data in encoded:
+        codec.decode(data)
+    decoding = time.perf_counter() - started
+
+    size = sum(map(len, encoded)) / len(encoded)
+    print(
+        f"{name:>14} {size:>7.1f}B {EVENTS / encoding:>11.0f}/s"
+        f" {EVENTS / decoding:>11.0f}/s"
+    )
+
+
+def measure_batch(
+    codec: codec_impl.BinaryCodec, events: typing.List[Deposited]
+) -> None:
+    started = time.perf_counter()
+    data = codec.encode_batch(events)
+    encoding = time.perf_counter() - started
+
+    started = time.perf_counter()
+    codec.decode_batch(data)
+    decoding = time.perf_counter() - started
+
+    size = len(data) / len(events)
+    print(
+        f"{'binary batch':>14} {size:>7.1f}B {EVENTS / encoding:>11.0f}/s"
+        f" {EVENTS / decoding:>11.0f}/s"
+    )
+
+
+def main() -> None:
+    events = [
+        Deposited(uuid.uuid4(), i * 1.25, "EUR", i, ["web", "card"], None)
+        for i in range(EVENTS)
+    ]
+
+    print(f"{'codec':>14} {'size':>8} {'encode':>13} {'decode':>13}")
+    measure("pickle", codec_impl.PickleCodec(), events)
+    measure("json (naive)", NaiveJsonCodec(), events)
+    measure("json (schema)", codec_impl.JsonCodec(), events)
+    measure("binary", codec_impl.BinaryCodec(), events)
+    measure_batch(codec_impl.BinaryCodec(), events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom.domain import command as command_
+from freedom.domain import command_handler as handler_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import provider as provider_impl
+
+ITERATIONS: typing.Final[int] = 20_000
+
+
+class Ping(command_.Command):
+    pass
+
+
+def _make_dependencies(count: int) -> typing.List[typing.Type[typing.Any]]:
+    return [type(f"Service{i}", (), {}) for i in range(count)]
+
+
+def _make_handler(
+    dependencies: typing.Sequence[typing.Type[typing.Any]],
+) -> typing.Type[handler_.CommandHandler[Ping]]:
+    namespace: typing.Dict[str, typing.Any] = {
+        f"Service{i}": dependency for i, dependency in enumerate(dependencies)
+    }
+    params = ", ".join(f"s{i}: Service{i}" for i in range(len(dependencies)))
+    exec(f"def __init__(self, {params}) -> None: pass", namespace)
+
+    async def handle(self: typing.Any, command: Ping, /) -> handler_.CommandResult:
+        return handler_.CommandResult.success()
+
+    return type(
+        "PingHandler",
+        (handler_.CommandHandler,),
+        {"__init__": namespace["__init__"], "handle": handle},
+    )
+
+
+class ReflectingProvider(provider_impl.InMemoryDependencyProvider):
+    # Resolves dependencies the way the bus did before injection plans.
+    def get_handler_dependencies(
+        self,
+        handler: typing.Type[typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        return self.get_dependencies(handler.__init__)
+
+
+async def _measure(bus: command_bus_impl.InMemoryCommandBus) -> float:
+    command = Ping()
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await bus.execute(command)
+
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    print(f"{'dependencies':>12} {'before, us':>11} {'after, us':>10}")
+    for count in (1, 10):
+        dependencies = _make_dependencies(count)
+        overrides = {dependency: dependency() for dependency in dependencies}
+        handler = _make_handler(dependencies)
+
+        results = []
+        for provider_cls in (
+            ReflectingProvider,
+            provider_impl.InMemoryDependencyProvider,
+        ):
+            bus = command_bus_impl.InMemoryCommandBus(
+                provider=provider_cls(overrides),
+            )
+            bus.subscribe(handler, Ping)
+            results.append(await _measure(bus))
+
+        before, after = results
+        print(f"{count:>12} {before:>11.2f} {after:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom.application import application as application_
+from freedom.domain import command as command_
+from freedom.domain import command_handler as handler_
+from freedom.domain import event as event_
+from freedom.domain import event_handler as event_handler_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import event_emitter as event_emitter_impl
+
+AGGREGATES: typing.Final[int] = 64
+HANDLER_LATENCY: typing.Final[float] = 0.0001
+
+
+class Emit(command_.Command):
+    def __init__(self, events: int) -> None:
+        self.events = events
+
+
+class Deposited(event_.Event):
+    def __init__(self, aggregate_id: int) -> None:
+        self.aggregate_id = aggregate_id
+
+
+class EmitHandler(handler_.CommandHandler[Emit]):
+    async def handle(self, command: Emit, /) -> handler_.CommandResult:
+        return handler_.CommandResult.success(
+            events=[Deposited(i % AGGREGATES) for i in range(command.events)]
+        )
+
+
+class DepositedHandler(event_handler_.EventHandler[Deposited]):
+    async def handle(self, event: Deposited, /) -> None:
+        # Stands in for I/O done by a projection.
+        await asyncio.sleep(HANDLER_LATENCY)
+
+
+class LegacyApplication(application_.Application):
+    """Dispatches domain events the way the transaction context used to."""
+
+    def transaction_context(self) -> application_.TransactionContext:
+        return LegacyTransactionContext(
+            self,
+            command_bus=self._command_bus,
+            event_emitter=self._event_emitter,
+            dependency_provider=self._dependency_provider,
+        )
+
+
+class LegacyTransactionContext(application_.TransactionContext):
+    async def _dispatch_serially(self, event_queue: typing.Any) -> None:
+        event_queue = list(event_queue)
+        while len(event_queue) > 0:
+            event = event_queue.pop(0)
+            await self.handle_domain_event(event)
+
+
+def make_application(
+    cls: typing.Type[application_.Application], **kwargs: typing.Any
+) -> application_.Application:
+    bus = command_bus_impl.InMemoryCommandBus()
+    bus.subscribe(EmitHandler, Emit)
+    emitter = event_emitter_impl.InMemoryEventEmitter()
+    emitter.subscribe(DepositedHandler, Deposited)
+    return cls("benchmark", 1, command_bus=bus, event_emitter=emitter, **kwargs)
+
+
+async def measure(application: application_.Application, events: int) -> float:
+    started = time.perf_counter()
+    await application.execute_command(Emit(events))
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    applications = {
+        "pop(0)": make_application(LegacyApplication),
+        "deque": make_application(application_.Application),
+        "partitioned": make_application(
+            application_.Application, concurrent_event_dispatch=True
+        ),
+    }
+
+    print(f"{'events':>7} " + " ".join(f"{name:>12}" for name in applications))
+    for events in (1, 100, 10_000):
+        timings = [
+            await measure(application, events) for application in applications.values()
+        ]
+        print(f"{events:>7} " + " ".join(f"{t * 1000:>10.2f}ms" for t in timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
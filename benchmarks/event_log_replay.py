@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import time
+import typing
+
+from freedom.domain import event as event_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import event_log as event_log_impl
+from freedom.infrastructure import event_stream
+
+EVENTS: typing.Final[int] = 100_000
+
+
+class Deposited(event_.Event):
+    def __init__(self, account_id: int, amount: float) -> None:
+        self.account_id = account_id
+        self.amount = amount
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "events.db")
+    log = event_log_impl.SqliteEventLog(path)
+    emitter = event_emitter_impl.InMemoryEventEmitter(event_log=log)
+
+    started = time.perf_counter()
+    for i in range(EVENTS):
+        emitter.emit(Deposited(i % 64, 1.0))
+    await log.flush()
+    print(f"append: {EVENTS / (time.perf_counter() - started):.0f} events/s")
+
+    print(f"{'batch size':>10} {'replayed events/s':>18}")
+    for batch_size in (10, 100, 1000, 10_000):
+        stream = event_stream.CatchUpStream(
+            log, Deposited, timeout=0, batch_size=batch_size
+        )
+        started = time.perf_counter()
+        with stream:
+            replayed = sum([1 async for _ in stream])
+        elapsed = time.perf_counter() - started
+        print(f"{batch_size:>10} {replayed / elapsed:>18.0f}")
+
+    await log.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom import util
+from freedom.domain import command as command_
+from freedom.domain import command_handler as handler_
+from freedom.infrastructure import command_bus as command_bus_impl
+
+ITERATIONS: typing.Final[int] = 50_000
+
+
+class Ping(command_.Command):
+    pass
+
+
+class PingHandler(handler_.CommandHandler[Ping]):
+    async def handle(self, command: Ping, /) -> handler_.CommandResult:
+        return handler_.CommandResult.success()
+
+
+async def passthrough(message: typing.Any, next_middleware: typing.Any) -> typing.Any:
+    return await next_middleware(message)
+
+
+class LegacyMiddlewareChain:
+    # Chain as it was built before compilation: on every call.
+    def __init__(
+        self,
+        executor_middleware: typing.Any,
+        middlewares: typing.List[typing.Any],
+    ) -> None:
+        self.middlewares = middlewares
+        self.executor_middleware = executor_middleware
+
+    async def __call__(self, message: typing.Any) -> typing.Any:
+        all_middlewares = (self.middlewares or []) + [self.executor_middleware]
+
+        chain = util.empty_coro
+        for middleware in reversed(all_middlewares):
+            chain = self.set_next(middleware, chain)
+
+        return await chain(message)
+
+    def set_next(
+        self, middleware: typing.Any, next_middleware: typing.Any
+    ) -> typing.Any:
+        async def wrap(message: typing.Any) -> typing.Any:
+            return await middleware(message, next_middleware)
+
+        return wrap
+
+
+async def _measure(
+    execute: typing.Callable[[Ping], typing.Awaitable[typing.Any]],
+) -> float:
+    command = Ping()
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await execute(command)
+
+    return (time.perf_counter() - started) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    print(f"{'middlewares':>11} {'before, us':>11} {'after, us':>10}")
+    for count in (0, 5, 20):
+        bus = command_bus_impl.InMemoryCommandBus(middlewares=[passthrough] * count)
+        bus.subscribe(PingHandler, Ping)
+
+        legacy = LegacyMiddlewareChain(bus._executor_middleware, [passthrough] * count)
+        before = await _measure(legacy)
+        after = await _measure(bus.execute)
+        print(f"{count:>11} {before:>11.2f} {after:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
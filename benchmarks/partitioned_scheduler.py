@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom.domain import command as command_
+from freedom.domain import command_handler as handler_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import scheduler
+
+COMMANDS: typing.Final[int] = 2_000
+WORKERS: typing.Final[int] = 64
+HANDLER_LATENCY: typing.Final[float] = 0.001
+
+
+class Deposit(command_.Command):
+    def __init__(self, aggregate_id: int) -> None:
+        self.aggregate_id = aggregate_id
+
+
+class DepositHandler(handler_.CommandHandler[Deposit]):
+    async def handle(self, command: Deposit, /) -> handler_.CommandResult:
+        # Stands in for I/O done while handling the command.
+        await asyncio.sleep(HANDLER_LATENCY)
+        return handler_.CommandResult.success()
+
+
+async def main() -> None:
+    bus = command_bus_impl.InMemoryCommandBus()
+    bus.subscribe(DepositHandler, Deposit)
+    partitioned = scheduler.PartitionedCommandBus(bus, max_workers=WORKERS)
+
+    print(f"{'aggregates':>10} {'commands/s':>11}")
+    for aggregates in (1, 2, 8, 32, 128, 512):
+        commands = [Deposit(i % aggregates) for i in range(COMMANDS)]
+
+        started = time.perf_counter()
+        await partitioned.execute_batch(commands, max_concurrency=COMMANDS)
+        elapsed = time.perf_counter() - started
+        print(f"{aggregates:>10} {COMMANDS / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom.domain import aggregate as aggregate_
+from freedom.domain import entity_id
+from freedom.domain import event as event_
+from freedom.infrastructure import repository as repository_impl
+
+COMMANDS: typing.Final[int] = 20
+
+
+class Deposited(event_.Event):
+    def __init__(self, amount: float) -> None:
+        self.amount = amount
+
+
+class Account(aggregate_.AggregateRoot[entity_id.EntityIdSequential]):
+    def deposit(self, amount: float) -> None:
+        self.record_that(Deposited(amount))
+
+
+class LegacyRepository(repository_impl.InMemoryRepository[typing.Any, Account]):
+    # Scans every aggregate, the way collect_events used to.
+    def collect_events(self) -> typing.List[event_.Event]:
+        events = []
+        for aggregate in self._objects.values():
+            events.extend(aggregate.collect_events())
+
+        return events
+
+
+async def measure(
+    repository: repository_impl.InMemoryRepository[typing.Any, Account],
+    ids: typing.List[entity_id.EntityIdSequential],
+) -> float:
+    started = time.perf_counter()
+    for i in range(COMMANDS):
+        # One command: load an aggregate, change it, collect its events.
+        account = await repository.get_by_id(ids[i * 7919 % len(ids)])
+        assert account is not None
+        account.deposit(1.0)
+        assert len(repository.collect_events()) == 1
+
+    return (time.perf_counter() - started) / COMMANDS
+
+
+async def main() -> None:
+    print(f"{'aggregates':>10} {'scan':>12} {'tracked':>12}")
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        ids = [entity_id.EntityIdSequential(i) for i in range(size)]
+        timings = []
+        for repository in (
+            LegacyRepository(),
+            repository_impl.InMemoryRepository[typing.Any, Account](),
+        ):
+            for id_ in ids:
+                await repository.insert(Account(id_))
+
+            timings.append(await measure(repository, ids))
+
+        print(f"{size:>10} {timings[0] * 1e6:>10.1f}us {timings[1] * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
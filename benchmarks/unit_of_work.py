@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+
+from freedom.application import unit_of_work as unit_of_work_
+from freedom.domain import aggregate as aggregate_
+from freedom.domain import entity_id
+from freedom.domain import event as event_
+from freedom.infrastructure import repository as repository_impl
+
+COMMANDS: typing.Final[int] = 20
+# Simulated latency of one round trip to the database.
+ROUND_TRIP: typing.Final[float] = 0.0005
+
+
+class Deposited(event_.Event):
+    def __init__(self, amount: float) -> None:
+        self.amount = amount
+
+
+class Account(aggregate_.AggregateRoot[entity_id.EntityIdSequential]):
+    def deposit(self, amount: float) -> None:
+        self.record_that(Deposited(amount))
+
+
+class RemoteRepository(repository_impl.InMemoryRepository[typing.Any, Account]):
+    # Every call pays a round trip, a flush writes its whole batch in one.
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips = 0
+
+    async def get_by_id(self, aggregate_id: typing.Any) -> typing.Optional[Account]:
+        await self._round_trip()
+        return await super().get_by_id(aggregate_id)
+
+    async def save(self, aggregate: Account) -> None:
+        await self._round_trip()
+        await super().save(aggregate)
+
+    persist = save
+
+    async def flush(
+        self,
+        new: typing.Sequence[Account],
+        dirty: typing.Sequence[Account],
+        removed: typing.Sequence[Account],
+    ) -> None:
+        await self._round_trip()
+        for aggregate in dirty:
+            await super().save(aggregate)
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(ROUND_TRIP)
+
+
+async def handle(
+    repository: typing.Any, ids: typing.List[entity_id.EntityIdSequential]
+) -> None:
+    # One command: each aggregate is read twice and saved.
+    for id_ in ids:
+        account = await repository.get_by_id(id_)
+        account.deposit(1.0)
+        await repository.get_by_id(id_)
+        await repository.save(account)
+
+
+async def measure(touched: int, use_unit_of_work: bool) -> typing.Tuple[float, float]:
+    repository = RemoteRepository()
+    ids = [entity_id.EntityIdSequential(i) for i in range(touched)]
+    for id_ in ids:
+        await repository_impl.InMemoryRepository.insert(repository, Account(id_))
+
+    started = time.perf_counter()
+    for _ in range(COMMANDS):
+        if use_unit_of_work:
+            unit_of_work = unit_of_work_.UnitOfWork()
+            await handle(unit_of_work.track(repository), ids)
+            await unit_of_work.commit()
+        else:
+            await handle(repository, ids)
+
+    elapsed = (time.perf_counter() - started) / COMMANDS
+    return elapsed, repository.round_trips / COMMANDS
+
+
+async def main() -> None:
+    print(f"{'touched':>7} {'direct':>19} {'unit of work':>19}")
+    for touched in (1, 10, 50, 200):
+        direct, direct_trips = await measure(touched, False)
+        batched, batched_trips = await measure(touched, True)
+        print(
+            f"{touched:>7} {direct * 1e3:>8.2f}ms {direct_trips:>6.0f} trips"
+            f" {batched * 1e3:>8.2f}ms {batched_trips:>6.0f} trips"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
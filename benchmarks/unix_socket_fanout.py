@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+import typing
+
+from freedom.domain import event as event_
+from freedom.infrastructure import unix_socket
+
+EVENTS_PER_PROCESS: typing.Final[int] = 20_000
+CHUNK: typing.Final[int] = 500
+
+
+class Ping(event_.Event):
+    def __init__(self, sender: int, sequence: int) -> None:
+        self.sender = sender
+        self.sequence = sequence
+
+
+async def run_worker(
+    path: str, index: int, processes: int, barrier: typing.Any
+) -> float:
+    emitter = unix_socket.UnixSocketEventEmitter(path)
+    expected = (processes - 1) * EVENTS_PER_PROCESS
+    done = asyncio.get_running_loop().create_future()
+
+    async def count(event: Ping) -> None:
+        if emitter.received == expected and not done.done():
+            done.set_result(None)
+
+    emitter.subscribe(count, Ping)
+    await emitter.connect()
+    await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+
+    started = time.perf_counter()
+    for sequence in range(EVENTS_PER_PROCESS):
+        emitter.emit(Ping(index, sequence))
+        if sequence % CHUNK == 0:
+            # Lets the batched write go out and incoming frames in.
+            await asyncio.sleep(0)
+
+    await emitter.flush()
+    await done
+    elapsed = time.perf_counter() - started
+    await emitter.close()
+    return elapsed
+
+
+def worker(
+    path: str, index: int, processes: int, barrier: typing.Any, results: typing.Any
+) -> None:
+    results.put(asyncio.run(run_worker(path, index, processes, barrier)))
+
+
+async def measure(processes: int) -> float:
+    context = multiprocessing.get_context("spawn")
+    path = os.path.join(tempfile.mkdtemp(), "broker.sock")
+    barrier = context.Barrier(processes)
+    results = context.Queue()
+
+    async with unix_socket.UnixSocketBroker(path):
+        workers = [
+            context.Process(
+                target=worker, args=(path, index, processes, barrier, results)
+            )
+            for index in range(processes)
+        ]
+        for process in workers:
+            process.start()
+
+        loop = asyncio.get_running_loop()
+        elapsed = [await loop.run_in_executor(None, results.get) for _ in workers]
+        for process in workers:
+            await loop.run_in_executor(None, process.join)
+
+    # Every event is delivered to each of the other processes.
+    delivered = processes * (processes - 1) * EVENTS_PER_PROCESS
+    return delivered / max(elapsed)
+
+
+async def main() -> None:
+    print(f"{'processes':>9} {'delivered events/s':>19}")
+    for processes in (2, 4, 8):
+        print(f"{processes:>9} {await measure(processes):>19.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,27 +2,44 @@ from __future__ import annotations
 
 import collections
 import contextlib
+import contextvars
 import importlib
+import inspect
 import types
 import typing
 
 import typing_extensions
 
 from freedom import util
+from freedom.application import command_bus as command_bus_
+from freedom.application import lifetime
+from freedom.application import unit_of_work as unit_of_work_
 from freedom.domain import command as command_
 from freedom.domain import command_handler as command_handler_
 from freedom.domain import event as event_
 from freedom.domain import event_handler as event_handler_
+from freedom.domain import query as query_
+from freedom.domain import query_handler as query_handler_
 from freedom.domain import repository as repository_
 
 if typing.TYPE_CHECKING:
-    from freedom.application import command_bus as command_bus_
     from freedom.application import event_emitter as event_emitter_
+    from freedom.application import outbox as outbox_
     from freedom.application import provider
+    from freedom.application import query_bus as query_bus_
 
 _CallableT = typing.TypeVar("_CallableT", bound=typing.Callable[..., typing.Any])
 _ResultT = typing.TypeVar("_ResultT", bound=command_handler_.CommandResult)
 
+EventPartitionKeyType = typing.Callable[
+    [event_.Event], typing.Optional[typing.Hashable]
+]
+
+
+async def _maybe_await(result: typing.Any) -> None:
+    if inspect.isawaitable(result):
+        await result
+
 
 def collect_domain_events(
     result: _ResultT,
@@ -40,6 +57,45 @@ def collect_domain_events(
     return result
 
 
+class _TransactionState:
+    __slots__: typing.Sequence[str] = (
+        "context",
+        "scope_token",
+        "token",
+    )
+
+    def __init__(
+        self,
+        context: TransactionContext,
+        scope_token: contextvars.Token[typing.Optional[lifetime.Scope]],
+    ) -> None:
+        self.context = context
+        self.scope_token = scope_token
+        self.token: typing.Optional[
+            contextvars.Token[typing.Optional[_TransactionState]]
+        ] = None
+
+
+# Transaction state lives in the context of the task that entered it, so one
+# Application (or even one TransactionContext) can serve many concurrent tasks.
+_current_transaction: contextvars.ContextVar[typing.Optional[_TransactionState]] = (
+    contextvars.ContextVar("freedom_current_transaction", default=None)
+)
+# The context whose command the current task is executing. Tasks spawned by
+# that command inherit it, so only this very context is locked for them.
+_executing_command: contextvars.ContextVar[typing.Optional[TransactionContext]] = (
+    contextvars.ContextVar("freedom_executing_command", default=None)
+)
+
+
+def current_transaction() -> typing.Optional[TransactionContext]:
+    state = _current_transaction.get()
+    if state is None:
+        return None
+
+    return state.context
+
+
 class TransactionContext:
     def __init__(
         self,
@@ -47,16 +103,22 @@ class TransactionContext:
         command_bus: command_bus_.CommandBus,
         dependency_provider: typing.Optional[provider.AnyDependencyProviderType] = None,
         event_emitter: typing.Optional[event_emitter_.EventEmitter] = None,
+        event_partition_key: typing.Optional[EventPartitionKeyType] = None,
+        event_concurrency: int = command_bus_.DEFAULT_MAX_CONCURRENCY,
+        outbox: typing.Optional[outbox_.Outbox] = None,
     ) -> None:
         self._application = application
+        self._outbox = outbox
         self._event_emitter = event_emitter
         self._command_bus = command_bus
         self._dependency_provider = dependency_provider
-
-        # ... declaration explanation
-        self._executing_task: bool = False
+        # None dispatches domain events one by one. Otherwise events keep
+        # their order within a partition and partitions run concurrently.
+        self._event_partition_key = event_partition_key
+        self._event_concurrency = event_concurrency
 
     def __enter__(self) -> typing_extensions.Self:
+        self._enter()
         self._application._on_enter_transaction_context(self)
         return self
 
@@ -78,23 +140,71 @@ class TransactionContext:
         exc_val: typing.Optional[BaseException],
         exc_tb: typing.Optional[types.TracebackType],
     ) -> None:
-        self._application._on_exit_transaction_context(self, exc_type, exc_val, exc_tb)
+        try:
+            self._application._on_exit_transaction_context(
+                self, exc_type, exc_val, exc_tb
+            )
+        finally:
+            self._exit()
+
+    async def __aenter__(self) -> typing_extensions.Self:
+        self._enter()
+        await _maybe_await(self._application._on_enter_transaction_context(self))
+        return self
+
+    @typing.no_type_check
+    async def __aexit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        try:
+            await _maybe_await(
+                self._application._on_exit_transaction_context(
+                    self, exc_type, exc_val, exc_tb
+                )
+            )
+        finally:
+            self._exit()
+
+    @property
+    def scope(self) -> lifetime.Scope:
+        state = _current_transaction.get()
+        if state is None or state.context is not self:
+            raise RuntimeError("Transaction context is not entered.")
+
+        scope = lifetime.current_scope()
+        assert scope is not None
+        return scope
 
     async def execute_command(
         self, command: command_.Command
     ) -> command_handler_.CommandResult:
         with self._lock_transaction():
-            command_result = await self._command_bus.execute(command)
-
-            event_queue = command_result.events.copy()
-            while len(event_queue) > 0:
-                event = event_queue.pop(0)
-
-                if isinstance(event, event_.Event):
-                    # Чтобы в дальнейшем реализовать интеграционные ивенты in-box & out-box pattern
-                    await self.handle_domain_event(event)
-                    # event_results = await self.handle_domain_event(event)
-                    # event_queue.extend(event_results.events)
+            try:
+                command_result = await self._command_bus.execute(command)
+            except BaseException:
+                unit_of_work = unit_of_work_.current_unit_of_work()
+                if unit_of_work is not None:
+                    unit_of_work.rollback()
+                raise
+
+            # Changes are written before any handler can observe their events.
+            unit_of_work = unit_of_work_.current_unit_of_work()
+            if unit_of_work is not None:
+                if command_result.is_success():
+                    await unit_of_work.commit()
+                else:
+                    unit_of_work.rollback()
+
+            if not command_result.is_success():
+                # A failed command has no changes to announce, the events it
+                # recorded must not reach any handler or the outbox either.
+                command_result.events.clear()
+
+            if command_result.events:
+                await self._publish(command_result.events)
 
             if command_result.is_success():
                 result = command_handler_.CommandResult.success(
@@ -112,6 +222,53 @@ class TransactionContext:
 
             return result
 
+    async def _publish(self, events: typing.Sequence[event_.Event]) -> None:
+        if self._outbox is not None:
+            # Handlers are run later by the outbox relay, the command only
+            # waits for its events to be stored.
+            await self._outbox.append(
+                [e for e in events if isinstance(e, event_.Event)]
+            )
+        elif self._event_partition_key is None:
+            await self._dispatch_serially(collections.deque(events))
+        else:
+            await self._dispatch_partitioned(events)
+
+    async def _dispatch_serially(self, event_queue: typing.Deque[event_.Event]) -> None:
+        while event_queue:
+            event = event_queue.popleft()
+
+            if isinstance(event, event_.Event):
+                # Чтобы в дальнейшем реализовать интеграционные ивенты in-box & out-box pattern
+                await self.handle_domain_event(event)
+                # event_results = await self.handle_domain_event(event)
+                # event_queue.extend(event_results.events)
+
+    async def _dispatch_partitioned(
+        self, events: typing.Iterable[event_.Event]
+    ) -> None:
+        assert self._event_partition_key is not None
+        partitions: typing.Dict[typing.Hashable, typing.Deque[event_.Event]] = {}
+        for event in events:
+            if isinstance(event, event_.Event):
+                key = self._event_partition_key(event)
+                partition = partitions.get(key)
+                if partition is None:
+                    partition = partitions[key] = collections.deque()
+
+                partition.append(event)
+
+        if len(partitions) == 1:
+            await self._dispatch_serially(*partitions.values())
+            return
+
+        async for _ in util.bounded_map(
+            self._dispatch_serially,
+            partitions.values(),
+            max_concurrency=self._event_concurrency,
+        ):
+            pass
+
     async def handle_domain_event(self, event: event_.Event) -> None:
         if self._event_emitter is None:
             raise ValueError(
@@ -124,16 +281,34 @@ class TransactionContext:
             raise ValueError("Application does not have dependency provider.")
         return self._dependency_provider.get_dependency(service_cls)
 
+    def _enter(self) -> None:
+        state = _TransactionState(self, lifetime.enter_scope())
+        state.token = _current_transaction.set(state)
+
+    def _exit(self) -> None:
+        state = _current_transaction.get()
+        if state is None or state.context is not self:
+            raise RuntimeError("Transaction context is not entered.")
+
+        assert state.token is not None
+        _current_transaction.reset(state.token)
+        lifetime.exit_scope(state.scope_token)
+
     @contextlib.contextmanager
     def _lock_transaction(self) -> typing.Iterator[None]:
-        if self._executing_task:
+        # Per task: concurrent commands are fine, re-entrant ones on this
+        # context (e.g. from an event handler awaited by this command) are
+        # not. A follow-up command in a new context, as a saga issues, is.
+        if _executing_command.get() is self:
             raise RuntimeError(
                 "Cannot execute command while another task is being executed."
             )
 
-        self._executing_task = True
-        yield
-        self._executing_task = False
+        token = _executing_command.set(self)
+        try:
+            yield
+        finally:
+            _executing_command.reset(token)
 
 
 class ApplicationModule:
@@ -155,6 +330,13 @@ class ApplicationModule:
         self._event_handlers: typing.Dict[
             typing.Type[event_.Event], typing.List[event_handler_.AnyEventHandlerType]
         ] = collections.defaultdict(list)
+        self._query_handlers: typing.Dict[
+            typing.Type[query_.Query],
+            typing.Tuple[
+                query_handler_.AnyQueryHandlerType,
+                typing.Tuple[typing.Type[event_.Event], ...],
+            ],
+        ] = {}
 
     @property
     def name(self) -> str:
@@ -195,6 +377,21 @@ class ApplicationModule:
         self._event_handlers[event].append(handler)
         return self
 
+    def with_query_handler(
+        self,
+        handler: query_handler_.AnyQueryHandlerType,
+        query_cls: typing.Optional[query_.QueryType] = None,
+        invalidated_by: typing.Iterable[event_.EventType] = (),
+    ) -> typing_extensions.Self:
+        if (query := query_cls) is None:
+            query, *_ = util.get_base_args(
+                handler,
+                base_type=query_handler_.QueryHandler,
+            )
+
+        self._query_handlers[query] = (handler, tuple(invalidated_by))
+        return self
+
     def event_handler(
         self,
         event_cls: typing.Optional[event_.EventType] = None,
@@ -224,6 +421,22 @@ class ApplicationModule:
 
         return decorator
 
+    def query_handler(
+        self,
+        query_cls: typing.Optional[query_.QueryType] = None,
+        invalidated_by: typing.Iterable[event_.EventType] = (),
+    ) -> typing.Callable[
+        [query_handler_.AnyQueryHandlerTypeT],
+        query_handler_.AnyQueryHandlerTypeT,
+    ]:
+        def decorator(
+            handler: query_handler_.AnyQueryHandlerTypeT,
+        ) -> query_handler_.AnyQueryHandlerTypeT:
+            self.with_query_handler(handler, query_cls, invalidated_by)
+            return handler
+
+        return decorator
+
 
 class Application(ApplicationModule):
     def __init__(
@@ -234,10 +447,21 @@ class Application(ApplicationModule):
         command_bus: command_bus_.CommandBus,
         dependency_provider: typing.Optional[provider.AnyDependencyProviderType] = None,
         event_emitter: typing.Optional[event_emitter_.EventEmitter] = None,
+        query_bus: typing.Optional[query_bus_.QueryBus] = None,
+        concurrent_event_dispatch: bool = False,
+        event_partition_key: EventPartitionKeyType = util.get_aggregate_key,
+        event_concurrency: int = command_bus_.DEFAULT_MAX_CONCURRENCY,
+        outbox: typing.Optional[outbox_.Outbox] = None,
     ) -> None:
         super().__init__(name, version)
+        self._outbox = outbox
+        self._event_partition_key = (
+            event_partition_key if concurrent_event_dispatch else None
+        )
+        self._event_concurrency = event_concurrency
         self._command_bus = command_bus
         self._event_emitter = event_emitter
+        self._query_bus = query_bus
         self._dependency_provider = dependency_provider
         self._on_enter_transaction_context: typing.Callable[
             [TransactionContext], None
@@ -260,6 +484,14 @@ class Application(ApplicationModule):
                 for handler in event_handlers:
                     self._event_emitter.subscribe(handler, event)
 
+        if module._query_handlers:
+            if self._query_bus is None:
+                raise ValueError("Application does not have query bus.")
+
+            query_handlers = module._query_handlers.items()
+            for query, (query_handler, invalidated_by) in query_handlers:
+                self._query_bus.subscribe(query_handler, query, invalidated_by)
+
         self._modules.add(module)
 
     def on_enter_transaction_context(self, callable_: _CallableT) -> _CallableT:
@@ -297,11 +529,45 @@ class Application(ApplicationModule):
             command_bus=self._command_bus,
             event_emitter=self._event_emitter,
             dependency_provider=self._dependency_provider,
+            event_partition_key=self._event_partition_key,
+            event_concurrency=self._event_concurrency,
+            outbox=self._outbox,
         )
         return ctx
 
+    async def execute_query(self, query: query_.Query) -> typing.Any:
+        if self._query_bus is None:
+            raise ValueError("Application does not have query bus.")
+
+        return await self._query_bus.execute(query)
+
     async def execute_command(
         self, command: command_.Command
     ) -> command_handler_.CommandResult:
-        with self.transaction_context() as ctx:
+        async with self.transaction_context() as ctx:
             return await ctx.execute_command(command)
+
+    async def execute_many(
+        self,
+        commands: command_bus_.CommandsType,
+        *,
+        max_concurrency: int = command_bus_.DEFAULT_MAX_CONCURRENCY,
+    ) -> typing.List[command_handler_.CommandResult]:
+        results = {}
+        async for index, result in self.execute_as_completed(
+            commands, max_concurrency=max_concurrency
+        ):
+            results[index] = result
+
+        return [results[index] for index in range(len(results))]
+
+    def execute_as_completed(
+        self,
+        commands: command_bus_.CommandsType,
+        *,
+        max_concurrency: int = command_bus_.DEFAULT_MAX_CONCURRENCY,
+    ) -> typing.AsyncIterator[typing.Tuple[int, command_handler_.CommandResult]]:
+        # Every command still runs in its own transaction context.
+        return util.bounded_map(
+            self.execute_command, commands, max_concurrency=max_concurrency
+        )
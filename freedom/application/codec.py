@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Codec",)
+
+import abc
+import typing
+
+
+class Codec(abc.ABC):
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    def encode(self, obj: typing.Any, /) -> bytes: ...
+
+    @abc.abstractmethod
+    def decode(self, data: bytes, /) -> typing.Any: ...
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("CommandBus",)
+__all__: typing.Sequence[str] = (
+    "CommandBus",
+    "DEFAULT_MAX_CONCURRENCY",
+)
 
 import abc
 import typing
 
+from freedom import util
+
 if typing.TYPE_CHECKING:
     from freedom.application import inflector as inflector_
     from freedom.domain import command as command_
     from freedom.domain import command_handler as handler_
 
+DEFAULT_MAX_CONCURRENCY: typing.Final[int] = 64
+
+CommandsType = typing.Union[
+    typing.Iterable["command_.Command"],
+    typing.AsyncIterable["command_.Command"],
+]
+
 
 class CommandBus(abc.ABC):
     __slots__: typing.Sequence[str] = ()
@@ -17,6 +29,28 @@ class CommandBus(abc.ABC):
     @abc.abstractmethod
     async def execute(self, command: command_.Command) -> handler_.CommandResult: ...
 
+    async def execute_batch(
+        self,
+        commands: CommandsType,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> typing.List[handler_.CommandResult]:
+        results = {}
+        async for index, result in self.execute_batch_as_completed(
+            commands, max_concurrency=max_concurrency
+        ):
+            results[index] = result
+
+        return [results[index] for index in range(len(results))]
+
+    def execute_batch_as_completed(
+        self,
+        commands: CommandsType,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> typing.AsyncIterator[typing.Tuple[int, handler_.CommandResult]]:
+        return util.bounded_map(self.execute, commands, max_concurrency=max_concurrency)
+
     @abc.abstractmethod
     @typing.overload
     def listen(
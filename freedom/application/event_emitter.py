@@ -62,8 +62,32 @@ class EventEmitter(abc.ABC):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[typing.Callable[[event_.EventType], bool]] = None,
+        *,
+        key: typing.Optional[typing.Tuple[str, typing.Any]] = None,
     ) -> event_.Event: ...
 
+    @abc.abstractmethod
+    async def wait_for_any(
+        self,
+        event_type: event_.EventType,
+        /,
+        timeout: typing.Union[float, int, None],
+        *,
+        attribute: str,
+        values: typing.Iterable[typing.Any],
+    ) -> event_.Event: ...
+
+    @abc.abstractmethod
+    async def wait_for_all(
+        self,
+        event_type: event_.EventType,
+        /,
+        timeout: typing.Union[float, int, None],
+        *,
+        attribute: str,
+        values: typing.Iterable[typing.Any],
+    ) -> typing.List[event_.Event]: ...
+
     # @abc.abstractmethod
     # def attach_stream(self, stream):
     #     pass
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "EventLog",
+    "EventLogListenerType",
+    "EventRecordType",
+)
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from freedom.domain import event as event_
+
+EventRecordType = typing.Tuple[int, "event_.Event"]
+EventLogListenerType = typing.Callable[[int, "event_.Event"], None]
+
+
+class EventLog(abc.ABC):
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    @abc.abstractmethod
+    def last_position(self) -> int: ...
+
+    @abc.abstractmethod
+    def append(self, event: event_.Event, /) -> int: ...
+
+    @abc.abstractmethod
+    async def read(
+        self, after: int = 0, limit: int = 1000
+    ) -> typing.Sequence[EventRecordType]: ...
+
+    @abc.abstractmethod
+    def subscribe(self, listener: EventLogListenerType, /) -> None: ...
+
+    @abc.abstractmethod
+    def unsubscribe(self, listener: EventLogListenerType, /) -> None: ...
+
+    @abc.abstractmethod
+    async def flush(self) -> None: ...
+
+    @abc.abstractmethod
+    async def close(self) -> None: ...
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "EVENT_ID_STR",
+    "INBOX_NAME_STR",
+    "Inbox",
+    "get_event_id",
+    "get_event_key",
+    "get_handler_name",
+    "inbox_name",
+)
+
+import abc
+import inspect
+import json
+import typing
+
+from freedom import util
+
+if typing.TYPE_CHECKING:
+    from freedom.domain import event as event_
+
+EVENT_ID_STR: typing.Final[str] = "event_id"
+INBOX_NAME_STR: typing.Final[str] = "__inbox_name__"
+
+_HandlerT = typing.TypeVar("_HandlerT")
+
+
+def inbox_name(name: str, /) -> typing.Callable[[_HandlerT], _HandlerT]:
+    # Records handled events under this name instead of the qualified name
+    # of the handler, which e.g. every closure made by one function shares.
+    def decorator(handler: _HandlerT) -> _HandlerT:
+        setattr(handler, INBOX_NAME_STR, name)
+        return handler
+
+    return decorator
+
+
+def get_event_id(event: event_.Event) -> typing.Optional[typing.Hashable]:
+    return typing.cast(
+        typing.Optional[typing.Hashable], getattr(event, EVENT_ID_STR, None)
+    )
+
+
+def get_event_key(event_id: typing.Hashable) -> str:
+    # Value object ids compare by identity and their repr holds an address,
+    # so every inbox stores this canonical encoding of their value instead.
+    return json.dumps(_to_json(util.structural_key(event_id)), separators=(",", ":"))
+
+
+def get_handler_name(handler: typing.Any) -> str:
+    # Instances are recorded under their class, so every activation of a
+    # handler shares what it has already seen.
+    name = getattr(handler, INBOX_NAME_STR, None)
+    if name is not None:
+        return typing.cast(str, name)
+
+    if not inspect.isclass(handler) and not inspect.isroutine(handler):
+        handler = type(handler)
+
+    return f"{handler.__module__}.{handler.__qualname__}"
+
+
+def _to_json(key: typing.Any) -> typing.Any:
+    if key is None or isinstance(key, (str, int, float)):
+        return key
+
+    if isinstance(key, bytes):
+        return {"bytes": key.hex()}
+
+    if isinstance(key, type):
+        return {"type": f"{key.__module__}.{key.__qualname__}"}
+
+    if isinstance(key, tuple):
+        return [_to_json(item) for item in key]
+
+    if isinstance(key, frozenset):
+        # Sorted by their encoding, set order differs between processes.
+        items = [_to_json(item) for item in key]
+        return {"set": sorted(items, key=json.dumps)}
+
+    return str(key)
+
+
+class Inbox(abc.ABC):
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def contains(self, event_id: typing.Hashable, handler: str, /) -> bool: ...
+
+    @abc.abstractmethod
+    async def add(self, event_id: typing.Hashable, handler: str, /) -> None: ...
+
+    @abc.abstractmethod
+    async def close(self) -> None: ...
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "LIFETIME_STR",
+    "Lifetime",
+    "Scope",
+    "current_scope",
+    "enter_scope",
+    "exit_scope",
+    "get_lifetime",
+    "lifetime",
+)
+
+import contextvars
+import enum
+import typing
+
+LIFETIME_STR: typing.Final[str] = "__lifetime__"
+
+_T = typing.TypeVar("_T")
+_ClsT = typing.TypeVar("_ClsT", bound=typing.Type[typing.Any])
+
+
+class Lifetime(enum.Enum):
+    TRANSIENT = "transient"
+    SCOPED = "scoped"
+    SINGLETON = "singleton"
+
+
+def lifetime(value: Lifetime, /) -> typing.Callable[[_ClsT], _ClsT]:
+    def decorator(cls: _ClsT) -> _ClsT:
+        setattr(cls, LIFETIME_STR, value)
+        return cls
+
+    return decorator
+
+
+def get_lifetime(obj: typing.Any) -> Lifetime:
+    return typing.cast(Lifetime, getattr(obj, LIFETIME_STR, Lifetime.TRANSIENT))
+
+
+class Scope:
+    __slots__: typing.Sequence[str] = ("_instances",)
+
+    def __init__(self) -> None:
+        self._instances: typing.Dict[typing.Any, typing.Any] = {}
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return key in self._instances
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        return self._instances.get(key, default)
+
+    def set(self, key: typing.Any, instance: typing.Any) -> None:
+        self._instances[key] = instance
+
+    def clear(self) -> None:
+        self._instances.clear()
+
+
+_current_scope: contextvars.ContextVar[typing.Optional[Scope]] = contextvars.ContextVar(
+    "freedom_current_scope", default=None
+)
+
+
+def current_scope() -> typing.Optional[Scope]:
+    return _current_scope.get()
+
+
+def enter_scope(
+    scope: typing.Optional[Scope] = None,
+) -> contextvars.Token[typing.Optional[Scope]]:
+    if scope is None:
+        scope = Scope()
+
+    return _current_scope.set(scope)
+
+
+def exit_scope(token: contextvars.Token[typing.Optional[Scope]]) -> None:
+    scope = _current_scope.get()
+    _current_scope.reset(token)
+    if scope is not None:
+        scope.clear()
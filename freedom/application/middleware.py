@@ -29,6 +29,9 @@ class MiddlewareChain(abc.ABC):
     @abc.abstractmethod
     async def __call__(self, message: typing.Any) -> typing.Any: ...
 
+    @abc.abstractmethod
+    def compile(self) -> PartialMiddlewareSigType: ...
+
     @abc.abstractmethod
     def set_next(
         self,
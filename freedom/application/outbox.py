@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Outbox", "OutboxRecordType")
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from freedom.domain import event as event_
+
+OutboxRecordType = typing.Tuple[int, "event_.Event"]
+
+
+class Outbox(abc.ABC):
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def append(self, events: typing.Sequence[event_.Event], /) -> None: ...
+
+    @abc.abstractmethod
+    async def fetch(self, limit: int, /) -> typing.Sequence[OutboxRecordType]: ...
+
+    @abc.abstractmethod
+    async def acknowledge(self, position: int, /) -> None: ...
+
+    @abc.abstractmethod
+    async def wait(self, timeout: typing.Optional[float] = None) -> bool: ...
+
+    @abc.abstractmethod
+    async def close(self) -> None: ...
@@ -23,6 +23,11 @@ class DependencyProvider(abc.ABC, typing.Generic[_KeyT, _ValueT]):
     @abc.abstractmethod
     def register_dependency(self, identifier: _KeyT, dependency: _ValueT) -> None: ...
 
+    @abc.abstractmethod
+    def register_scoped_dependency(
+        self, identifier: _KeyT, factory: typing.Callable[[], _ValueT]
+    ) -> None: ...
+
     @abc.abstractmethod
     def get_dependency(self, identifier: _KeyT) -> _ValueT: ...
 
@@ -39,22 +44,31 @@ class DependencyProvider(abc.ABC, typing.Generic[_KeyT, _ValueT]):
 
         return kwargs
 
-    def get_dependencies(
+    def get_injection_plan(
         self,
         callable_: typing.Callable[..., typing.Any],
     ) -> typing.Mapping[str, typing.Any]:
         sig = inspect.Signature.from_callable(callable_)
         hints = typing.get_type_hints(callable_)
-        deps = {}
+        plan = {}
 
         for param in sig.parameters.values():
             if param.annotation is inspect.Parameter.empty:
                 continue
                 # raise KeyError(f"No type hints found for param {param.name!r}.")
 
-            deps[param.name] = self.get_dependency(hints[param.name])
+            plan[param.name] = hints[param.name]
+
+        return plan
 
-        return deps
+    def get_dependencies(
+        self,
+        callable_: typing.Callable[..., typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        return {
+            name: self.get_dependency(identifier)
+            for name, identifier in self.get_injection_plan(callable_).items()
+        }
         # hints = get_type_hints(callable_)
         # print(hints)
         #
@@ -69,3 +83,15 @@ class DependencyProvider(abc.ABC, typing.Generic[_KeyT, _ValueT]):
         #     hints[arg_name] = self.get_dependency(arg_type)
         #
         # return hints
+
+    def compile_handler(
+        self,
+        handler: typing.Type[typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        return self.get_injection_plan(handler.__init__)
+
+    def get_handler_dependencies(
+        self,
+        handler: typing.Type[typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        return self.get_dependencies(handler.__init__)
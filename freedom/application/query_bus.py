@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("QueryBus",)
+
+import abc
+import typing
+
+if typing.TYPE_CHECKING:
+    from freedom.application import inflector as inflector_
+    from freedom.domain import event as event_
+    from freedom.domain import query as query_
+    from freedom.domain import query_handler as handler_
+
+
+class QueryBus(abc.ABC):
+    __slots__: typing.Sequence[str] = ()
+
+    @abc.abstractmethod
+    async def execute(self, query: query_.Query) -> typing.Any: ...
+
+    @abc.abstractmethod
+    def listen(
+        self,
+        handler: typing.Optional[handler_.AnyQueryHandlerTypeT] = None,
+        query: typing.Optional[query_.QueryType] = None,
+    ) -> typing.Union[
+        handler_.AnyQueryHandlerTypeT,
+        typing.Callable[
+            [handler_.AnyQueryHandlerTypeT],
+            handler_.AnyQueryHandlerTypeT,
+        ],
+    ]: ...
+
+    @abc.abstractmethod
+    def get_handler_for(
+        self,
+        query: query_.QueryType,
+    ) -> typing.Optional[handler_.AnyQueryHandlerType]: ...
+
+    @abc.abstractmethod
+    def get_handlers(self) -> inflector_.TargetHandlersViewType[
+        query_.QueryType,
+        handler_.AnyQueryHandlerType,
+    ]: ...
+
+    @abc.abstractmethod
+    def subscribe(
+        self,
+        handler: handler_.AnyQueryHandlerType,
+        query: query_.QueryType,
+        invalidated_by: typing.Iterable[event_.EventType] = (),
+    ) -> None: ...
+
+    @abc.abstractmethod
+    def unsubscribe(self, query: query_.QueryType) -> None: ...
+
+    @abc.abstractmethod
+    def invalidate(self, query: typing.Optional[query_.QueryType] = None) -> None: ...
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "TrackedRepository",
+    "UnitOfWork",
+    "current_unit_of_work",
+    "tracked",
+)
+
+import copy
+import typing
+
+from freedom import util
+from freedom.application import lifetime
+from freedom.domain import repository as repository_
+
+if typing.TYPE_CHECKING:
+    from freedom.domain import event as event_
+
+
+class _Changes:
+    __slots__: typing.Sequence[str] = ("dirty", "identity_map", "new", "removed")
+
+    def __init__(self) -> None:
+        # Keyed by the structural key of the aggregate id, ids are value
+        # objects and two equal ids are not the same dict key.
+        self.identity_map: typing.Dict[typing.Hashable, typing.Any] = {}
+        self.new: typing.Dict[typing.Hashable, typing.Any] = {}
+        self.dirty: typing.Dict[typing.Hashable, typing.Any] = {}
+        self.removed: typing.Dict[typing.Hashable, typing.Any] = {}
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.new or self.dirty or self.removed)
+
+    def clear_pending(self) -> None:
+        self.new.clear()
+        self.dirty.clear()
+        self.removed.clear()
+
+
+class TrackedRepository(repository_.Repository[typing.Any, typing.Any]):
+    # Stands in for a repository during a transaction: reads go through the
+    # identity map, writes are only recorded until the unit of work commits.
+    __slots__: typing.Sequence[str] = ("_changes", "_repository")
+
+    def __init__(
+        self, repository: repository_.AnyRepository, changes: _Changes
+    ) -> None:
+        self._repository = repository
+        self._changes = changes
+
+    @property
+    def repository(self) -> repository_.AnyRepository:
+        return self._repository
+
+    async def get_by_id(self, aggregate_id: typing.Any) -> typing.Any:
+        key = util.structural_key(aggregate_id)
+        changes = self._changes
+        if key in changes.removed:
+            raise KeyError(f"No aggregate found with id {aggregate_id!r}")
+
+        try:
+            return changes.identity_map[key]
+        except KeyError:
+            pass
+
+        aggregate = await self._repository.get_by_id(aggregate_id)
+        if aggregate is not None:
+            # Repositories may hand out the instance they store, changes go to
+            # a copy until the unit of work commits it.
+            aggregate = copy.deepcopy(aggregate)
+            self._load(key, aggregate)
+
+        return aggregate
+
+    async def remove_by_id(self, aggregate_id: typing.Any) -> None:
+        aggregate = await self.get_by_id(aggregate_id)
+        if aggregate is None:
+            raise KeyError(f"No aggregate found with id {aggregate_id!r}")
+
+        await self.remove(aggregate)
+
+    async def remove(self, aggregate: typing.Any) -> None:
+        key = util.structural_key(aggregate.id)
+        changes = self._changes
+        loaded = changes.identity_map.pop(key, None)
+        if loaded is not None:
+            self._unload(loaded)
+
+        changes.dirty.pop(key, None)
+        # Never written, so there is nothing to remove either.
+        if changes.new.pop(key, None) is None:
+            changes.removed[key] = aggregate
+
+    async def insert(self, aggregate: typing.Any) -> None:
+        key = util.structural_key(aggregate.id)
+        changes = self._changes
+        if key in changes.identity_map:
+            raise ValueError(f"Aggregate with id {aggregate.id!r} already exists.")
+
+        # Removed and inserted again in one transaction is a replacement.
+        if changes.removed.pop(key, None) is not None:
+            changes.dirty[key] = aggregate
+        else:
+            changes.new[key] = aggregate
+
+        self._load(key, aggregate)
+
+    async def save(self, aggregate: typing.Any) -> None:
+        key = util.structural_key(aggregate.id)
+        changes = self._changes
+        changes.removed.pop(key, None)
+        if key in changes.new:
+            changes.new[key] = aggregate
+        else:
+            changes.dirty[key] = aggregate
+
+        loaded = changes.identity_map.get(key)
+        if loaded is not aggregate:
+            if loaded is not None:
+                self._unload(loaded)
+
+            self._load(key, aggregate)
+
+    persist = save
+
+    async def persist_all(self) -> None:
+        # Everything is written in one go when the unit of work commits.
+        return
+
+    def collect_events(self) -> typing.List[event_.Event]:
+        events: typing.List[event_.Event] = []
+        for aggregate in self._changes.identity_map.values():
+            events.extend(aggregate.collect_events())
+
+        return events
+
+    def _load(self, key: typing.Hashable, aggregate: typing.Any) -> None:
+        self._changes.identity_map[key] = aggregate
+        add_event_listener = getattr(aggregate, "add_event_listener", None)
+        if add_event_listener is not None:
+            add_event_listener(self._mark_dirty)
+
+    def _unload(self, aggregate: typing.Any) -> None:
+        remove_event_listener = getattr(aggregate, "remove_event_listener", None)
+        if remove_event_listener is not None:
+            remove_event_listener(self._mark_dirty)
+
+    def _detach(self) -> None:
+        for aggregate in self._changes.identity_map.values():
+            self._unload(aggregate)
+
+    def _mark_dirty(self, aggregate: typing.Any) -> None:
+        # An aggregate that recorded events has changed, even if the handler
+        # never called save on it.
+        key = util.structural_key(aggregate.id)
+        changes = self._changes
+        if changes.identity_map.get(key) is aggregate and key not in changes.new:
+            changes.dirty[key] = aggregate
+
+
+class UnitOfWork:
+    __slots__: typing.Sequence[str] = ("_changes", "_tracked")
+
+    def __init__(self) -> None:
+        self._changes: typing.Dict[repository_.AnyRepository, _Changes] = {}
+        self._tracked: typing.Dict[repository_.AnyRepository, TrackedRepository] = {}
+
+    @property
+    def has_changes(self) -> bool:
+        return any(changes.pending for changes in self._changes.values())
+
+    def track(self, repository: repository_.AnyRepository) -> TrackedRepository:
+        try:
+            return self._tracked[repository]
+        except KeyError:
+            pass
+
+        changes = self._changes[repository] = _Changes()
+        tracked_repository = self._tracked[repository] = TrackedRepository(
+            repository, changes
+        )
+        return tracked_repository
+
+    async def commit(self) -> None:
+        # One flush per repository, however many aggregates were touched. The
+        # identity map is kept, later commands of the transaction reuse it.
+        for repository, changes in self._changes.items():
+            if not changes.pending:
+                continue
+
+            await repository.flush(
+                list(changes.new.values()),
+                list(changes.dirty.values()),
+                list(changes.removed.values()),
+            )
+            changes.clear_pending()
+
+    def rollback(self) -> None:
+        # Loaded aggregates are copies that may hold half-applied changes, they
+        # are dropped along with the pending writes and loaded again when needed.
+        for tracked_repository in self._tracked.values():
+            tracked_repository._detach()
+
+        for changes in self._changes.values():
+            changes.identity_map.clear()
+            changes.clear_pending()
+
+
+def current_unit_of_work() -> typing.Optional[UnitOfWork]:
+    scope = lifetime.current_scope()
+    if scope is None:
+        return None
+
+    return typing.cast(typing.Optional[UnitOfWork], scope.get(UnitOfWork))
+
+
+def tracked(
+    repository: repository_.AnyRepository,
+) -> typing.Callable[[], repository_.AnyRepository]:
+    # A factory for register_scoped_dependency: each transaction gets the
+    # repository wrapped by its own unit of work.
+    def factory() -> repository_.AnyRepository:
+        scope = lifetime.current_scope()
+        if scope is None:
+            return repository
+
+        unit_of_work = scope.get(UnitOfWork)
+        if unit_of_work is None:
+            unit_of_work = UnitOfWork()
+            scope.set(UnitOfWork, unit_of_work)
+
+        return typing.cast(UnitOfWork, unit_of_work).track(repository)
+
+    return factory
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import typing
 
 import typing_extensions as typingext
@@ -12,13 +13,17 @@ _AggregateIdT = typing.TypeVar("_AggregateIdT", bound=entity_id.EntityId)
 
 AnyAggregateRoot: typingext.TypeAlias = "AggregateRoot[typing.Any]"
 
+# Called with the aggregate when it records its first uncommitted event.
+EventListenerType = typing.Callable[["AnyAggregateRoot"], None]
+
 
 class AggregateRoot(entity.Entity[_AggregateIdT]):
-    __slots__: typing.Sequence[str] = ("_uncommitted_events",)
+    __slots__: typing.Sequence[str] = ("_uncommitted_events", "_event_listeners")
 
     def __init__(self, id: _AggregateIdT) -> None:
         super().__init__(id=id)
         self._uncommitted_events: typing.List[event_.Event] = []
+        self._event_listeners: typing.List[EventListenerType] = []
 
     @property
     def uncommitted_events(self) -> typing.List[event_.Event]:
@@ -31,3 +36,40 @@ class AggregateRoot(entity.Entity[_AggregateIdT]):
 
     def record_that(self, event: event_.Event) -> None:
         self._uncommitted_events.append(event)
+        if len(self._uncommitted_events) == 1:
+            for listener in self._event_listeners:
+                listener(self)
+
+    def add_event_listener(self, listener: EventListenerType) -> None:
+        if listener not in self._event_listeners:
+            self._event_listeners.append(listener)
+
+    def remove_event_listener(self, listener: EventListenerType) -> None:
+        if listener in self._event_listeners:
+            self._event_listeners.remove(listener)
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typingext.Self:
+        # Listeners belong to whoever tracks the original (e.g. a repository),
+        # the copy starts untracked.
+        cls = type(self)
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        for name, value in _state(self):
+            if name == "_event_listeners":
+                value = []
+            else:
+                value = copy.deepcopy(value, memo)
+
+            object.__setattr__(clone, name, value)
+
+        return clone
+
+
+def _state(obj: object) -> typing.Iterator[typing.Tuple[str, typing.Any]]:
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                yield name, getattr(obj, name)
+
+    yield from getattr(obj, "__dict__", {}).items()
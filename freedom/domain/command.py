@@ -4,7 +4,7 @@ __all__: typing.Sequence[str] = ("Command", "CommandType")
 
 import typing
 
-from src.domain.valueobject import ValueObject
+from freedom.domain.valueobject import ValueObject
 
 CommandType = typing.Type["Command"]
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 __all__: typing.Sequence[str] = (
+    "BatchEventHandler",
+    "BatchHandleError",
     "EventHandler",
     "AnyEventHandlerTypeT",
     "AnyEventHandlerType",
@@ -27,3 +29,31 @@ class EventHandler(abc.ABC, typing.Generic[_EventT]):
 
     @abc.abstractmethod
     async def handle(self, event: _EventT, /) -> None: ...
+
+
+class BatchEventHandler(EventHandler[_EventT]):
+    __slots__: typing.Sequence[str] = ()
+
+    # Emitter buffers events until either limit is reached.
+    max_batch_size: typing.ClassVar[int] = 100
+    max_latency: typing.ClassVar[float] = 0.05
+
+    @abc.abstractmethod
+    async def handle_batch(self, events: typing.Sequence[_EventT], /) -> None: ...
+
+    async def handle(self, event: _EventT, /) -> None:
+        await self.handle_batch((event,))
+
+
+class BatchHandleError(Exception):
+    __slots__: typing.Sequence[str] = ("_failures",)
+
+    def __init__(
+        self, failures: typing.Sequence[typing.Tuple[typing.Any, Exception]]
+    ) -> None:
+        self._failures = tuple(failures)
+        super().__init__(f"{len(self._failures)} event(s) of the batch failed.")
+
+    @property
+    def failures(self) -> typing.Sequence[typing.Tuple[typing.Any, Exception]]:
+        return self._failures
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("Query", "QueryType")
+
+import typing
+
+from freedom.domain.valueobject import ValueObject
+
+QueryType = typing.Type["Query"]
+
+
+class Query(ValueObject):
+    __slots__: typing.Sequence[str] = ()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "AnyQueryHandler",
+    "AnyQueryHandlerType",
+    "AnyQueryHandlerTypeT",
+    "QueryHandler",
+)
+
+import abc
+import typing
+
+import typing_extensions as typingext
+
+from freedom.domain.query import Query
+
+AnyQueryHandler: typingext.TypeAlias = "QueryHandler[typing.Any, typing.Any]"
+AnyQueryHandlerType: typingext.TypeAlias = typing.Type[AnyQueryHandler]
+AnyQueryHandlerTypeT = typing.TypeVar("AnyQueryHandlerTypeT", bound=AnyQueryHandlerType)
+
+_QueryT = typing.TypeVar("_QueryT", bound=Query)
+_ResultT = typing.TypeVar("_ResultT")
+
+
+class QueryHandler(abc.ABC, typing.Generic[_QueryT, _ResultT]):
+    __slots__: typing.Sequence[str] = ()
+
+    if typing.TYPE_CHECKING:
+
+        def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any: ...
+
+    @abc.abstractmethod
+    async def handle(self, query: _QueryT, /) -> _ResultT: ...
@@ -44,3 +44,20 @@ class Repository(abc.ABC, typing.Generic[_AggregateRootIdT, _AggregateRootT]):
 
     @abc.abstractmethod
     def collect_events(self) -> typing.List[event.Event]: ...
+
+    async def flush(
+        self,
+        new: typing.Sequence[_AggregateRootT],
+        dirty: typing.Sequence[_AggregateRootT],
+        removed: typing.Sequence[_AggregateRootT],
+    ) -> None:
+        # Writes everything a unit of work changed in this repository. A
+        # backend able to do it in one round trip should override this.
+        for aggregate in new:
+            await self.insert(aggregate)
+
+        for aggregate in dirty:
+            await self.persist(aggregate)
+
+        for aggregate in removed:
+            await self.remove(aggregate)
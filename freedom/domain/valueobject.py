@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import typing
 
+import typing_extensions as typingext
+
 from freedom import util
 
 
 class ValueObject(metaclass=util.ImmutableMeta):
+    # Immutable and compared by identity, a copy would not even be equal to
+    # the original, so copies share it.
+    def __copy__(self) -> typingext.Self:
+        return self
+
+    def __deepcopy__(self, memo: typing.Dict[int, typing.Any]) -> typingext.Self:
+        return self
+
     @classmethod
     def unfreeze(cls) -> None:
         setattr(cls, util.FROZEN_STR, False)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("HandlerActivator",)
+
+import types
+import typing
+
+from freedom.application import lifetime as lifetime_
+
+if typing.TYPE_CHECKING:
+    from freedom.application import provider as provider_
+
+_HandlerT = typing.TypeVar("_HandlerT")
+
+_NO_DEPENDENCIES: typing.Final[typing.Mapping[str, typing.Any]] = (
+    types.MappingProxyType({})
+)
+
+ActivatedHandlerType = typing.Tuple[_HandlerT, typing.Mapping[str, typing.Any]]
+
+
+class HandlerActivator:
+    __slots__: typing.Sequence[str] = (
+        "_provider",
+        "_singletons",
+    )
+
+    def __init__(
+        self,
+        provider: typing.Optional[provider_.AnyDependencyProviderType] = None,
+    ) -> None:
+        self._provider = provider
+        self._singletons: typing.Dict[
+            typing.Type[typing.Any], ActivatedHandlerType[typing.Any]
+        ] = {}
+
+    def activate(
+        self, handler: typing.Type[_HandlerT]
+    ) -> ActivatedHandlerType[_HandlerT]:
+        kwargs = self._get_dependencies(handler)
+        lifetime = lifetime_.get_lifetime(handler)
+
+        if lifetime is lifetime_.Lifetime.SINGLETON:
+            activated = self._singletons.get(handler)
+            # Resolved kwargs are cached by the provider, so identity tells
+            # whether one of handler's dependencies was registered again.
+            if activated is None or activated[1] is not kwargs:
+                activated = self._singletons[handler] = (handler(**kwargs), kwargs)
+
+            return activated
+
+        if lifetime is lifetime_.Lifetime.SCOPED:
+            scope = lifetime_.current_scope()
+            if scope is not None:
+                activated = scope.get(handler)
+                if activated is None or activated[1] is not kwargs:
+                    activated = (handler(**kwargs), kwargs)
+                    scope.set(handler, activated)
+
+                return typing.cast(ActivatedHandlerType[_HandlerT], activated)
+
+        return handler(**kwargs), kwargs
+
+    def forget(self, handler: typing.Type[typing.Any]) -> None:
+        self._singletons.pop(handler, None)
+
+    def _get_dependencies(
+        self, handler: typing.Type[typing.Any]
+    ) -> typing.Mapping[str, typing.Any]:
+        if self._provider is None:
+            return _NO_DEPENDENCIES
+
+        return self._provider.get_handler_dependencies(handler)
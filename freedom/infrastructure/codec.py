@@ -0,0 +1,632 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "BinaryCodec",
+    "JsonCodec",
+    "PickleCodec",
+    "SchemaRegistry",
+)
+
+import base64
+import collections.abc
+import datetime
+import decimal
+import enum
+import inspect
+import json
+import operator
+import pickle
+import struct
+import types
+import typing
+import uuid
+import zlib
+
+from freedom.application import codec
+from freedom.domain import valueobject
+
+_SCHEMA_ID: typing.Final[struct.Struct] = struct.Struct("!I")
+_LENGTH: typing.Final[struct.Struct] = struct.Struct("!I")
+_FLOAT: typing.Final[struct.Struct] = struct.Struct("!d")
+_BOOL: typing.Final[struct.Struct] = struct.Struct("!?")
+
+_UNION_TYPES: typing.Final[typing.Tuple[typing.Any, ...]] = (
+    typing.Union,
+    getattr(types, "UnionType", typing.Union),
+)
+_LIST_TYPES: typing.Final[typing.Tuple[typing.Any, ...]] = (
+    list,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Iterable,
+    collections.abc.Collection,
+)
+_SET_TYPES: typing.Final[typing.Tuple[typing.Any, ...]] = (
+    set,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+_DICT_TYPES: typing.Final[typing.Tuple[typing.Any, ...]] = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+
+_WriterType = typing.Callable[[typing.Any, bytearray], None]
+_ReaderType = typing.Callable[[memoryview, int], typing.Tuple[typing.Any, int]]
+_ConverterType = typing.Callable[[typing.Any], typing.Any]
+
+
+class PickleCodec(codec.Codec):
+    __slots__: typing.Sequence[str] = ("_protocol",)
+
+    def __init__(self, *, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        self._protocol = protocol
+
+    def encode(self, obj: typing.Any, /) -> bytes:
+        return pickle.dumps(obj, protocol=self._protocol)
+
+    def decode(self, data: bytes, /) -> typing.Any:
+        return pickle.loads(data)
+
+
+class _FieldCodec(typing.NamedTuple):
+    write: _WriterType
+    read: _ReaderType
+    # To and from a JSON compatible value.
+    dump: _ConverterType
+    load: _ConverterType
+    # struct format of the value when it has a fixed size, such values of a
+    # class are packed together right after its schema id.
+    fixed: typing.Optional[str] = None
+
+
+class _Schema:
+    __slots__: typing.Sequence[str] = (
+        "cls",
+        "decode",
+        "dump",
+        "encode",
+        "load",
+        "name",
+        "schema_id",
+    )
+
+    def __init__(
+        self,
+        cls: typing.Type[typing.Any],
+        name: str,
+        schema_id: int,
+        encode: typing.Callable[[typing.Any, bytearray], None],
+        decode: _ReaderType,
+        dump: _ConverterType,
+        load: _ConverterType,
+    ) -> None:
+        self.cls = cls
+        self.name = name
+        self.schema_id = schema_id
+        self.encode = encode
+        self.decode = decode
+        self.dump = dump
+        self.load = load
+
+
+class SchemaRegistry:
+    # Layouts are derived from the `__init__` type hints of a class, every
+    # parameter is read back from the attribute of the same name. The schema
+    # id is a crc32 of the class name and its fields, so it is the same in
+    # every process running the same code.
+    __slots__: typing.Sequence[str] = (
+        "_by_id",
+        "_by_name",
+        "_by_type",
+    )
+
+    def __init__(self) -> None:
+        self._by_type: typing.Dict[typing.Type[typing.Any], _Schema] = {}
+        self._by_id: typing.Dict[int, _Schema] = {}
+        self._by_name: typing.Dict[str, _Schema] = {}
+
+    def register(self, cls: typing.Type[typing.Any], /) -> int:
+        return self._get_schema(cls).schema_id
+
+    def get_schema_id(self, cls: typing.Type[typing.Any], /) -> int:
+        return self._get_schema(cls).schema_id
+
+    def encode_into(self, obj: typing.Any, out: bytearray, /) -> None:
+        self._get_schema(type(obj)).encode(obj, out)
+
+    def decode_from(
+        self, view: memoryview, offset: int = 0, /
+    ) -> typing.Tuple[typing.Any, int]:
+        (schema_id,) = _SCHEMA_ID.unpack_from(view, offset)
+        schema = self._by_id.get(schema_id)
+        if schema is None:
+            self._discover()
+            schema = self._by_id.get(schema_id)
+            if schema is None:
+                raise ValueError(f"Unknown schema id {schema_id:#010x}.")
+
+        return schema.decode(view, offset)
+
+    def dump(self, obj: typing.Any, /) -> typing.Dict[str, typing.Any]:
+        return typing.cast(
+            typing.Dict[str, typing.Any], self._get_schema(type(obj)).dump(obj)
+        )
+
+    def load(self, data: typing.Mapping[str, typing.Any], /) -> typing.Any:
+        name = data["type"]
+        schema = self._by_name.get(name)
+        if schema is None:
+            self._discover()
+            schema = self._by_name.get(name)
+            if schema is None:
+                raise ValueError(f"Unknown schema {name!r}.")
+
+        return schema.load(data)
+
+    def _get_schema(self, cls: typing.Type[typing.Any]) -> _Schema:
+        try:
+            return self._by_type[cls]
+        except KeyError:
+            pass
+
+        schema = _compile_schema(cls, self)
+        other = self._by_id.get(schema.schema_id)
+        if other is not None and other.cls is not cls:
+            raise ValueError(
+                f"Schema id of {cls!r} collides with the one of {other.cls!r}."
+            )
+
+        self._by_type[cls] = self._by_id[schema.schema_id] = schema
+        self._by_name[schema.name] = schema
+        return schema
+
+    def _discover(self) -> None:
+        # Another process encoded a class this one has not used yet: every
+        # loaded value object is a candidate, the ones without a derivable
+        # layout are simply not encodable.
+        pending = list(valueobject.ValueObject.__subclasses__())
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            if cls in self._by_type or inspect.isabstract(cls):
+                continue
+
+            try:
+                self._get_schema(cls)
+            except (AttributeError, NameError, TypeError, ValueError):
+                continue
+
+
+class BinaryCodec(codec.Codec):
+    __slots__: typing.Sequence[str] = ("_registry",)
+
+    def __init__(self, *, registry: typing.Optional[SchemaRegistry] = None) -> None:
+        self._registry = registry or SchemaRegistry()
+
+    @property
+    def registry(self) -> SchemaRegistry:
+        return self._registry
+
+    def encode(self, obj: typing.Any, /) -> bytes:
+        out = bytearray()
+        self._registry.encode_into(obj, out)
+        return bytes(out)
+
+    def decode(self, data: bytes, /) -> typing.Any:
+        with memoryview(data) as view:
+            obj, _ = self._registry.decode_from(view)
+
+        return obj
+
+    def encode_batch(self, objs: typing.Iterable[typing.Any], /) -> bytes:
+        # Values are self delimiting, a batch is just their concatenation.
+        out = bytearray()
+        encode_into = self._registry.encode_into
+        for obj in objs:
+            encode_into(obj, out)
+
+        return bytes(out)
+
+    def decode_batch(self, data: bytes, /) -> typing.List[typing.Any]:
+        objs = []
+        decode_from = self._registry.decode_from
+        with memoryview(data) as view:
+            offset = 0
+            size = len(view)
+            while offset < size:
+                obj, offset = decode_from(view, offset)
+                objs.append(obj)
+
+        return objs
+
+
+class JsonCodec(codec.Codec):
+    __slots__: typing.Sequence[str] = ("_indent", "_registry")
+
+    def __init__(
+        self,
+        *,
+        registry: typing.Optional[SchemaRegistry] = None,
+        indent: typing.Optional[int] = None,
+    ) -> None:
+        self._registry = registry or SchemaRegistry()
+        self._indent = indent
+
+    @property
+    def registry(self) -> SchemaRegistry:
+        return self._registry
+
+    def encode(self, obj: typing.Any, /) -> bytes:
+        return json.dumps(
+            self._registry.dump(obj),
+            indent=self._indent,
+            separators=None if self._indent is not None else (",", ":"),
+            ensure_ascii=False,
+        ).encode()
+
+    def decode(self, data: bytes, /) -> typing.Any:
+        return self._registry.load(json.loads(data))
+
+
+def _compile_schema(cls: typing.Type[typing.Any], registry: SchemaRegistry) -> _Schema:
+    init = cls.__init__
+    if init is object.__init__:
+        # No __init__ anywhere in the hierarchy, e.g. an event without
+        # fields: its signature would be the *args, **kwargs of object.
+        parameters: typing.List[inspect.Parameter] = []
+        hints: typing.Dict[str, typing.Any] = {}
+    else:
+        parameters = list(inspect.signature(init).parameters.values())[1:]
+        hints = typing.get_type_hints(init)
+
+    fields: typing.List[typing.Tuple[str, typing.Any, _FieldCodec]] = []
+    for parameter in parameters:
+        if parameter.kind not in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            raise TypeError(
+                f"Cannot derive a layout for {cls!r}: "
+                f"parameter {parameter.name!r} is not a keyword parameter."
+            )
+
+        if parameter.name not in hints:
+            raise TypeError(
+                f"Cannot derive a layout for {cls!r}: "
+                f"parameter {parameter.name!r} has no type hint."
+            )
+
+        hint = hints[parameter.name]
+        fields.append((parameter.name, hint, _compile_field(hint, registry)))
+
+    name = f"{cls.__module__}.{cls.__qualname__}"
+    description = ",".join(f"{field}:{_describe(hint)}" for field, hint, _ in fields)
+    schema_id = zlib.crc32(f"{name}({description})".encode())
+
+    fixed_names = tuple(field for field, _, c in fields if c.fixed is not None)
+    head = struct.Struct(
+        "!I" + "".join(c.fixed for _, _, c in fields if c.fixed is not None)
+    )
+    variable = tuple(
+        (field, operator.attrgetter(field), c.write, c.read)
+        for field, _, c in fields
+        if c.fixed is None
+    )
+    converters = tuple((field, c.dump, c.load) for field, _, c in fields)
+    pack = head.pack
+    unpack_from = head.unpack_from
+    head_size = head.size
+
+    def encode(obj: typing.Any, out: bytearray) -> None:
+        out += pack(schema_id, *[getattr(obj, field) for field in fixed_names])
+        for _, get, write, _ in variable:
+            write(get(obj), out)
+
+    def decode(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        kwargs = dict(zip(fixed_names, unpack_from(view, offset)[1:]))
+        offset += head_size
+        for field, _, _, read in variable:
+            kwargs[field], offset = read(view, offset)
+
+        return cls(**kwargs), offset
+
+    def dump(obj: typing.Any) -> typing.Dict[str, typing.Any]:
+        return {
+            "type": name,
+            "fields": {
+                field: to_json(getattr(obj, field)) for field, to_json, _ in converters
+            },
+        }
+
+    def load(data: typing.Mapping[str, typing.Any]) -> typing.Any:
+        values = data["fields"]
+        return cls(
+            **{field: from_json(values[field]) for field, _, from_json in converters}
+        )
+
+    return _Schema(cls, name, schema_id, encode, decode, dump, load)
+
+
+def _compile_field(hint: typing.Any, registry: SchemaRegistry) -> _FieldCodec:
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    if origin in _UNION_TYPES:
+        present = [arg for arg in args if arg is not type(None)]
+        if len(present) != 1 or len(present) == len(args):
+            raise TypeError(f"Only Optional unions have a layout, got {hint!r}.")
+
+        return _optional(_compile_field(present[0], registry))
+
+    if origin is not None:
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return _fixed_tuple([_compile_field(arg, registry) for arg in args])
+
+        if origin is tuple or origin in _LIST_TYPES:
+            return _sequence(_compile_field(args[0], registry), origin is tuple)
+
+        if origin is frozenset or origin in _SET_TYPES:
+            return _set(_compile_field(args[0], registry), origin is frozenset)
+
+        if origin in _DICT_TYPES:
+            return _mapping(
+                _compile_field(args[0], registry), _compile_field(args[1], registry)
+            )
+
+        raise TypeError(f"Cannot derive a layout for {hint!r}.")
+
+    if hint is bool:
+        return _FieldCodec(_write_bool, _read_bool, _identity, bool, "?")
+
+    if hint is int:
+        return _FieldCodec(_write_int, _read_int, _identity, int)
+
+    if hint is float:
+        return _FieldCodec(_write_float, _read_float, _identity, float, "d")
+
+    if hint is str:
+        return _FieldCodec(_write_str, _read_str, _identity, str)
+
+    if hint is bytes:
+        return _FieldCodec(_write_bytes, _read_bytes, _dump_bytes, _load_bytes)
+
+    if hint is uuid.UUID:
+        return _FieldCodec(_write_uuid, _read_uuid, str, uuid.UUID)
+
+    if hint is decimal.Decimal:
+        return _textual(str, decimal.Decimal)
+
+    if hint in (datetime.datetime, datetime.date, datetime.time):
+        return _textual(hint.isoformat, hint.fromisoformat)
+
+    if inspect.isclass(hint) and issubclass(hint, enum.Enum):
+        return _textual(operator.attrgetter("name"), hint.__getitem__)
+
+    if inspect.isclass(hint) and issubclass(hint, valueobject.ValueObject):
+        # Nested values keep their schema id, so subclasses survive the trip.
+        # Resolved on use, a class may refer to itself.
+        return _FieldCodec(
+            registry.encode_into, registry.decode_from, registry.dump, registry.load
+        )
+
+    raise TypeError(f"Cannot derive a layout for {hint!r}.")
+
+
+def _describe(hint: typing.Any) -> str:
+    origin = typing.get_origin(hint)
+    if origin is None:
+        if inspect.isclass(hint):
+            return f"{hint.__module__}.{hint.__qualname__}"
+
+        return repr(hint)
+
+    args = ",".join(
+        "..." if arg is Ellipsis else _describe(arg) for arg in typing.get_args(hint)
+    )
+    return f"{_describe(origin)}[{args}]"
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    return value
+
+
+def _write_bool(value: bool, out: bytearray) -> None:
+    out += _BOOL.pack(value)
+
+
+def _read_bool(view: memoryview, offset: int) -> typing.Tuple[bool, int]:
+    return _BOOL.unpack_from(view, offset)[0], offset + _BOOL.size
+
+
+def _write_int(value: int, out: bytearray) -> None:
+    # Length prefixed two's complement: small ints stay small, big ones
+    # (e.g. uuid based entity ids) still fit.
+    length = (value.bit_length() + 8) >> 3
+    out.append(length)
+    out += value.to_bytes(length, "big", signed=True)
+
+
+def _read_int(view: memoryview, offset: int) -> typing.Tuple[int, int]:
+    end = offset + 1 + view[offset]
+    return int.from_bytes(view[offset + 1 : end], "big", signed=True), end
+
+
+def _write_float(value: float, out: bytearray) -> None:
+    out += _FLOAT.pack(value)
+
+
+def _read_float(view: memoryview, offset: int) -> typing.Tuple[float, int]:
+    return _FLOAT.unpack_from(view, offset)[0], offset + _FLOAT.size
+
+
+def _write_bytes(value: bytes, out: bytearray) -> None:
+    out += _LENGTH.pack(len(value))
+    out += value
+
+
+def _read_bytes(view: memoryview, offset: int) -> typing.Tuple[bytes, int]:
+    start = offset + _LENGTH.size
+    end = start + _LENGTH.unpack_from(view, offset)[0]
+    return bytes(view[start:end]), end
+
+
+def _dump_bytes(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _load_bytes(value: str) -> bytes:
+    return base64.b64decode(value)
+
+
+def _write_str(value: str, out: bytearray) -> None:
+    _write_bytes(value.encode(), out)
+
+
+def _read_str(view: memoryview, offset: int) -> typing.Tuple[str, int]:
+    start = offset + _LENGTH.size
+    end = start + _LENGTH.unpack_from(view, offset)[0]
+    return str(view[start:end], "utf-8"), end
+
+
+def _write_uuid(value: uuid.UUID, out: bytearray) -> None:
+    out += value.bytes
+
+
+def _read_uuid(view: memoryview, offset: int) -> typing.Tuple[uuid.UUID, int]:
+    end = offset + 16
+    return uuid.UUID(bytes=bytes(view[offset:end])), end
+
+
+def _textual(to_str: _ConverterType, from_str: _ConverterType) -> _FieldCodec:
+    def write(value: typing.Any, out: bytearray) -> None:
+        _write_str(to_str(value), out)
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        value, offset = _read_str(view, offset)
+        return from_str(value), offset
+
+    return _FieldCodec(write, read, to_str, from_str)
+
+
+def _optional(inner: _FieldCodec) -> _FieldCodec:
+    inner_write, inner_read = inner.write, inner.read
+    inner_dump, inner_load = inner.dump, inner.load
+
+    def write(value: typing.Any, out: bytearray) -> None:
+        if value is None:
+            out.append(0)
+        else:
+            out.append(1)
+            inner_write(value, out)
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        if not view[offset]:
+            return None, offset + 1
+
+        return inner_read(view, offset + 1)
+
+    def dump(value: typing.Any) -> typing.Any:
+        return None if value is None else inner_dump(value)
+
+    def load(value: typing.Any) -> typing.Any:
+        return None if value is None else inner_load(value)
+
+    return _FieldCodec(write, read, dump, load)
+
+
+def _sequence(item: _FieldCodec, as_tuple: bool) -> _FieldCodec:
+    item_write, item_read = item.write, item.read
+    item_dump, item_load = item.dump, item.load
+    factory: typing.Callable[[typing.List[typing.Any]], typing.Any] = (
+        tuple if as_tuple else list
+    )
+
+    def write(value: typing.Collection[typing.Any], out: bytearray) -> None:
+        out += _LENGTH.pack(len(value))
+        for element in value:
+            item_write(element, out)
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        (count,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        elements = []
+        for _ in range(count):
+            element, offset = item_read(view, offset)
+            elements.append(element)
+
+        return factory(elements), offset
+
+    def dump(value: typing.Iterable[typing.Any]) -> typing.List[typing.Any]:
+        return [item_dump(element) for element in value]
+
+    def load(value: typing.Iterable[typing.Any]) -> typing.Any:
+        return factory([item_load(element) for element in value])
+
+    return _FieldCodec(write, read, dump, load)
+
+
+def _set(item: _FieldCodec, frozen: bool) -> _FieldCodec:
+    sequence = _sequence(item, as_tuple=False)
+    factory: typing.Callable[[typing.Iterable[typing.Any]], typing.Any] = (
+        frozenset if frozen else set
+    )
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        elements, offset = sequence.read(view, offset)
+        return factory(elements), offset
+
+    def load(value: typing.Iterable[typing.Any]) -> typing.Any:
+        return factory(sequence.load(value))
+
+    return _FieldCodec(sequence.write, read, sequence.dump, load)
+
+
+def _fixed_tuple(items: typing.Sequence[_FieldCodec]) -> _FieldCodec:
+    def write(value: typing.Sequence[typing.Any], out: bytearray) -> None:
+        for item, element in zip(items, value):
+            item.write(element, out)
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        elements = []
+        for item in items:
+            element, offset = item.read(view, offset)
+            elements.append(element)
+
+        return tuple(elements), offset
+
+    def dump(value: typing.Sequence[typing.Any]) -> typing.List[typing.Any]:
+        return [item.dump(element) for item, element in zip(items, value)]
+
+    def load(value: typing.Sequence[typing.Any]) -> typing.Any:
+        return tuple(item.load(element) for item, element in zip(items, value))
+
+    return _FieldCodec(write, read, dump, load)
+
+
+def _mapping(key: _FieldCodec, value_: _FieldCodec) -> _FieldCodec:
+    def write(value: typing.Mapping[typing.Any, typing.Any], out: bytearray) -> None:
+        out += _LENGTH.pack(len(value))
+        for k, v in value.items():
+            key.write(k, out)
+            value_.write(v, out)
+
+    def read(view: memoryview, offset: int) -> typing.Tuple[typing.Any, int]:
+        (count,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        mapping = {}
+        for _ in range(count):
+            k, offset = key.read(view, offset)
+            mapping[k], offset = value_.read(view, offset)
+
+        return mapping, offset
+
+    # JSON objects only have string keys, pairs keep any key type.
+    def dump(value: typing.Mapping[typing.Any, typing.Any]) -> typing.Any:
+        return [[key.dump(k), value_.dump(v)] for k, v in value.items()]
+
+    def load(value: typing.Iterable[typing.Sequence[typing.Any]]) -> typing.Any:
+        return {key.load(k): value_.load(v) for k, v in value}
+
+    return _FieldCodec(write, read, dump, load)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("InMemoryCommandBus",)
-
+__all__: typing.Sequence[str] = (
+    "InMemoryCommandBus",
+    "RUN_IN_PROCESS_STR",
+    "run_in_process",
+)
+
+import asyncio
+import concurrent.futures
+import inspect
 import typing
 
+from freedom import util
 from freedom.application import application
 from freedom.application import command_bus
 from freedom.application import inflector as inflector_
+from freedom.application import lifetime as lifetime_
 from freedom.domain import command as command_
 from freedom.domain import command_handler as handler_
+from freedom.infrastructure import activator as activator_
 from freedom.infrastructure import inflector as inflector_impl
 from freedom.infrastructure import middleware as middleware_impl
 
@@ -16,9 +26,63 @@ if typing.TYPE_CHECKING:
     from freedom.application import middleware
     from freedom.application import provider as provider_
 
+RUN_IN_PROCESS_STR: typing.Final[str] = "__run_in_process__"
+
+# Singleton handlers of a pool worker process.
+_process_handlers: typing.Dict[
+    handler_.AnyCommandHandlerType, handler_.AnyCommandHandler
+] = {}
+
+
+def run_in_process(
+    handler: handler_.AnyCommandHandlerTypeT,
+) -> handler_.AnyCommandHandlerTypeT:
+    _check_process_handler(handler)
+    setattr(handler, RUN_IN_PROCESS_STR, True)
+    return handler
+
+
+def _check_process_handler(handler: handler_.AnyCommandHandlerType) -> None:
+    # A pool worker builds the handler with a bare handler(), there is no
+    # dependency provider on that side.
+    required = [
+        name
+        for name, parameter in inspect.signature(handler).parameters.items()
+        if parameter.default is parameter.empty
+        and parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+    ]
+    if required:
+        raise TypeError(
+            f"{handler.__qualname__} runs in a worker process and cannot take"
+            f" dependencies, got: {', '.join(required)}."
+        )
+
+
+def _handle_in_process(
+    handler: handler_.AnyCommandHandlerType,
+    command: command_.Command,
+) -> handler_.CommandResult:
+    # Runs in a pool worker: handler is built without dependencies, since
+    # repositories and services of the parent process cannot be shared.
+    if lifetime_.get_lifetime(handler) is lifetime_.Lifetime.SINGLETON:
+        instance = _process_handlers.get(handler)
+        if instance is None:
+            instance = _process_handlers[handler] = handler()
+    else:
+        instance = handler()
+
+    result = asyncio.run(instance.handle(command))
+    for error in result.errors:
+        # Tracebacks are not picklable.
+        error.exception_info = None
+
+    return result
+
 
 class InMemoryCommandBus(command_bus.CommandBus):
     __slots__: typing.Sequence[str] = (
+        "_activator",
+        "_executor",
         "_handlers",
         "_provider",
         "_inflector",
@@ -32,6 +96,7 @@ class InMemoryCommandBus(command_bus.CommandBus):
         inflector: typing.Optional[
             inflector_.Inflector[command_.CommandType, handler_.AnyCommandHandlerType]
         ] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
     ) -> None:
         if inflector is None:
             inflector = typing.cast(
@@ -50,6 +115,10 @@ class InMemoryCommandBus(command_bus.CommandBus):
         )
         self._inflector = inflector
         self._provider = provider
+        self._activator = activator_.HandlerActivator(provider)
+        # Handlers marked with run_in_process are offloaded to it, usually a
+        # ProcessPoolExecutor, so CPU-bound handling leaves the loop free.
+        self._executor = executor
         self._handlers: inflector_.TargetHandlersType[
             command_.CommandType, handler_.AnyCommandHandlerType
         ] = {}
@@ -100,15 +169,31 @@ class InMemoryCommandBus(command_bus.CommandBus):
         handler: handler_.AnyCommandHandlerType,
         command: command_.CommandType,
     ) -> None:
+        if getattr(handler, RUN_IN_PROCESS_STR, False):
+            _check_process_handler(handler)
+
         self._inflector.subscribe(handler, command)
 
+        if self._provider is not None:
+            self._provider.compile_handler(handler)
+
     def unsubscribe(self, command: command_.CommandType) -> None:
+        handler = self.get_handler_for(command)
         self._inflector.unsubscribe(command)
 
+        if handler is not None:
+            self._activator.forget(handler)
+
+    def add_middleware(self, middleware: middleware.MiddlewareSigType) -> None:
+        self._middlewares_chain.add_middleware(middleware)
+
+    def remove_middleware(self, middleware: middleware.MiddlewareSigType) -> None:
+        self._middlewares_chain.remove_middleware(middleware)
+
     async def execute(self, command: command_.Command) -> handler_.CommandResult:
         result = typing.cast(
             handler_.CommandResult,
-            await self._middlewares_chain(command),
+            await self._middlewares_chain.chain(command),
         )
         return result
 
@@ -121,12 +206,14 @@ class InMemoryCommandBus(command_bus.CommandBus):
         command_type = type(command)
         handler = self.get_handler_for(command_type)
         if handler is not None:
-            kwargs: typing.Dict[str, typing.Any] = {}
-
-            if self._provider is not None:
-                kwargs.update(self._provider.get_dependencies(handler.__init__))
-
-            handler = handler(**kwargs)
+            if self._executor is not None and getattr(
+                handler, RUN_IN_PROCESS_STR, False
+            ):
+                return await util.get_loop().run_in_executor(
+                    self._executor, _handle_in_process, handler, command
+                )
+
+            handler, kwargs = self._activator.activate(handler)
             result = typing.cast(
                 handler_.CommandResult,
                 application.collect_domain_events(
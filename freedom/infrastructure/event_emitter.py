@@ -1,27 +1,76 @@
 from __future__ import annotations
 
-__all__: typing.Sequence[str] = ("InMemoryEventEmitter",)
+__all__: typing.Sequence[str] = (
+    "InMemoryEventEmitter",
+    "PRIORITY_STR",
+    "priority",
+)
 
 import asyncio
 import collections
+import contextvars
 import inspect
+import itertools
 import typing
 
+from freedom import sentinel
 from freedom import util
 from freedom.application import event_emitter
+from freedom.application import event_log as event_log_
+from freedom.application import inbox as inbox_
 from freedom.application import inflector as inflector_
 from freedom.application import provider as provider_
 from freedom.domain import event as event_
 from freedom.domain import event_handler as handler_
+from freedom.infrastructure import activator as activator_
 from freedom.infrastructure import inflector as inflector_impl
 
+PRIORITY_STR: typing.Final[str] = "__priority__"
+
+_HandlerT = typing.TypeVar("_HandlerT")
+
+# (priority, sequence, handler, event, completion future)
+_JobType = typing.Tuple[
+    int, int, typing.Any, event_.Event, "asyncio.Future[typing.Any]"
+]
+
+# The emitter whose worker pool runs the current task, if any.
+_current_worker: contextvars.ContextVar[typing.Optional[InMemoryEventEmitter]] = (
+    contextvars.ContextVar("freedom_current_worker", default=None)
+)
+
+
+def priority(value: int, /) -> typing.Callable[[_HandlerT], _HandlerT]:
+    # Lower values are dispatched first by a worker pool.
+    def decorator(handler: _HandlerT) -> _HandlerT:
+        setattr(handler, PRIORITY_STR, value)
+        return handler
+
+    return decorator
+
 
 class InMemoryEventEmitter(event_emitter.EventEmitter):
     __slots__: typing.Sequence[str] = (
+        "_activator",
+        "_dispatch_table",
         "_waiters",
         "_inflector",
         "_provider",
         "_dispatch_on_exc",
+        "_max_workers",
+        "_concurrency_limits",
+        "_limited_types",
+        "_queue",
+        "_sequence",
+        "_workers",
+        "_active",
+        "_deferred",
+        "_batches",
+        "_batch_tasks",
+        "_inbox",
+        "_inbox_names",
+        "_inbox_name_counts",
+        "_event_log",
     )
 
     def __init__(
@@ -35,7 +84,16 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
             ]
         ] = None,
         dispatch_on_exc: bool = True,
+        workers: typing.Optional[int] = None,
+        concurrency_limits: typing.Optional[
+            typing.Mapping[event_.EventType, int]
+        ] = None,
+        inbox: typing.Optional[inbox_.Inbox] = None,
+        event_log: typing.Optional[event_log_.EventLog] = None,
     ) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be positive.")
+
         if inflector is None:
             inflector = typing.cast(
                 inflector_.Inflector[
@@ -48,42 +106,84 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
             )
 
         self._dispatch_on_exc = dispatch_on_exc
-        self._waiters: typing.Any = collections.defaultdict(set)  # FIXME
+        self._waiters: typing.Dict[event_.EventType, _WaiterBucket] = {}
         self._inflector = inflector
         self._provider = provider
+        self._activator = activator_.HandlerActivator(provider)
+        # Concrete event type -> handlers subscribed to it or to any of its
+        # bases, in MRO order. Rebuilt lazily after (un)subscribing.
+        self._dispatch_table: typing.Dict[
+            event_.EventType, typing.Tuple[handler_.AnyEventHandlerType, ...]
+        ] = {}
+
+        # Worker pool mode: handlers run on a fixed number of tasks fed from a
+        # priority queue instead of one task per handler per event.
+        self._max_workers = workers
+        self._concurrency_limits = dict(concurrency_limits or {})
+        # Event type -> the base its limit is declared on. Types sharing that
+        # base share one limit, so it keys the counters and parked jobs.
+        self._limited_types: typing.Dict[
+            event_.EventType, typing.Optional[event_.EventType]
+        ] = {}
+        self._queue: typing.Optional[asyncio.PriorityQueue[_JobType]] = None
+        self._sequence = itertools.count()
+        self._workers: typing.List[asyncio.Task[None]] = []
+        self._active: typing.Dict[event_.EventType, int] = collections.defaultdict(int)
+        self._deferred: typing.Dict[event_.EventType, typing.Deque[_JobType]] = {}
+
+        # BatchEventHandler class -> events buffered for its next batch.
+        self._batches: typing.Dict[
+            typing.Type[handler_.BatchEventHandler[typing.Any]], _PendingBatch
+        ] = {}
+        self._batch_tasks: typing.Set[asyncio.Task[None]] = set()
+
+        # Events carrying an id are handled at most once per handler, so a
+        # redelivery (e.g. by an outbox relay) does not run handlers again.
+        self._inbox = inbox
+        # Subscribed handler -> (inbox name, subscriptions). Names belong to
+        # registrations: closures or bound methods sharing a qualified name
+        # get a suffix, or the first one would hide the events from the rest.
+        self._inbox_names: typing.Dict[typing.Any, typing.Tuple[str, int]] = {}
+        self._inbox_name_counts: typing.Dict[str, int] = {}
+        # Every emitted event is appended, so consumers can replay them later.
+        self._event_log = event_log
 
     def emit(self, event: event_.Event, /) -> asyncio.Future[typing.Any]:
         event_type = type(event)
-        tasks: typing.List[typing.Coroutine[None, typing.Any, None]] = []
+        tasks: typing.List[typing.Awaitable[None]] = []
 
-        handlers = self.get_handler_for(event_type)
-        if handlers:
-            for handler in handlers:
-                if inspect.isclass(handler):
-                    dependencies: typing.Dict[str, typing.Any] = {}
-                    if self._provider is not None:
-                        dependencies.update(
-                            self._provider.get_dependencies(handler.__init__)
-                        )
+        # Exception events carry live handlers and tracebacks, not history.
+        if self._event_log is not None and not isinstance(event, event_.ExceptionEvent):
+            self._event_log.append(event)
 
-                    handler = handler(**dependencies)
+        try:
+            handlers = self._dispatch_table[event_type]
+        except KeyError:
+            handlers = self._dispatch_table[event_type] = self._resolve_handlers(
+                event_type
+            )
 
-                tasks.append(self._trigger_handler(handler, event))
+        for handler in handlers:
+            if inspect.isclass(handler):
+                if issubclass(handler, handler_.BatchEventHandler):
+                    tasks.append(self._buffer(handler, event))
+                    continue
 
-        waiter_set = self._waiters[event_type]
+                handler, _ = self._activator.activate(handler)
 
-        for waiter in tuple(waiter_set):
-            predicate, future = waiter
-            if not future.done():
-                try:
-                    if predicate and not predicate(event):
-                        continue
-                except Exception as exc:
-                    future.set_exception(exc)
-                else:
-                    future.set_result(event)
+            callback = typing.cast(
+                typing.Callable[..., typing.Awaitable[None]], handler
+            )
+            if self._max_workers is None:
+                tasks.append(self._trigger_handler(callback, event))
+            else:
+                tasks.append(self._submit(callback, event))
 
-            waiter_set.remove(waiter)
+        bucket = self._waiters.get(event_type)
+        if bucket is not None:
+            bucket.notify(event)
+            if not bucket:
+                del self._waiters[event_type]
 
         if tasks:
             return asyncio.gather(*tasks)
@@ -101,7 +201,21 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
             handler_.AnyEventHandlerType,
         ],
     ]:
-        return self._inflector.listen(handler, event)
+        def wrap(target_handler: handler_.AnyEventHandlerType) -> typing.Any:
+            target = event
+            if target is None:
+                target = util.get_base_args(
+                    target_handler,
+                    base_type=handler_.EventHandler,
+                )[0]
+
+            self.subscribe(target_handler, target)
+            return target_handler
+
+        if handler is None:
+            return wrap
+
+        return typing.cast(handler_.AnyEventHandlerType, wrap(handler))
 
     def get_handler_for(
         self,
@@ -126,11 +240,23 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
 
         handlers.append(handler)
         self._inflector.subscribe(handlers, event, allow_many=True)
+        self._dispatch_table.clear()
+        if self._inbox is not None:
+            self._add_inbox_name(handler)
+
+        if self._provider is not None and inspect.isclass(handler):
+            self._provider.compile_handler(handler)
 
     def unsubscribe(
         self, handler: handler_.AnyEventHandlerType, event: event_.EventType
     ) -> None:
         self._inflector.unsubscribe(event, handler)
+        self._dispatch_table.clear()
+        if self._inbox is not None:
+            self._remove_inbox_name(handler)
+
+        if inspect.isclass(handler):
+            self._activator.forget(handler)
 
     async def wait_for(
         self,
@@ -138,36 +264,139 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
         /,
         timeout: typing.Union[float, int, None],
         predicate: typing.Optional[typing.Callable[[typing.Any], bool]] = None,
+        *,
+        key: typing.Optional[typing.Tuple[str, typing.Any]] = None,
     ) -> event_.Event:
         future = util.get_loop().create_future()
+        waiter = (predicate, future)
+        index = None if key is None else (key[0], util.structural_key(key[1]))
+        self._add_waiter(event_type, waiter, index)
 
-        if predicate is None:
-            predicate = lambda _: True
+        try:
+            event = await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._remove_waiter(event_type, waiter, index)
+
+        return typing.cast(event_.Event, event)
 
-        waiter_set = self._waiters[event_type]
-        item = (predicate, future)
-        waiter_set.add(item)
+    async def wait_for_any(
+        self,
+        event_type: event_.EventType,
+        /,
+        timeout: typing.Union[float, int, None],
+        *,
+        attribute: str,
+        values: typing.Iterable[typing.Any],
+    ) -> event_.Event:
+        # One future shared by every value, the first match wins.
+        future = util.get_loop().create_future()
+        waiter = (None, future)
+        indexes = [(attribute, util.structural_key(value)) for value in values]
+        for index in indexes:
+            self._add_waiter(event_type, waiter, index)
 
         try:
             event = await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            waiter_set.remove(item)
-            raise
+        finally:
+            for index in indexes:
+                self._remove_waiter(event_type, waiter, index)
 
         return typing.cast(event_.Event, event)
 
+    async def wait_for_all(
+        self,
+        event_type: event_.EventType,
+        /,
+        timeout: typing.Union[float, int, None],
+        *,
+        attribute: str,
+        values: typing.Iterable[typing.Any],
+    ) -> typing.List[event_.Event]:
+        loop = util.get_loop()
+        waiters = [
+            ((None, loop.create_future()), (attribute, util.structural_key(value)))
+            for value in values
+        ]
+        for waiter, index in waiters:
+            self._add_waiter(event_type, waiter, index)
+
+        try:
+            events = await asyncio.wait_for(
+                asyncio.gather(*(future for (_, future), _ in waiters)),
+                timeout=timeout,
+            )
+        finally:
+            for waiter, index in waiters:
+                self._remove_waiter(event_type, waiter, index)
+
+        return typing.cast(typing.List[event_.Event], events)
+
+    def _add_waiter(
+        self,
+        event_type: event_.EventType,
+        waiter: _WaiterType,
+        index: typing.Optional[typing.Tuple[str, typing.Hashable]],
+    ) -> None:
+        bucket = self._waiters.get(event_type)
+        if bucket is None:
+            bucket = self._waiters[event_type] = _WaiterBucket()
+
+        bucket.add(waiter, index)
+
+    def _remove_waiter(
+        self,
+        event_type: event_.EventType,
+        waiter: _WaiterType,
+        index: typing.Optional[typing.Tuple[str, typing.Hashable]],
+    ) -> None:
+        bucket = self._waiters.get(event_type)
+        if bucket is None:
+            return
+
+        bucket.discard(waiter, index)
+        if not bucket:
+            del self._waiters[event_type]
+
+    async def flush(self) -> None:
+        for handler in tuple(self._batches):
+            self._flush_batch(handler)
+
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.flush()
+
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        # Jobs nobody will run any more, their emits must not wait forever.
+        jobs: typing.List[_JobType] = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                jobs.append(self._queue.get_nowait())
+
+        for parked in self._deferred.values():
+            jobs.extend(parked)
+
+        self._deferred.clear()
+        self._queue = None
+        for job in jobs:
+            _fail_closed(job[4])
+
     async def _trigger_handler(
         self,
         callback: typing.Callable[..., typing.Awaitable[None]],
         event: event_.Event,
     ) -> None:
         try:
-            if isinstance(callback, handler_.EventHandler):
-                await callback.handle(event)
-                return
-            await callback(event)
+            await self._invoke(callback, event)
         except Exception as exc:
-            if not self._dispatch_on_exc:
+            # A failing ExceptionEvent handler (e.g. one subscribed to Event)
+            # would otherwise feed itself forever.
+            if not self._dispatch_on_exc or isinstance(event, event_.ExceptionEvent):
                 raise exc
 
             exc_event = event_.ExceptionEvent(
@@ -176,3 +405,434 @@ class InMemoryEventEmitter(event_emitter.EventEmitter):
                 failed_callback=callback,
             )
             await self.emit(exc_event)
+
+    def _resolve_handlers(
+        self, event_type: event_.EventType
+    ) -> typing.Tuple[handler_.AnyEventHandlerType, ...]:
+        handlers: typing.List[handler_.AnyEventHandlerType] = []
+        for base in event_type.__mro__:
+            for handler in self.get_handler_for(base) or ():
+                if not any(handler is seen for seen in handlers):
+                    handlers.append(handler)
+
+        return tuple(handlers)
+
+    async def _invoke(
+        self,
+        callback: typing.Callable[..., typing.Awaitable[None]],
+        event: event_.Event,
+    ) -> None:
+        inbox = self._inbox
+        event_id = None if inbox is None else inbox_.get_event_id(event)
+        if event_id is not None:
+            assert inbox is not None
+            # Class handlers are activated, their instances share the name.
+            handler_name = self._get_inbox_name(
+                type(callback)
+                if isinstance(callback, handler_.EventHandler)
+                else callback
+            )
+            if await inbox.contains(event_id, handler_name):
+                return
+
+        if isinstance(callback, handler_.EventHandler):
+            await callback.handle(event)
+        else:
+            await callback(event)
+
+        if event_id is not None:
+            assert inbox is not None
+            await inbox.add(event_id, handler_name)
+
+    def _add_inbox_name(self, handler: typing.Any) -> None:
+        name, subscriptions = self._inbox_names.get(handler, ("", 0))
+        if not subscriptions:
+            name = inbox_.get_handler_name(handler)
+            count = self._inbox_name_counts.get(name, 0)
+            self._inbox_name_counts[name] = count + 1
+            # Never reused, events seen by a former registration stay its own.
+            if count:
+                name = f"{name}#{count}"
+
+        self._inbox_names[handler] = (name, subscriptions + 1)
+
+    def _remove_inbox_name(self, handler: typing.Any) -> None:
+        name, subscriptions = self._inbox_names.get(handler, ("", 0))
+        if subscriptions > 1:
+            self._inbox_names[handler] = (name, subscriptions - 1)
+        else:
+            self._inbox_names.pop(handler, None)
+
+    def _get_inbox_name(self, handler: typing.Any) -> str:
+        try:
+            return self._inbox_names[handler][0]
+        except KeyError:
+            return inbox_.get_handler_name(handler)
+
+    def _submit(
+        self,
+        callback: typing.Callable[..., typing.Awaitable[None]],
+        event: event_.Event,
+    ) -> asyncio.Future[typing.Any]:
+        if _current_worker.get() is self:
+            # Emitted by a handler running on a worker: queueing would block
+            # that worker on its own queue, and with every worker waiting so
+            # the pool deadlocks. Nested emits run inline instead.
+            return asyncio.ensure_future(self._trigger_handler(callback, event))
+
+        loop = util.get_loop()
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+
+        if not self._workers:
+            assert self._max_workers is not None
+            # Workers outlive the emit that started them, so they must not
+            # inherit its context (e.g. the transaction it was emitted in).
+            context = contextvars.Context()
+            self._workers = [
+                context.run(loop.create_task, self._worker())
+                for _ in range(self._max_workers)
+            ]
+
+        future = loop.create_future()
+        job_priority = getattr(callback, PRIORITY_STR, 0)
+        self._queue.put_nowait(
+            (job_priority, next(self._sequence), callback, event, future)
+        )
+        return future
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        _current_worker.set(self)
+
+        while True:
+            job = await queue.get()
+            _, _, callback, event, future = job
+
+            limited_type = self._get_limited_type(type(event))
+            if limited_type is not None:
+                if self._active[limited_type] >= self._concurrency_limits[limited_type]:
+                    # Parked until a job under the same limit finishes, so a
+                    # capped type never ties up more than `limit` workers.
+                    parked = self._deferred.setdefault(
+                        limited_type, collections.deque()
+                    )
+                    parked.append(job)
+                    continue
+
+                self._active[limited_type] += 1
+
+            try:
+                if not future.done():
+                    await self._run_job(callback, event, future)
+            except asyncio.CancelledError:
+                _fail_closed(future)
+                raise
+            except Exception as exc:
+                # Whatever escapes a job fails it, never the worker, or every
+                # later emit would wait forever.
+                if not future.done():
+                    future.set_exception(exc)
+            finally:
+                if limited_type is not None:
+                    self._active[limited_type] -= 1
+                    deferred = self._deferred.get(limited_type)
+                    if deferred:
+                        queue.put_nowait(deferred.popleft())
+
+    async def _run_job(
+        self,
+        callback: typing.Callable[..., typing.Awaitable[None]],
+        event: event_.Event,
+        future: asyncio.Future[typing.Any],
+    ) -> None:
+        try:
+            await self._invoke(callback, event)
+        except Exception as exc:
+            # The emit may have been cancelled while the handler ran.
+            if future.done():
+                return
+
+            if not self._dispatch_on_exc or isinstance(event, event_.ExceptionEvent):
+                future.set_exception(exc)
+                return
+
+            exc_event = event_.ExceptionEvent(
+                exception=exc,
+                failed_event=event,
+                failed_callback=typing.cast(handler_.AnyEventHandler, callback),
+            )
+            # Not awaited here: ExceptionEvent handlers need a worker too.
+            _chain_future(self.emit(exc_event), future)
+        else:
+            if not future.done():
+                future.set_result(None)
+
+    def _get_limited_type(
+        self, event_type: event_.EventType
+    ) -> typing.Optional[event_.EventType]:
+        try:
+            return self._limited_types[event_type]
+        except KeyError:
+            pass
+
+        limited_type = None
+        for base in event_type.__mro__:
+            if base in self._concurrency_limits:
+                limited_type = base
+                break
+
+        self._limited_types[event_type] = limited_type
+        return limited_type
+
+    def _buffer(
+        self,
+        handler: typing.Type[handler_.BatchEventHandler[typing.Any]],
+        event: event_.Event,
+    ) -> asyncio.Future[typing.Any]:
+        loop = util.get_loop()
+        batch = self._batches.get(handler)
+        if batch is None:
+            batch = self._batches[handler] = _PendingBatch()
+
+        future = loop.create_future()
+        batch.events.append(event)
+        batch.futures.append(future)
+
+        if len(batch.events) >= handler.max_batch_size:
+            self._flush_batch(handler)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(
+                handler.max_latency, self._flush_batch, handler
+            )
+
+        return future
+
+    def _flush_batch(
+        self, handler: typing.Type[handler_.BatchEventHandler[typing.Any]]
+    ) -> None:
+        batch = self._batches.pop(handler, None)
+        if batch is None:
+            return
+
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        # A batch mixes events of many emits, it belongs to none of them.
+        task = contextvars.Context().run(
+            util.get_loop().create_task, self._run_batch(handler, batch)
+        )
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        handler: typing.Type[handler_.BatchEventHandler[typing.Any]],
+        batch: _PendingBatch,
+    ) -> None:
+        events, futures = batch.events, batch.futures
+        handler_name = ""
+        try:
+            if self._inbox is not None:
+                handler_name = self._get_inbox_name(handler)
+                events, futures = await self._skip_handled(handler_name, batch)
+                if not events:
+                    return
+
+            instance, _ = self._activator.activate(handler)
+        except Exception as exc:
+            # Nothing was handled (e.g. a dependency is missing), every emit
+            # waiting on this batch fails with it rather than hang.
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+
+            return
+
+        failures: typing.Sequence[typing.Tuple[typing.Any, Exception]] = ()
+        try:
+            await instance.handle_batch(events)
+        except handler_.BatchHandleError as exc:
+            failures = exc.failures
+        except Exception as exc:
+            failures = [(event, exc) for event in events]
+
+        failed = {id(event): exc for event, exc in failures}
+        if self._inbox is not None:
+            handled = [
+                event_id
+                for event in events
+                if id(event) not in failed
+                and (event_id := inbox_.get_event_id(event)) is not None
+            ]
+            # Added together, so a durable inbox commits them at once.
+            await asyncio.gather(
+                *(self._inbox.add(event_id, handler_name) for event_id in handled)
+            )
+
+        for event, future in zip(events, futures):
+            if future.done():
+                continue
+
+            error = failed.get(id(event))
+            if error is None:
+                future.set_result(None)
+            elif not self._dispatch_on_exc or isinstance(event, event_.ExceptionEvent):
+                future.set_exception(error)
+            else:
+                exc_event = event_.ExceptionEvent(
+                    exception=error,
+                    failed_event=event,
+                    failed_callback=instance,
+                )
+                _chain_future(self.emit(exc_event), future)
+
+    async def _skip_handled(
+        self, handler_name: str, batch: _PendingBatch
+    ) -> typing.Tuple[
+        typing.List[event_.Event], typing.List[asyncio.Future[typing.Any]]
+    ]:
+        assert self._inbox is not None
+        events = []
+        futures = []
+        for event, future in zip(batch.events, batch.futures):
+            event_id = inbox_.get_event_id(event)
+            if event_id is not None and await self._inbox.contains(
+                event_id, handler_name
+            ):
+                if not future.done():
+                    future.set_result(None)
+            else:
+                events.append(event)
+                futures.append(future)
+
+        return events, futures
+
+
+_WaiterType = typing.Tuple[
+    typing.Optional[typing.Callable[[typing.Any], bool]],
+    "asyncio.Future[typing.Any]",
+]
+
+
+class _WaiterBucket:
+    __slots__: typing.Sequence[str] = (
+        "scanned",
+        "indexed",
+    )
+
+    def __init__(self) -> None:
+        # Waiters without a key, every emit runs their predicates.
+        self.scanned: typing.Set[_WaiterType] = set()
+        # attribute -> structural value -> waiters, matched by lookup.
+        self.indexed: typing.Dict[
+            str, typing.Dict[typing.Hashable, typing.Set[_WaiterType]]
+        ] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.scanned or self.indexed)
+
+    def add(
+        self,
+        waiter: _WaiterType,
+        index: typing.Optional[typing.Tuple[str, typing.Hashable]],
+    ) -> None:
+        if index is None:
+            self.scanned.add(waiter)
+            return
+
+        attribute, value = index
+        self.indexed.setdefault(attribute, {}).setdefault(value, set()).add(waiter)
+
+    def discard(
+        self,
+        waiter: _WaiterType,
+        index: typing.Optional[typing.Tuple[str, typing.Hashable]],
+    ) -> None:
+        if index is None:
+            self.scanned.discard(waiter)
+            return
+
+        attribute, value = index
+        values = self.indexed.get(attribute)
+        if values is None:
+            return
+
+        waiters = values.get(value)
+        if waiters is not None:
+            waiters.discard(waiter)
+            if not waiters:
+                del values[value]
+
+        if not values:
+            del self.indexed[attribute]
+
+    def notify(self, event: event_.Event) -> None:
+        if self.scanned:
+            _notify_waiters(self.scanned, event)
+
+        for attribute, values in tuple(self.indexed.items()):
+            value = getattr(event, attribute, sentinel.NOTHING)
+            if value is sentinel.NOTHING:
+                continue
+
+            value = util.structural_key(value)
+            waiters = values.get(value)
+            if waiters is None:
+                continue
+
+            _notify_waiters(waiters, event)
+            if not waiters:
+                del values[value]
+                if not values:
+                    del self.indexed[attribute]
+
+
+def _notify_waiters(waiters: typing.Set[_WaiterType], event: event_.Event) -> None:
+    for waiter in tuple(waiters):
+        predicate, future = waiter
+        if not future.done():
+            try:
+                if predicate is not None and not predicate(event):
+                    continue
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(event)
+
+        waiters.discard(waiter)
+
+
+class _PendingBatch:
+    __slots__: typing.Sequence[str] = (
+        "events",
+        "futures",
+        "timer",
+    )
+
+    def __init__(self) -> None:
+        self.events: typing.List[event_.Event] = []
+        self.futures: typing.List[asyncio.Future[typing.Any]] = []
+        self.timer: typing.Optional[asyncio.TimerHandle] = None
+
+
+def _chain_future(
+    source: asyncio.Future[typing.Any], target: asyncio.Future[typing.Any]
+) -> None:
+    def copy_result(completed: asyncio.Future[typing.Any]) -> None:
+        if target.done():
+            return
+        if completed.cancelled():
+            target.cancel()
+        elif (exc := completed.exception()) is not None:
+            target.set_exception(exc)
+        else:
+            target.set_result(None)
+
+    source.add_done_callback(copy_result)
+
+
+def _fail_closed(future: asyncio.Future[typing.Any]) -> None:
+    if not future.done():
+        future.set_exception(RuntimeError("Event emitter was closed."))
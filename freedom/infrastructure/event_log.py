@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SqliteEventLog",)
+
+import asyncio
+import contextlib
+import contextvars
+import sqlite3
+import typing
+
+from freedom import util
+from freedom.application import event_log
+from freedom.infrastructure import codec as codec_impl
+from freedom.infrastructure import sqlite
+
+if typing.TYPE_CHECKING:
+    from freedom.application import codec as codec_
+    from freedom.domain import event as event_
+
+_SCHEMA: typing.Final[typing.Sequence[str]] = (
+    "CREATE TABLE IF NOT EXISTS event_log ("
+    " position INTEGER PRIMARY KEY,"
+    " payload BLOB NOT NULL"
+    ")",
+)
+_INSERT: typing.Final[str] = "INSERT INTO event_log (position, payload) VALUES (?, ?)"
+_SELECT: typing.Final[str] = (
+    "SELECT position, payload FROM event_log"
+    " WHERE position > ? ORDER BY position LIMIT ?"
+)
+_SELECT_LAST: typing.Final[str] = "SELECT COALESCE(MAX(position), 0) FROM event_log"
+
+
+class SqliteEventLog(event_log.EventLog):
+    __slots__: typing.Sequence[str] = (
+        "_codec",
+        "_database",
+        "_failure",
+        "_flush_task",
+        "_last_position",
+        "_listeners",
+        "_max_pending",
+        "_pending",
+    )
+
+    def __init__(
+        self,
+        path: sqlite.PathType = ":memory:",
+        *,
+        codec: typing.Optional[codec_.Codec] = None,
+        max_pending: int = 100_000,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive.")
+
+        self._database = sqlite.SqliteDatabase(path, schema=_SCHEMA)
+        self._codec = codec or codec_impl.BinaryCodec()
+        # Positions are handed out on append, so they are known before the
+        # write of the batch holding them has been committed.
+        self._last_position = _read_last_position(path)
+        self._pending: typing.List[typing.Tuple[int, bytes]] = []
+        self._max_pending = max_pending
+        self._flush_task: typing.Optional[asyncio.Task[None]] = None
+        self._failure: typing.Optional[Exception] = None
+        self._listeners: typing.List[event_log.EventLogListenerType] = []
+
+    @property
+    def last_position(self) -> int:
+        return self._last_position
+
+    def append(self, event: event_.Event, /) -> int:
+        # Writes keep failing: appenders get the error rather than a buffer
+        # growing without bound.
+        if self._failure is not None and len(self._pending) >= self._max_pending:
+            raise RuntimeError(
+                f"Event log is failing, {len(self._pending)} events are not written."
+            ) from self._failure
+
+        self._last_position += 1
+        position = self._last_position
+        self._pending.append((position, self._codec.encode(event)))
+
+        if self._flush_task is None:
+            # Serves every append until the buffer runs dry, so it must not
+            # keep the context of the emit that happened to start it.
+            self._flush_task = contextvars.Context().run(
+                util.get_loop().create_task, self._flush()
+            )
+
+        for listener in tuple(self._listeners):
+            listener(position, event)
+
+        return position
+
+    async def read(
+        self, after: int = 0, limit: int = 1000
+    ) -> typing.Sequence[event_log.EventRecordType]:
+        # Everything appended so far is readable, committed or not.
+        await self.flush()
+        rows = await self._database.run(_select, after, limit)
+        decode = self._codec.decode
+        return [(position, decode(payload)) for position, payload in rows]
+
+    def subscribe(self, listener: event_log.EventLogListenerType, /) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: event_log.EventLogListenerType, /) -> None:
+        with contextlib.suppress(ValueError):
+            self._listeners.remove(listener)
+
+    async def flush(self) -> None:
+        if self._flush_task is None and self._pending:
+            self._flush_task = contextvars.Context().run(
+                util.get_loop().create_task, self._flush()
+            )
+
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+        if self._failure is not None:
+            failure, self._failure = self._failure, None
+            raise failure
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        finally:
+            await self._database.close()
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                rows, self._pending = self._pending, []
+                try:
+                    await self._database.write(_INSERT, rows)
+                except Exception as exc:
+                    # Kept for the next flush, positions were already given out.
+                    self._pending[:0] = rows
+                    self._failure = exc
+                    return
+        finally:
+            self._flush_task = None
+
+
+def _read_last_position(path: sqlite.PathType) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+        return typing.cast(int, connection.execute(_SELECT_LAST).fetchone()[0])
+    finally:
+        connection.close()
+
+
+def _select(
+    connection: sqlite3.Connection, after: int, limit: int
+) -> typing.List[typing.Tuple[int, bytes]]:
+    return connection.execute(_SELECT, (after, limit)).fetchall()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import enum
 import types
 import typing
 import weakref
@@ -11,6 +13,18 @@ from freedom.domain import event as event_
 
 if typing.TYPE_CHECKING:
     from freedom.application import event_emitter as emitter_
+    from freedom.application import event_log as event_log_
+
+
+class OverflowPolicy(enum.Enum):
+    # What a stream does with an event arriving while it holds `limit` events.
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    # The listener waits for room, so the emit that delivers it does too.
+    BLOCK = "block"
+
+
+WatermarkCallbackType = typing.Callable[["EventStream"], None]
 
 
 def _generate_weak_listener(
@@ -35,12 +49,21 @@ class EventStream:
         "_active",
         "_event",
         "_event_manager",
-        "_event_type",
+        "_event_types",
         "_filters",
         "_limit",
         "_queue",
         "_registered_listener",
         "_timeout",
+        "_overflow",
+        "_high_water_mark",
+        "_low_water_mark",
+        "_on_high_water",
+        "_on_low_water",
+        "_above_high_water",
+        "_producers",
+        "_dropped",
+        "_received",
     )
 
     __weakref__: typing.Optional[weakref.ref[EventStream]]
@@ -48,23 +71,66 @@ class EventStream:
     def __init__(
         self,
         emitter: emitter_.EventEmitter,
-        event_type: typing.Type[event_.Event],
+        event_type: typing.Union[
+            typing.Type[event_.Event], typing.Iterable[typing.Type[event_.Event]]
+        ],
         *,
         timeout: typing.Union[float, int, None],
         limit: typing.Optional[int] = None,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        high_water_mark: typing.Optional[int] = None,
+        low_water_mark: typing.Optional[int] = None,
+        on_high_water: typing.Optional[WatermarkCallbackType] = None,
+        on_low_water: typing.Optional[WatermarkCallbackType] = None,
     ) -> None:
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be positive.")
+
+        if overflow is OverflowPolicy.BLOCK and limit is None:
+            raise ValueError("Blocking overflow policy requires a limit.")
+
+        if low_water_mark is None and high_water_mark is not None:
+            low_water_mark = high_water_mark // 2
+
+        if (
+            high_water_mark is not None
+            and low_water_mark is not None
+            and low_water_mark >= high_water_mark
+        ):
+            raise ValueError("low_water_mark must be below high_water_mark.")
+
         self._active = False
         self._event: typing.Optional[asyncio.Event] = None
         self._event_manager = emitter
-        self._event_type = event_type
+        # A base class covers its subclasses, the emitter dispatches by MRO.
+        self._event_types: typing.Tuple[typing.Type[event_.Event], ...] = (
+            (event_type,) if isinstance(event_type, type) else tuple(event_type)
+        )
+        if not self._event_types:
+            raise ValueError("Stream needs at least one event type.")
+
+        # Applied on arrival, a rejected event is never queued nor counted.
+        self._filters: typing.List[typing.Callable[[event_.Event], bool]] = []
         self._limit = limit
-        self._queue: typing.List[event_.Event] = []
+        self._queue: typing.Deque[event_.Event] = collections.deque()
         self._registered_listener: typing.Optional[
             typing.Callable[
                 [event_.Event], typing.Coroutine[typing.Any, typing.Any, None]
             ]
         ] = None
         self._timeout = timeout
+        self._overflow = overflow
+        # Edge triggered: on_high_water fires once the queue reaches the high
+        # mark, and again only after it drained back to the low mark.
+        self._high_water_mark = high_water_mark
+        self._low_water_mark = low_water_mark
+        self._on_high_water = on_high_water
+        self._on_low_water = on_low_water
+        self._above_high_water = False
+        # Listeners blocked on a full stream, woken in arrival order.
+        self._producers: typing.Deque[asyncio.Future[None]] = collections.deque()
+        self._dropped = 0
+        self._received = 0
 
     def __enter__(self) -> typingext.Self:
         self.open()
@@ -85,18 +151,36 @@ class EventStream:
         if not self._active:
             raise TypeError("stream must be started with before entering it")
 
-        while not self._queue:
-            if not self._event:
-                self._event = asyncio.Event()
+        if not await self._wait_for_events(self._timeout):
+            raise StopAsyncIteration
 
-            try:
-                await asyncio.wait_for(self._event.wait(), timeout=self._timeout)
-            except asyncio.TimeoutError:
-                raise StopAsyncIteration from None
+        event = self._queue.popleft()
+        self._on_consumed()
+        return event
 
-            self._event.clear()
+    async def batches(
+        self, max_size: int = 100, max_latency: float = 0.05
+    ) -> typing.AsyncIterator[typing.List[event_.Event]]:
+        # Waits up to the stream timeout for a first event, then at most
+        # `max_latency` for the batch to fill up before yielding it anyway.
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+
+        if not self._active:
+            raise TypeError("stream must be started with before entering it")
 
-        return self._queue.pop(0)
+        loop = asyncio.get_running_loop()
+        while await self._wait_for_events(self._timeout):
+            deadline = loop.time() + max_latency
+            batch = self._take(max_size)
+            while len(batch) < max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0 or not await self._wait_for_events(remaining):
+                    break
+
+                batch.extend(self._take(max_size - len(batch)))
+
+            yield batch
 
     def __await__(self) -> typing.Generator[None, None, typing.Sequence[event_.Event]]:
         async def _await_all() -> typing.Sequence[event_.Event]:
@@ -114,36 +198,151 @@ class EventStream:
         if self._active:
             # _LOGGER.warning(
             # "active %r streamer fell out of scope before being closed",
-            # self._event_type.__name__)
+            # self._event_types)
             self.close()
 
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    @property
+    def blocked(self) -> int:
+        return len(self._producers)
+
     async def _listener(self, event: event_.Event) -> None:
-        if self._limit is not None and len(self._queue) >= self._limit:
-            return
+        for condition in self._filters:
+            if not condition(event):
+                return
+
+        self._received += 1
+        limit = self._limit
+        if limit is not None and len(self._queue) >= limit:
+            if self._overflow is OverflowPolicy.DROP_NEWEST:
+                self._dropped += 1
+                return
+
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self._dropped += 1
+            else:
+                while len(self._queue) >= limit:
+                    if not self._active:
+                        self._dropped += 1
+                        return
+
+                    await self._wait_for_room()
 
         self._queue.append(event)
-        if self._event:
+        # Only the first arrival into an empty queue wakes the consumer, it
+        # then drains whatever else arrived before it ran.
+        if self._event and len(self._queue) == 1:
             self._event.set()
 
-    def close(self) -> None:
-        if self._active and self._registered_listener is not None:
+        if (
+            self._high_water_mark is not None
+            and not self._above_high_water
+            and len(self._queue) >= self._high_water_mark
+        ):
+            self._above_high_water = True
+            if self._on_high_water is not None:
+                self._on_high_water(self)
+
+    async def _wait_for_room(self) -> None:
+        producer = asyncio.get_running_loop().create_future()
+        self._producers.append(producer)
+        try:
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+
             try:
-                self._event_manager.unsubscribe(
-                    self._registered_listener, self._event_type
-                )
-            except ValueError as exc:
-                # FIXME
+                self._producers.remove(producer)
+            except ValueError:
                 pass
 
+    async def _wait_for_events(self, timeout: typing.Union[float, int, None]) -> bool:
+        while not self._queue:
+            if not self._event:
+                self._event = asyncio.Event()
+
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+
+            self._event.clear()
+
+        return True
+
+    def _take(self, count: int) -> typing.List[event_.Event]:
+        queue = self._queue
+        batch = [queue.popleft() for _ in range(min(count, len(queue)))]
+        self._on_consumed(len(batch))
+        return batch
+
+    def _on_consumed(self, count: int = 1) -> None:
+        # Every freed slot lets one blocked listener in.
+        while count and self._producers:
+            producer = self._producers.popleft()
+            if not producer.done():
+                producer.set_result(None)
+                count -= 1
+
+        self._check_low_water()
+
+    def _check_low_water(self) -> None:
+        if (
+            self._above_high_water
+            and self._low_water_mark is not None
+            and len(self._queue) <= self._low_water_mark
+        ):
+            self._above_high_water = False
+            if self._on_low_water is not None:
+                self._on_low_water(self)
+
+    def _release_producers(self) -> None:
+        producers, self._producers = self._producers, collections.deque()
+        for producer in producers:
+            if not producer.done():
+                producer.set_result(None)
+
+    def close(self) -> None:
+        if self._active and self._registered_listener is not None:
+            for event_type in self._event_types:
+                try:
+                    self._event_manager.unsubscribe(
+                        self._registered_listener, event_type
+                    )
+                except ValueError as exc:
+                    # FIXME
+                    pass
+
             self._registered_listener = None
 
         self._active = False
+        # Nothing consumes a closed stream, blocked emits must not hang.
+        self._release_producers()
 
     def filter(
         self, condition: typing.Callable[[event_.Event], bool]
     ) -> typingext.Self:
-        if self._active:
-            self._queue = [entry for entry in self._queue if condition(entry)]
+        self._filters.append(condition)
+        if self._queue:
+            self._queue = collections.deque(
+                entry for entry in self._queue if condition(entry)
+            )
+            # Filtering may free many slots, blocked listeners check again.
+            self._release_producers()
+            self._check_low_water()
 
         return self
 
@@ -153,5 +352,173 @@ class EventStream:
             listener = _generate_weak_listener(reference)
 
             self._registered_listener = listener
-            self._event_manager.subscribe(listener, self._event_type)
+            for event_type in self._event_types:
+                self._event_manager.subscribe(listener, event_type)
+            self._active = True
+
+
+class CatchUpStream:
+    # Replays an event log from a checkpoint in large sequential reads, then
+    # keeps going with events as they are appended. Live events are buffered
+    # from open() on, and positions already yielded are skipped, so the
+    # switch neither loses nor repeats an event.
+    __slots__: typing.Sequence[str] = (
+        "_active",
+        "_backlog",
+        "_batch_size",
+        "_dropped",
+        "_event",
+        "_event_log",
+        "_event_types",
+        "_limit",
+        "_live",
+        "_overflow",
+        "_overflowed",
+        "_position",
+        "_replaying",
+        "_timeout",
+    )
+
+    def __init__(
+        self,
+        event_log: event_log_.EventLog,
+        event_type: typing.Union[
+            typing.Type[event_.Event], typing.Iterable[typing.Type[event_.Event]]
+        ] = event_.Event,
+        *,
+        after: int = 0,
+        timeout: typing.Union[float, int, None],
+        batch_size: int = 1000,
+        limit: typing.Optional[int] = 10_000,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be positive.")
+
+        self._event_log = event_log
+        self._event_types: typing.Tuple[typing.Type[event_.Event], ...] = (
+            (event_type,) if isinstance(event_type, type) else tuple(event_type)
+        )
+        self._position = after
+        self._timeout = timeout
+        self._batch_size = batch_size
+        self._active = False
+        self._replaying = True
+        self._event: typing.Optional[asyncio.Event] = None
+        self._backlog: typing.Deque[event_log_.EventRecordType] = collections.deque()
+        self._live: typing.Deque[event_log_.EventRecordType] = collections.deque()
+        # Bounds the live buffer of a consumer falling behind. Appends cannot
+        # wait for it, so BLOCK drops the buffer instead and the stream reads
+        # those events back from the log, nothing is lost.
+        self._limit = limit
+        self._overflow = overflow
+        self._overflowed = False
+        self._dropped = 0
+
+    @property
+    def position(self) -> int:
+        # Checkpoint to resume from: the last position handed out.
+        return self._position
+
+    @property
+    def replaying(self) -> bool:
+        return self._replaying
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def __enter__(self) -> typingext.Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: typing.Optional[typing.Type[BaseException]],
+        exc_val: typing.Optional[BaseException],
+        exc_tb: typing.Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+    def __aiter__(self) -> typing.AsyncIterator[event_.Event]:
+        return self
+
+    async def __anext__(self) -> event_.Event:
+        if not self._active:
+            raise TypeError("stream must be started with before entering it")
+
+        while True:
+            while self._backlog:
+                position, event = self._backlog.popleft()
+                if position <= self._position:
+                    continue
+
+                self._position = position
+                if isinstance(event, self._event_types):
+                    return event
+
+            if self._replaying:
+                self._overflowed = False
+                records = await self._event_log.read(self._position, self._batch_size)
+                # Live events dropped during the read may be newer than it.
+                if len(records) < self._batch_size and not self._overflowed:
+                    self._replaying = False
+
+                self._backlog.extend(records)
+                continue
+
+            if not await self._wait_for_live():
+                raise StopAsyncIteration
+
+            if not self._replaying:
+                self._backlog, self._live = self._live, self._backlog
+
+    def open(self) -> None:
+        if not self._active:
+            self._event_log.subscribe(self._listener)
             self._active = True
+
+    def close(self) -> None:
+        if self._active:
+            self._event_log.unsubscribe(self._listener)
+            self._active = False
+
+    def _listener(self, position: int, event: event_.Event) -> None:
+        limit = self._limit
+        if limit is not None and len(self._live) >= limit:
+            if self._overflow is OverflowPolicy.DROP_NEWEST:
+                self._dropped += 1
+                return
+
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._live.popleft()
+                self._dropped += 1
+            else:
+                self._live.clear()
+                self._replaying = True
+                self._overflowed = True
+                if self._event:
+                    self._event.set()
+
+                return
+
+        self._live.append((position, event))
+        if self._event and len(self._live) == 1:
+            self._event.set()
+
+    async def _wait_for_live(self) -> bool:
+        while not self._live and not self._replaying:
+            if not self._event:
+                self._event = asyncio.Event()
+
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=self._timeout)
+            except asyncio.TimeoutError:
+                return False
+
+            self._event.clear()
+
+        return True
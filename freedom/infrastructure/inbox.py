@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "InMemoryInbox",
+    "SqliteInbox",
+)
+
+import asyncio
+import contextvars
+import hashlib
+import sqlite3
+import typing
+
+from freedom import util
+from freedom.application import inbox as inbox_
+from freedom.infrastructure import sqlite
+
+_SCHEMA: typing.Final[typing.Sequence[str]] = (
+    "CREATE TABLE IF NOT EXISTS inbox ("
+    " event_id TEXT NOT NULL,"
+    " handler TEXT NOT NULL,"
+    " PRIMARY KEY (event_id, handler)"
+    ") WITHOUT ROWID",
+)
+_INSERT: typing.Final[str] = (
+    "INSERT OR IGNORE INTO inbox (event_id, handler) VALUES (?, ?)"
+)
+_SELECT: typing.Final[str] = "SELECT 1 FROM inbox WHERE event_id = ? AND handler = ?"
+_SELECT_ALL: typing.Final[str] = "SELECT event_id, handler FROM inbox"
+
+
+class _RotatingSet:
+    # Two generations of at most `max_size // 2` keys each. Once the current
+    # one is full it replaces the previous one, so memory stays bounded and
+    # the oldest keys are forgotten first, without per-key bookkeeping.
+    __slots__: typing.Sequence[str] = (
+        "_current",
+        "_generation_size",
+        "_previous",
+    )
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 2:
+            raise ValueError("max_size must be at least 2.")
+
+        self._generation_size = max_size // 2
+        self._current: typing.Set[typing.Hashable] = set()
+        self._previous: typing.Set[typing.Hashable] = set()
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._current or key in self._previous
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def add(self, key: typing.Hashable) -> None:
+        if key in self._current:
+            return
+
+        if len(self._current) >= self._generation_size:
+            self._previous = self._current
+            self._current = set()
+
+        self._current.add(key)
+
+    def clear(self) -> None:
+        self._current.clear()
+        self._previous.clear()
+
+
+class _BloomFilter:
+    __slots__: typing.Sequence[str] = (
+        "_bits",
+        "_hashes",
+        "_size",
+    )
+
+    def __init__(self, size: int, hashes: int) -> None:
+        if size < 8 or hashes < 1:
+            raise ValueError("Bloom filter needs at least 8 bits and one hash.")
+
+        self._size = size
+        self._hashes = hashes
+        self._bits = bytearray((size + 7) // 8)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+
+        return True
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, key: str) -> typing.Iterator[int]:
+        # Double hashing: k positions out of a single 128 bit digest.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._size
+
+
+class InMemoryInbox(inbox_.Inbox):
+    __slots__: typing.Sequence[str] = ("_seen",)
+
+    def __init__(self, *, max_size: int = 100_000) -> None:
+        self._seen = _RotatingSet(max_size)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    async def contains(self, event_id: typing.Hashable, handler: str, /) -> bool:
+        return (inbox_.get_event_key(event_id), handler) in self._seen
+
+    async def add(self, event_id: typing.Hashable, handler: str, /) -> None:
+        self._seen.add((inbox_.get_event_key(event_id), handler))
+
+    async def close(self) -> None:
+        self._seen.clear()
+
+
+class SqliteInbox(inbox_.Inbox):
+    __slots__: typing.Sequence[str] = (
+        "_bloom",
+        "_database",
+        "_loading",
+        "_recent",
+    )
+
+    def __init__(
+        self,
+        path: sqlite.PathType = ":memory:",
+        *,
+        max_size: int = 100_000,
+        bloom_size: int = 1 << 23,
+        bloom_hashes: int = 7,
+    ) -> None:
+        self._database = sqlite.SqliteDatabase(path, schema=_SCHEMA)
+        # Recently handled keys answer duplicates (the common case for a
+        # redelivery) without leaving the event loop.
+        self._recent = _RotatingSet(max_size)
+        # Covers every stored key, so a new event, which is most of them,
+        # never waits for a lookup. False positives fall back to the table.
+        self._bloom = _BloomFilter(bloom_size, bloom_hashes)
+        self._loading: typing.Optional[asyncio.Task[None]] = None
+
+    async def contains(self, event_id: typing.Hashable, handler: str, /) -> bool:
+        key = (inbox_.get_event_key(event_id), handler)
+        if key in self._recent:
+            return True
+
+        await self._load()
+        if _get_bloom_key(key) not in self._bloom:
+            return False
+
+        found = await self._database.run(_select, key)
+        if found:
+            self._recent.add(key)
+
+        return found
+
+    async def add(self, event_id: typing.Hashable, handler: str, /) -> None:
+        key = (inbox_.get_event_key(event_id), handler)
+        await self._load()
+        self._recent.add(key)
+        self._bloom.add(_get_bloom_key(key))
+        await self._database.write(_INSERT, (key,))
+
+    async def close(self) -> None:
+        if self._loading is not None:
+            await asyncio.wait((self._loading,))
+
+        await self._database.close()
+        self._recent.clear()
+
+    async def _load(self) -> None:
+        if self._loading is None:
+            self._loading = contextvars.Context().run(
+                util.get_loop().create_task,
+                self._database.run(_load_keys, self._bloom),
+            )
+
+        # Shielded: one cancelled caller must not abort loading for the rest.
+        await asyncio.shield(self._loading)
+
+
+def _get_bloom_key(key: typing.Tuple[str, str]) -> str:
+    return "\0".join(key)
+
+
+def _select(connection: sqlite3.Connection, key: typing.Tuple[str, str]) -> bool:
+    return connection.execute(_SELECT, key).fetchone() is not None
+
+
+def _load_keys(connection: sqlite3.Connection, bloom: _BloomFilter) -> None:
+    for key in connection.execute(_SELECT_ALL):
+        bloom.add(_get_bloom_key(key))
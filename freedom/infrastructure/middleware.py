@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 __all__: typing.Sequence[str] = (
+    "AdmissionControlMiddleware",
+    "AdmissionPolicy",
+    "AdmissionRejectedError",
+    "IDEMPOTENCY_KEY_STR",
+    "IdempotencyMiddleware",
     "LoggerMiddleware",
     "MiddlewareChain",
 )
 
+import asyncio
+import collections
+import contextlib
+import enum
 import logging
+import time
 import typing
 
 from freedom import util
 from freedom.application import middleware as middleware_
+from freedom.domain import command_handler as handler_
+
+IDEMPOTENCY_KEY_STR: typing.Final[str] = "idempotency_key"
 
 
 class LoggerMiddleware(middleware_.Middleware):
@@ -62,32 +75,339 @@ class LoggerMiddleware(middleware_.Middleware):
         return result
 
 
+class AdmissionPolicy(enum.Enum):
+    REJECT = "reject"
+    WAIT = "wait"
+
+
+class AdmissionRejectedError(Exception):
+    pass
+
+
+class AdmissionControlMiddleware(middleware_.Middleware):
+    __slots__: typing.Sequence[str] = (
+        "_max_in_flight",
+        "_max_queue",
+        "_policy",
+        "_timeout",
+        "_in_flight",
+        "_waiters",
+        "_admitted",
+        "_rejected",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int,
+        max_queue: int = 1024,
+        policy: AdmissionPolicy = AdmissionPolicy.WAIT,
+        timeout: typing.Union[float, int, None] = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive.")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative.")
+
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._policy = policy
+        self._timeout = timeout
+        self._in_flight = 0
+        self._waiters: typing.Deque[asyncio.Future[None]] = collections.deque()
+        self._admitted = 0
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def admitted(self) -> int:
+        return self._admitted
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    async def __call__(
+        self,
+        message: typing.Any,
+        next_middleware: middleware_.PartialMiddlewareSigType,
+    ) -> typing.Any:
+        if self._in_flight < self._max_in_flight and not self._waiters:
+            self._in_flight += 1
+        else:
+            await self._wait_for_slot(message)
+
+        self._admitted += 1
+        try:
+            return await next_middleware(message)
+        finally:
+            self._release()
+
+    async def _wait_for_slot(self, message: typing.Any) -> None:
+        # The queue is bounded too, or a burst would only move the backlog
+        # from the handlers into memory here.
+        if (
+            self._policy is AdmissionPolicy.REJECT
+            or len(self._waiters) >= self._max_queue
+        ):
+            self._rejected += 1
+            raise AdmissionRejectedError(
+                f"Message {type(message)!r} rejected: service is saturated."
+            )
+
+        waiter = util.get_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self._timeout)
+        except asyncio.TimeoutError:
+            self._give_back(waiter)
+            self._rejected += 1
+            raise AdmissionRejectedError(
+                f"Message {type(message)!r} rejected: timed out waiting for a slot."
+            ) from None
+        except asyncio.CancelledError:
+            self._give_back(waiter)
+            raise
+        finally:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(waiter)
+
+    def _give_back(self, waiter: asyncio.Future[None]) -> None:
+        # The slot may have been handed to us before the timeout or the
+        # cancellation landed (wait_for races so on 3.12+), pass it on.
+        if waiter.done() and not waiter.cancelled():
+            self._release()
+
+    def _release(self) -> None:
+        # Slots are handed directly to the oldest waiter, so a new arrival
+        # can never overtake the queue.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+
+def get_idempotency_key(message: typing.Any) -> typing.Hashable:
+    key = getattr(message, IDEMPOTENCY_KEY_STR, None)
+    if key is not None:
+        return type(message), key
+
+    return util.structural_key(message)
+
+
+class IdempotencyMiddleware(middleware_.Middleware):
+    __slots__: typing.Sequence[str] = (
+        "_ttl",
+        "_max_size",
+        "_key",
+        "_clock",
+        "_results",
+        "_in_flight",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        max_size: int = 10_000,
+        key: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+
+        self._ttl = ttl
+        self._max_size = max_size
+        self._key = key or get_idempotency_key
+        self._clock = clock
+        # Key -> (expires at, result), least recently used first.
+        self._results: typing.OrderedDict[
+            typing.Hashable, typing.Tuple[float, typing.Any]
+        ] = collections.OrderedDict()
+        self._in_flight: typing.Dict[typing.Hashable, asyncio.Future[typing.Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def __call__(
+        self,
+        message: typing.Any,
+        next_middleware: middleware_.PartialMiddlewareSigType,
+    ) -> typing.Any:
+        key = self._key(message)
+        now = self._clock()
+
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > now:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return self._replay(result)
+
+            del self._results[key]
+
+        in_flight = self._in_flight.get(key)
+        while in_flight is not None:
+            # Waiting does not cancel in_flight when this caller is cancelled.
+            await asyncio.wait((in_flight,))
+            if not in_flight.cancelled():
+                self._hits += 1
+                return self._replay(in_flight.result())
+
+            # The first caller was cancelled, the earliest duplicate runs the
+            # command in its place and the others wait for that one instead.
+            in_flight = self._in_flight.get(key)
+
+        self._misses += 1
+        future = util.get_loop().create_future()
+        # Nobody may be waiting, do not let asyncio report it as unretrieved.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[key] = future
+        try:
+            result = await next_middleware(message)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            del self._in_flight[key]
+
+        future.set_result(result)
+        if not (isinstance(result, handler_.CommandResult) and result.has_errors()):
+            self._store(key, result, now + self._ttl)
+
+        return result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _store(
+        self, key: typing.Hashable, result: typing.Any, expires_at: float
+    ) -> None:
+        self._results[key] = (expires_at, result)
+        self._results.move_to_end(key)
+
+        now = self._clock()
+        while self._results:
+            oldest_expires_at, _ = next(iter(self._results.values()))
+            if len(self._results) <= self._max_size and oldest_expires_at > now:
+                break
+
+            self._results.popitem(last=False)
+
+    @staticmethod
+    def _replay(result: typing.Any) -> typing.Any:
+        # Duplicates must not dispatch the original domain events again.
+        if isinstance(result, handler_.CommandResult):
+            return handler_.CommandResult(
+                entity_id=result.entity_id,
+                errors=list(result.errors),
+            )
+
+        return result
+
+
 class MiddlewareChain(middleware_.MiddlewareChain):
+    __slots__: typing.Sequence[str] = (
+        "_middlewares",
+        "_executor_middleware",
+        "_chain",
+    )
+
     def __init__(
         self,
         executor_middleware: middleware_.MiddlewareSigType,
         middlewares: typing.Optional[typing.List[middleware_.MiddlewareSigType]] = None,
     ) -> None:
-        self.middlewares = middlewares or []
-        self.executor_middleware = executor_middleware
+        self._middlewares = tuple(middlewares or ())
+        self._executor_middleware = executor_middleware
+        self._chain = self.compile()
 
-    async def __call__(self, message: typing.Any) -> typing.Any:
-        all_middlewares = (self.middlewares or []) + [self.executor_middleware]
+    @property
+    def chain(self) -> middleware_.PartialMiddlewareSigType:
+        return self._chain
+
+    @property
+    def middlewares(self) -> typing.Sequence[middleware_.MiddlewareSigType]:
+        return self._middlewares
+
+    @middlewares.setter
+    def middlewares(
+        self, middlewares: typing.Iterable[middleware_.MiddlewareSigType]
+    ) -> None:
+        self._middlewares = tuple(middlewares)
+        self._chain = self.compile()
 
+    @property
+    def executor_middleware(self) -> middleware_.MiddlewareSigType:
+        return self._executor_middleware
+
+    @executor_middleware.setter
+    def executor_middleware(
+        self, executor_middleware: middleware_.MiddlewareSigType
+    ) -> None:
+        self._executor_middleware = executor_middleware
+        self._chain = self.compile()
+
+    def add_middleware(self, middleware: middleware_.MiddlewareSigType) -> None:
+        self.middlewares = (*self._middlewares, middleware)
+
+    def remove_middleware(self, middleware: middleware_.MiddlewareSigType) -> None:
+        # Like list.remove: the first equal middleware only.
+        middlewares = list(self._middlewares)
+        try:
+            middlewares.remove(middleware)
+        except ValueError:
+            raise ValueError(f"Middleware {middleware!r} is not in chain") from None
+
+        self.middlewares = middlewares
+
+    def compile(self) -> middleware_.PartialMiddlewareSigType:
         chain = typing.cast(middleware_.MiddlewareSigType, util.empty_coro)
-        for middleware in reversed(all_middlewares):
-            chain = self.set_next(middleware, chain)
+        for middleware in reversed((*self._middlewares, self._executor_middleware)):
+            chain = typing.cast(
+                middleware_.MiddlewareSigType,
+                self.set_next(middleware, chain),
+            )
 
-        result = await chain(message)
-        return result
+        return typing.cast(middleware_.PartialMiddlewareSigType, chain)
+
+    async def __call__(self, message: typing.Any) -> typing.Any:
+        return await self._chain(message)
 
     def set_next(
         self,
         middleware: middleware_.MiddlewareSigType,
         next_middleware: middleware_.MiddlewareSigType,
     ) -> middleware_.PartialMiddlewareSigType:
-        async def wrap(message: typing.Any) -> typing.Any:
-            result = await middleware(message, next_middleware)
-            return result
+        # Plain function returning middleware's awaitable, so every link of a
+        # compiled chain costs one call instead of an extra coroutine frame.
+        def wrap(message: typing.Any) -> typing.Awaitable[typing.Any]:
+            return middleware(message, next_middleware)
 
         return wrap
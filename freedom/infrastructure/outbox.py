@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "OutboxRelay",
+    "SqliteOutbox",
+)
+
+import asyncio
+import contextvars
+import logging
+import sqlite3
+import typing
+
+from freedom import util
+from freedom.application import outbox as outbox_
+from freedom.infrastructure import codec as codec_impl
+from freedom.infrastructure import sqlite
+
+if typing.TYPE_CHECKING:
+    from freedom.application import codec as codec_
+    from freedom.application import event_emitter as emitter_
+    from freedom.domain import event as event_
+
+_SCHEMA: typing.Final[typing.Sequence[str]] = (
+    "CREATE TABLE IF NOT EXISTS outbox ("
+    " position INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " payload BLOB NOT NULL"
+    ")",
+    "CREATE TABLE IF NOT EXISTS outbox_checkpoint ("
+    " id INTEGER PRIMARY KEY CHECK (id = 0),"
+    " position INTEGER NOT NULL"
+    ")",
+)
+_INSERT: typing.Final[str] = "INSERT INTO outbox (payload) VALUES (?)"
+_SELECT: typing.Final[str] = (
+    "SELECT position, payload FROM outbox WHERE position > ("
+    " SELECT COALESCE(MAX(position), 0) FROM outbox_checkpoint"
+    ") ORDER BY position LIMIT ?"
+)
+_CHECKPOINT: typing.Final[str] = (
+    "INSERT OR REPLACE INTO outbox_checkpoint (id, position) VALUES (0, ?)"
+)
+_PRUNE: typing.Final[str] = "DELETE FROM outbox WHERE position <= ?"
+
+
+class SqliteOutbox(outbox_.Outbox):
+    __slots__: typing.Sequence[str] = (
+        "_appended",
+        "_codec",
+        "_database",
+    )
+
+    def __init__(
+        self,
+        path: sqlite.PathType = ":memory:",
+        *,
+        codec: typing.Optional[codec_.Codec] = None,
+    ) -> None:
+        self._database = sqlite.SqliteDatabase(path, schema=_SCHEMA)
+        self._codec = codec or codec_impl.BinaryCodec()
+        self._appended: typing.Optional[asyncio.Event] = None
+
+    async def append(self, events: typing.Sequence[event_.Event], /) -> None:
+        encode = self._codec.encode
+        # Concurrent commands end up in one transaction, see SqliteDatabase.
+        await self._database.write(_INSERT, [(encode(event),) for event in events])
+        if events:
+            self._get_appended().set()
+
+    async def fetch(self, limit: int, /) -> typing.Sequence[outbox_.OutboxRecordType]:
+        rows = await self._database.run(_select, limit)
+        decode = self._codec.decode
+        return [(position, decode(payload)) for position, payload in rows]
+
+    async def acknowledge(self, position: int, /) -> None:
+        await self._database.run(_checkpoint, position)
+
+    async def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        appended = self._get_appended()
+        try:
+            await asyncio.wait_for(appended.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        appended.clear()
+        return True
+
+    async def close(self) -> None:
+        await self._database.close()
+
+    def _get_appended(self) -> asyncio.Event:
+        if self._appended is None:
+            self._appended = asyncio.Event()
+
+        return self._appended
+
+
+def _select(
+    connection: sqlite3.Connection, limit: int
+) -> typing.List[typing.Tuple[int, bytes]]:
+    return connection.execute(_SELECT, (limit,)).fetchall()
+
+
+def _checkpoint(connection: sqlite3.Connection, position: int) -> None:
+    with connection:
+        connection.execute(_CHECKPOINT, (position,))
+        connection.execute(_PRUNE, (position,))
+
+
+class OutboxRelay:
+    __slots__: typing.Sequence[str] = (
+        "_batch_size",
+        "_emitter",
+        "_logger",
+        "_outbox",
+        "_poll_interval",
+        "_relayed",
+        "_retry_interval",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        outbox: outbox_.Outbox,
+        emitter: emitter_.EventEmitter,
+        *,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        retry_interval: float = 1.0,
+        logger: typing.Optional[logging.Logger] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+
+        self._outbox = outbox
+        self._emitter = emitter
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._retry_interval = retry_interval
+        self._logger = logger
+        self._relayed = 0
+        self._task: typing.Optional[asyncio.Task[None]] = None
+
+    @property
+    def relayed(self) -> int:
+        return self._relayed
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+
+        self._task = contextvars.Context().run(util.get_loop().create_task, self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.wait((task,))
+
+    async def relay_once(self) -> int:
+        records = await self._outbox.fetch(self._batch_size)
+        if not records:
+            return 0
+
+        # At-least-once: only what was emitted is acknowledged, the rest of
+        # the batch is fetched again by the next attempt.
+        relayed: typing.Optional[int] = None
+        try:
+            for position, event in records:
+                await self._emitter.emit(event)
+                relayed = position
+                self._relayed += 1
+        finally:
+            if relayed is not None:
+                await self._outbox.acknowledge(relayed)
+
+        return len(records)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception:
+                if self._logger is not None:
+                    self._logger.exception("Failed to relay outbox events.")
+
+                await asyncio.sleep(self._retry_interval)
+                continue
+
+            if relayed < self._batch_size:
+                await self._outbox.wait(self._poll_interval)
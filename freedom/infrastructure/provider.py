@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import collections
 import inspect
+import types
 import typing
 
 from freedom import sentinel
+from freedom.application import lifetime
 from freedom.application import provider
 
 
 class InMemoryDependencyProvider(
     provider.DependencyProvider[typing.Type[typing.Any], typing.Any]
 ):
-    __slots__: typing.Sequence[str] = ("_dependencies",)
+    __slots__: typing.Sequence[str] = (
+        "_dependencies",
+        "_factories",
+        "_plans",
+        "_resolved",
+        "_dependents",
+    )
 
     def __init__(
         self,
@@ -19,6 +28,21 @@ class InMemoryDependencyProvider(
         ] = None,
     ) -> None:
         self._dependencies: typing.Dict[typing.Type[typing.Any], typing.Any] = {}
+        self._factories: typing.Dict[
+            typing.Type[typing.Any], typing.Callable[[], typing.Any]
+        ] = {}
+        # Per handler class: param name -> dependency identifier, and the
+        # resolved kwargs built from it. Resolved kwargs are dropped whenever
+        # one of the identifiers they use is registered again.
+        self._plans: typing.Dict[
+            typing.Type[typing.Any], typing.Mapping[str, typing.Any]
+        ] = {}
+        self._resolved: typing.Dict[
+            typing.Type[typing.Any], typing.Mapping[str, typing.Any]
+        ] = {}
+        self._dependents: typing.DefaultDict[
+            typing.Type[typing.Any], typing.Set[typing.Type[typing.Any]]
+        ] = collections.defaultdict(set)
 
         if overrides is not None:
             for k, v in overrides.items():
@@ -31,10 +55,98 @@ class InMemoryDependencyProvider(
     ) -> None:
         if not inspect.isclass(identifier):
             raise ValueError("Dependency identifier must be a type.")
+        self._factories.pop(identifier, None)
         self._dependencies[identifier] = dependency
+        self._invalidate(identifier)
+
+    def register_scoped_dependency(
+        self,
+        identifier: typing.Type[typing.Any],
+        factory: typing.Callable[[], typing.Any],
+    ) -> None:
+        if not inspect.isclass(identifier):
+            raise ValueError("Dependency identifier must be a type.")
+        self._dependencies.pop(identifier, None)
+        self._factories[identifier] = factory
+        self._invalidate(identifier)
 
     def get_dependency(self, identifier: typing.Type[typing.Any]) -> typing.Any:
+        factory = self._factories.get(identifier)
+        if factory is not None:
+            return self._get_scoped_dependency(identifier, factory)
+
         dependency = self._dependencies.get(identifier, sentinel.NOTHING)
         if dependency is sentinel.NOTHING:
             raise ValueError(f"No dependency found with identifier {identifier!r}.")
         return dependency
+
+    def compile_handler(
+        self,
+        handler: typing.Type[typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        plan = self._plans.get(handler)
+        if plan is None:
+            plan = types.MappingProxyType(self.get_injection_plan(handler.__init__))
+            for identifier in plan.values():
+                self._dependents[identifier].add(handler)
+
+            self._plans[handler] = plan
+
+        return plan
+
+    def get_handler_dependencies(
+        self,
+        handler: typing.Type[typing.Any],
+    ) -> typing.Mapping[str, typing.Any]:
+        try:
+            return self._resolved[handler]
+        except KeyError:
+            pass
+
+        plan = self.compile_handler(handler)
+        if any(identifier in self._factories for identifier in plan.values()):
+            # Kwargs holding scoped dependencies are cached per scope instead.
+            scope = lifetime.current_scope()
+            if scope is not None:
+                key = (self, handler)
+                resolved = typing.cast(
+                    typing.Optional[typing.Mapping[str, typing.Any]], scope.get(key)
+                )
+                if resolved is None:
+                    resolved = self._resolve_plan(plan)
+                    scope.set(key, resolved)
+
+                return resolved
+
+            return self._resolve_plan(plan)
+
+        resolved = self._resolved[handler] = self._resolve_plan(plan)
+        return resolved
+
+    def _resolve_plan(
+        self, plan: typing.Mapping[str, typing.Any]
+    ) -> typing.Mapping[str, typing.Any]:
+        return types.MappingProxyType(
+            {name: self.get_dependency(identifier) for name, identifier in plan.items()}
+        )
+
+    def _get_scoped_dependency(
+        self,
+        identifier: typing.Type[typing.Any],
+        factory: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        scope = lifetime.current_scope()
+        if scope is None:
+            return factory()
+
+        key = (self, identifier)
+        dependency = scope.get(key, sentinel.NOTHING)
+        if dependency is sentinel.NOTHING:
+            dependency = factory()
+            scope.set(key, dependency)
+
+        return dependency
+
+    def _invalidate(self, identifier: typing.Type[typing.Any]) -> None:
+        for handler in self._dependents.get(identifier, ()):
+            self._resolved.pop(handler, None)
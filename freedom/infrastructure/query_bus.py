@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("InMemoryQueryBus",)
+
+import collections
+import typing
+
+from freedom import util
+from freedom.application import inflector as inflector_
+from freedom.application import query_bus
+from freedom.domain import event_handler as event_handler_
+from freedom.domain import query as query_
+from freedom.domain import query_handler as handler_
+from freedom.infrastructure import activator as activator_
+from freedom.infrastructure import inflector as inflector_impl
+
+if typing.TYPE_CHECKING:
+    from freedom.application import event_emitter as emitter_
+    from freedom.application import provider as provider_
+    from freedom.domain import event as event_
+
+
+class InMemoryQueryBus(query_bus.QueryBus):
+    __slots__: typing.Sequence[str] = (
+        "_activator",
+        "_cache",
+        "_cache_size",
+        "_emitter",
+        "_generations",
+        "_inflector",
+        "_invalidations",
+        "_listener",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        *,
+        provider: typing.Optional[provider_.AnyDependencyProviderType] = None,
+        emitter: typing.Optional[emitter_.EventEmitter] = None,
+        inflector: typing.Optional[
+            inflector_.Inflector[query_.QueryType, handler_.AnyQueryHandlerType]
+        ] = None,
+        cache_size: int = 1024,
+    ) -> None:
+        if inflector is None:
+            inflector = typing.cast(
+                inflector_.Inflector[
+                    query_.QueryType,
+                    handler_.AnyQueryHandlerType,
+                ],
+                inflector_impl.InMemoryInflector(
+                    handler_type=handler_.QueryHandler,
+                ),
+            )
+
+        self._activator = activator_.HandlerActivator(provider)
+        self._inflector = inflector
+        self._emitter = emitter
+        self._cache_size = cache_size
+        # Query type -> LRU of structural query key -> result.
+        self._cache: typing.Dict[
+            query_.QueryType, typing.OrderedDict[typing.Hashable, typing.Any]
+        ] = {}
+        # Bumped on invalidation, so a read that started before it never
+        # stores its (possibly stale) result.
+        self._generations: typing.DefaultDict[query_.QueryType, int] = (
+            collections.defaultdict(int)
+        )
+        self._invalidations: typing.Dict[
+            event_.EventType, typing.Set[query_.QueryType]
+        ] = {}
+        # Bound once, the emitter unsubscribes listeners by identity. Plain
+        # coroutine functions are accepted as listeners too.
+        self._listener = typing.cast(event_handler_.AnyEventHandlerType, self._on_event)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    async def execute(self, query: query_.Query) -> typing.Any:
+        query_type = type(query)
+        handler = self.get_handler_for(query_type)
+        if handler is None:
+            raise KeyError(f"No query handler found for query {query_type}")
+
+        cacheable = self._cache_size > 0 and query_type in self._generations
+        if cacheable:
+            key = util.structural_key(query)
+            results = self._cache.get(query_type)
+            if results is not None and key in results:
+                results.move_to_end(key)
+                self._hits += 1
+                return results[key]
+
+        self._misses += 1
+        generation = self._generations.get(query_type)
+        instance, _ = self._activator.activate(handler)
+        result = await instance.handle(query)
+
+        if cacheable and self._generations.get(query_type) == generation:
+            results = self._cache.setdefault(query_type, collections.OrderedDict())
+            results[key] = result
+            if len(results) > self._cache_size:
+                results.popitem(last=False)
+
+        return result
+
+    def listen(
+        self,
+        handler: typing.Optional[handler_.AnyQueryHandlerTypeT] = None,
+        query: typing.Optional[query_.QueryType] = None,
+    ) -> typing.Union[
+        handler_.AnyQueryHandlerTypeT,
+        typing.Callable[
+            [handler_.AnyQueryHandlerTypeT],
+            handler_.AnyQueryHandlerTypeT,
+        ],
+    ]:
+        return self._inflector.listen(handler, query)
+
+    def get_handler_for(
+        self, query: query_.QueryType
+    ) -> typing.Optional[handler_.AnyQueryHandlerType]:
+        return self._inflector.get_handler_for(query)
+
+    def get_handlers(
+        self,
+    ) -> inflector_.TargetHandlersViewType[
+        query_.QueryType, handler_.AnyQueryHandlerType
+    ]:
+        return self._inflector.get_handlers()
+
+    def subscribe(
+        self,
+        handler: handler_.AnyQueryHandlerType,
+        query: query_.QueryType,
+        invalidated_by: typing.Iterable[event_.EventType] = (),
+    ) -> None:
+        invalidated_by = tuple(invalidated_by)
+        if invalidated_by and self._emitter is None:
+            raise ValueError("Cache invalidation by events requires an emitter.")
+
+        self._inflector.subscribe(handler, query)
+
+        # Results are only cached for queries that declare what invalidates
+        # them, anything else would be served stale forever.
+        if invalidated_by:
+            self._generations[query] += 1
+
+        for event in invalidated_by:
+            queries = self._invalidations.get(event)
+            if queries is None:
+                queries = self._invalidations[event] = set()
+                assert self._emitter is not None
+                self._emitter.subscribe(self._listener, event)
+
+            queries.add(query)
+
+    def unsubscribe(self, query: query_.QueryType) -> None:
+        handler = self.get_handler_for(query)
+        self._inflector.unsubscribe(query)
+
+        if handler is not None:
+            self._activator.forget(handler)
+
+        self.invalidate(query)
+        self._generations.pop(query, None)
+        for event, queries in tuple(self._invalidations.items()):
+            queries.discard(query)
+            # Nothing left to invalidate for this event type.
+            if not queries:
+                del self._invalidations[event]
+                assert self._emitter is not None
+                self._emitter.unsubscribe(self._listener, event)
+
+    def invalidate(self, query: typing.Optional[query_.QueryType] = None) -> None:
+        queries = tuple(self._generations) if query is None else (query,)
+        for query_type in queries:
+            self._cache.pop(query_type, None)
+            if query_type in self._generations:
+                self._generations[query_type] += 1
+
+    async def _on_event(self, event: event_.Event) -> None:
+        for event_type in type(event).__mro__:
+            for query in self._invalidations.get(event_type, ()):
+                self.invalidate(query)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 __all__: typing.Sequence[str] = ("InMemoryRepository",)
 
+import itertools
 import typing
 
 from freedom.domain import aggregate as aggregate_
@@ -14,10 +15,13 @@ _AggregateRootT = typing.TypeVar("_AggregateRootT", bound=aggregate_.AnyAggregat
 
 
 class InMemoryRepository(repository.Repository[_AggregateRootIdT, _AggregateRootT]):
-    __slots__: typing.Sequence[str] = ("_objects",)
+    __slots__: typing.Sequence[str] = ("_objects", "_dirty")
 
     def __init__(self) -> None:
         self._objects: typing.Dict[entity_id.EntityId, _AggregateRootT] = {}
+        # Aggregates with uncommitted events, in the order they were touched,
+        # so collecting events does not scan the whole repository.
+        self._dirty: typing.Dict[entity_id.EntityId, _AggregateRootT] = {}
 
     async def get_by_id(
         self, aggregate_id: _AggregateRootIdT
@@ -31,10 +35,12 @@ class InMemoryRepository(repository.Repository[_AggregateRootIdT, _AggregateRoot
 
     async def remove_by_id(self, aggregate_id: _AggregateRootIdT) -> None:
         try:
-            del self._objects[aggregate_id]
+            aggregate = self._objects.pop(typing.cast(entity_id.EntityId, aggregate_id))
         except KeyError as exc:
             raise KeyError(f"No aggregate found with id {aggregate_id!r}") from exc
 
+        self._untrack(aggregate)
+
     async def remove(self, aggregate: _AggregateRootT) -> None:
         await self.remove_by_id(aggregate.id)
 
@@ -43,18 +49,69 @@ class InMemoryRepository(repository.Repository[_AggregateRootIdT, _AggregateRoot
             raise ValueError(f"Aggregate with id {aggregate.id!r} already exists.")
 
         self._objects[aggregate.id] = aggregate
+        self._track(aggregate)
 
     async def save(self, aggregate: _AggregateRootT) -> None:
+        previous = self._objects.get(aggregate.id)
+        if previous is aggregate:
+            return
+
+        if previous is not None:
+            self._untrack(previous)
+
         self._objects[aggregate.id] = aggregate
+        self._track(aggregate)
 
     persist = save
 
     async def persist_all(self) -> None:
         return
 
+    async def flush(
+        self,
+        new: typing.Sequence[_AggregateRootT],
+        dirty: typing.Sequence[_AggregateRootT],
+        removed: typing.Sequence[_AggregateRootT],
+    ) -> None:
+        # Checked upfront, a failing flush leaves the repository untouched.
+        for aggregate in new:
+            if aggregate.id in self._objects:
+                raise ValueError(f"Aggregate with id {aggregate.id!r} already exists.")
+
+        for aggregate in removed:
+            previous = self._objects.pop(aggregate.id, None)
+            if previous is not None:
+                self._untrack(previous)
+
+        for aggregate in itertools.chain(new, dirty):
+            previous = self._objects.get(aggregate.id)
+            if previous is not None and previous is not aggregate:
+                self._untrack(previous)
+
+            self._objects[aggregate.id] = aggregate
+            self._track(aggregate)
+            # Its events were collected through the unit of work already.
+            if not aggregate.uncommitted_events:
+                self._dirty.pop(aggregate.id, None)
+
     def collect_events(self) -> typing.List[event.Event]:
         events = []
-        for aggregate in self._objects.values():
+        dirty, self._dirty = self._dirty, {}
+        for aggregate in dirty.values():
             events.extend(aggregate.collect_events())
 
         return events
+
+    def _track(self, aggregate: _AggregateRootT) -> None:
+        aggregate.add_event_listener(self._mark_dirty)
+        # Events recorded before it was added (e.g. by its factory).
+        if aggregate.uncommitted_events:
+            self._mark_dirty(aggregate)
+
+    def _untrack(self, aggregate: _AggregateRootT) -> None:
+        aggregate.remove_event_listener(self._mark_dirty)
+        if self._dirty.get(aggregate.id) is aggregate:
+            del self._dirty[aggregate.id]
+
+    def _mark_dirty(self, aggregate: aggregate_.AnyAggregateRoot) -> None:
+        self._dirty[aggregate.id] = typing.cast(_AggregateRootT, aggregate)
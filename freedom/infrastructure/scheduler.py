@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("PartitionedCommandBus",)
+
+import asyncio
+import typing
+
+from freedom import util
+from freedom.application import command_bus
+
+if typing.TYPE_CHECKING:
+    from freedom.application import inflector as inflector_
+    from freedom.domain import command as command_
+    from freedom.domain import command_handler as handler_
+
+PartitionKeyType = typing.Callable[
+    ["command_.Command"], typing.Optional[typing.Hashable]
+]
+
+
+class PartitionedCommandBus(command_bus.CommandBus):
+    __slots__: typing.Sequence[str] = (
+        "_command_bus",
+        "_key",
+        "_max_workers",
+        "_semaphore",
+        "_tails",
+    )
+
+    def __init__(
+        self,
+        command_bus: command_bus.CommandBus,
+        *,
+        max_workers: int = command_bus.DEFAULT_MAX_CONCURRENCY,
+        key: typing.Optional[PartitionKeyType] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive.")
+
+        self._command_bus = command_bus
+        self._key = key or util.get_aggregate_key
+        self._max_workers = max_workers
+        self._semaphore: typing.Optional[asyncio.Semaphore] = None
+        # Partition key -> future of the last command queued for it. Every
+        # command waits for its predecessor, so a partition runs in order
+        # while the command itself keeps running in its caller's task.
+        self._tails: typing.Dict[typing.Hashable, asyncio.Future[None]] = {}
+
+    @property
+    def partitions(self) -> int:
+        return len(self._tails)
+
+    async def execute(self, command: command_.Command) -> handler_.CommandResult:
+        key = self._key(command)
+        if key is None:
+            return await self._execute(command)
+
+        previous = self._tails.get(key)
+        done = util.get_loop().create_future()
+        self._tails[key] = done
+
+        try:
+            if previous is not None:
+                await asyncio.wait((previous,))
+        except asyncio.CancelledError:
+            # Successor must still wait for our predecessor.
+            assert previous is not None
+            previous.add_done_callback(lambda _: self._release(key, done))
+            raise
+
+        try:
+            return await self._execute(command)
+        finally:
+            self._release(key, done)
+
+    @typing.overload
+    def listen(
+        self,
+        handler: typing.Literal[None],
+        command: typing.Optional[command_.CommandType] = None,
+    ) -> typing.Callable[
+        [handler_.AnyCommandHandlerTypeT], handler_.AnyCommandHandlerTypeT
+    ]: ...
+
+    @typing.overload
+    def listen(
+        self,
+        handler: handler_.AnyCommandHandlerTypeT,
+        command: typing.Optional[command_.CommandType] = None,
+    ) -> handler_.AnyCommandHandlerTypeT: ...
+
+    def listen(
+        self,
+        handler: typing.Optional[handler_.AnyCommandHandlerTypeT] = None,
+        command: typing.Optional[command_.CommandType] = None,
+    ) -> typing.Union[
+        handler_.AnyCommandHandlerTypeT,
+        typing.Callable[
+            [handler_.AnyCommandHandlerTypeT],
+            handler_.AnyCommandHandlerTypeT,
+        ],
+    ]:
+        return self._command_bus.listen(handler, command)
+
+    def get_handler_for(
+        self, command: command_.CommandType
+    ) -> typing.Optional[handler_.AnyCommandHandlerType]:
+        return self._command_bus.get_handler_for(command)
+
+    def get_handlers(
+        self,
+    ) -> inflector_.TargetHandlersViewType[
+        command_.CommandType, handler_.AnyCommandHandlerType
+    ]:
+        return self._command_bus.get_handlers()
+
+    def subscribe(
+        self,
+        handler: handler_.AnyCommandHandlerType,
+        command: command_.CommandType,
+    ) -> None:
+        self._command_bus.subscribe(handler, command)
+
+    def unsubscribe(self, command: command_.CommandType) -> None:
+        self._command_bus.unsubscribe(command)
+
+    async def _execute(self, command: command_.Command) -> handler_.CommandResult:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_workers)
+
+        async with self._semaphore:
+            return await self._command_bus.execute(command)
+
+    def _release(self, key: typing.Hashable, done: asyncio.Future[None]) -> None:
+        if not done.done():
+            done.set_result(None)
+
+        if self._tails.get(key) is done:
+            del self._tails[key]
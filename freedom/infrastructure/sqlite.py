@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = ("SqliteDatabase",)
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import os
+import sqlite3
+import typing
+
+from freedom import util
+
+_T = typing.TypeVar("_T")
+
+PathType = typing.Union[str, "os.PathLike[str]"]
+
+# (statement, parameter rows, completion future)
+_WriteType = typing.Tuple[
+    str, typing.Sequence[typing.Sequence[typing.Any]], "asyncio.Future[None]"
+]
+
+
+class SqliteDatabase:
+    # sqlite3 blocks, so every statement runs on one worker thread, in order.
+    # Writes that arrive while another one is running are committed together
+    # by the next transaction, so concurrent callers share a single commit.
+    __slots__: typing.Sequence[str] = (
+        "_connection",
+        "_executor",
+        "_flush_task",
+        "_path",
+        "_pending",
+        "_schema",
+    )
+
+    def __init__(self, path: PathType, *, schema: typing.Sequence[str] = ()) -> None:
+        self._path = path
+        self._schema = tuple(schema)
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="freedom-sqlite"
+        )
+        self._pending: typing.List[_WriteType] = []
+        self._flush_task: typing.Optional[asyncio.Task[None]] = None
+
+    async def run(self, func: typing.Callable[..., _T], /, *args: typing.Any) -> _T:
+        # `func` gets the connection as its first argument.
+        return await util.get_loop().run_in_executor(
+            self._executor, functools.partial(self._call, func, *args)
+        )
+
+    async def write(
+        self,
+        statement: str,
+        rows: typing.Sequence[typing.Sequence[typing.Any]],
+    ) -> None:
+        if not rows:
+            return
+
+        loop = util.get_loop()
+        future = loop.create_future()
+        self._pending.append((statement, rows, future))
+
+        if self._flush_task is None:
+            # Flushes serve many callers, they must not keep any one's context.
+            self._flush_task = contextvars.Context().run(
+                loop.create_task, self._flush()
+            )
+
+        await future
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            await asyncio.wait((self._flush_task,))
+
+        await util.get_loop().run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=False)
+
+    async def _flush(self) -> None:
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    await self.run(_execute_writes, batch)
+                except BaseException as exc:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+
+                    if not isinstance(exc, Exception):
+                        raise
+                else:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+        finally:
+            self._flush_task = None
+
+    def _call(self, func: typing.Callable[..., _T], /, *args: typing.Any) -> _T:
+        return func(self._connect(), *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                for statement in self._schema:
+                    connection.execute(statement)
+
+            self._connection = connection
+
+        return self._connection
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _execute_writes(
+    connection: sqlite3.Connection, batch: typing.Sequence[_WriteType]
+) -> None:
+    with connection:
+        for statement, rows, _ in batch:
+            connection.executemany(statement, rows)
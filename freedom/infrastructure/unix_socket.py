@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+__all__: typing.Sequence[str] = (
+    "UnixSocketBroker",
+    "UnixSocketEventEmitter",
+)
+
+import asyncio
+import logging
+import os
+import struct
+import typing
+
+from freedom import util
+from freedom.domain import event as event_
+from freedom.infrastructure import codec as codec_impl
+from freedom.infrastructure import event_emitter as event_emitter_impl
+
+if typing.TYPE_CHECKING:
+    from freedom.application import codec as codec_
+
+# Every frame is its payload prefixed by the payload length.
+_HEADER: typing.Final[struct.Struct] = struct.Struct("!I")
+
+
+class _FrameProtocol(asyncio.Protocol):
+    __slots__: typing.Sequence[str] = (
+        "_buffer",
+        "_closed",
+        "_on_connection_lost",
+        "_on_frames",
+        "_on_writable",
+        "transport",
+        "writable",
+    )
+
+    def __init__(
+        self,
+        on_frames: typing.Callable[
+            [_FrameProtocol, memoryview, typing.List[memoryview]], None
+        ],
+        on_connection_lost: typing.Callable[[_FrameProtocol], None],
+        on_writable: typing.Optional[typing.Callable[[_FrameProtocol], None]] = None,
+    ) -> None:
+        self._buffer = bytearray()
+        self._closed = util.get_loop().create_future()
+        self._on_frames = on_frames
+        self._on_connection_lost = on_connection_lost
+        self._on_writable = on_writable
+        self.transport: typing.Optional[asyncio.Transport] = None
+        self.writable = True
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = typing.cast(asyncio.Transport, transport)
+
+    def connection_lost(self, exc: typing.Optional[Exception]) -> None:
+        self.transport = None
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+        self._on_connection_lost(self)
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+
+        # Every complete frame of this read is handed over at once, along with
+        # the raw bytes they span (a broker forwards those untouched).
+        view = memoryview(buffer)
+        frames = []
+        offset = 0
+        size = len(buffer)
+        while size - offset >= _HEADER.size:
+            (length,) = _HEADER.unpack_from(view, offset)
+            end = offset + _HEADER.size + length
+            if end > size:
+                break
+
+            frames.append(view[offset + _HEADER.size : end])
+            offset = end
+
+        if frames:
+            try:
+                self._on_frames(self, view[:offset], frames)
+            finally:
+                frames.clear()
+                view.release()
+                # The rest moves to a new buffer rather than resizing this
+                # one, a view may outlive the call (e.g. in a traceback).
+                self._buffer = buffer[offset:]
+        else:
+            view.release()
+
+    def pause_writing(self) -> None:
+        self.writable = False
+
+    def resume_writing(self) -> None:
+        self.writable = True
+        if self._on_writable is not None:
+            self._on_writable(self)
+
+    async def wait_closed(self) -> None:
+        await asyncio.shield(self._closed)
+
+
+class UnixSocketBroker:
+    # Forwards every frame a process sends to all the other connected
+    # processes. Frames are never decoded here.
+    __slots__: typing.Sequence[str] = (
+        "_path",
+        "_peers",
+        "_server",
+        "_stalled",
+    )
+
+    def __init__(self, path: typing.Union[str, os.PathLike[str]]) -> None:
+        self._path = os.fspath(path)
+        self._server: typing.Optional[asyncio.AbstractServer] = None
+        self._peers: typing.Set[_FrameProtocol] = set()
+        # Peers whose write buffer is full; while any is, senders are not read.
+        self._stalled: typing.Set[_FrameProtocol] = set()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def peers(self) -> int:
+        return len(self._peers)
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+        self._server = await util.get_loop().create_unix_server(
+            self._create_protocol, self._path
+        )
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+
+        server, self._server = self._server, None
+        server.close()
+        for peer in tuple(self._peers):
+            if peer.transport is not None:
+                peer.transport.close()
+
+        await server.wait_closed()
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+    async def __aenter__(self) -> UnixSocketBroker:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: typing.Any) -> None:
+        await self.close()
+
+    def _create_protocol(self) -> _FrameProtocol:
+        peer = _FrameProtocol(self._forward, self._disconnect, self._resume)
+        self._peers.add(peer)
+        return peer
+
+    def _forward(
+        self,
+        sender: _FrameProtocol,
+        data: memoryview,
+        _: typing.List[memoryview],
+    ) -> None:
+        payload = bytes(data)
+        for peer in self._peers:
+            if peer is not sender and peer.transport is not None:
+                peer.transport.write(payload)
+                if not peer.writable and peer not in self._stalled:
+                    self._stall(peer)
+
+    def _stall(self, peer: _FrameProtocol) -> None:
+        if not self._stalled:
+            for other in self._peers:
+                if other.transport is not None:
+                    other.transport.pause_reading()
+
+        self._stalled.add(peer)
+
+    def _resume(self, peer: _FrameProtocol) -> None:
+        self._stalled.discard(peer)
+        if not self._stalled:
+            for other in self._peers:
+                if other.transport is not None:
+                    other.transport.resume_reading()
+
+    def _disconnect(self, peer: _FrameProtocol) -> None:
+        self._peers.discard(peer)
+        self._resume(peer)
+
+
+class UnixSocketEventEmitter(event_emitter_impl.InMemoryEventEmitter):
+    __slots__: typing.Sequence[str] = (
+        "_codec",
+        "_flush_handle",
+        "_logger",
+        "_outgoing",
+        "_path",
+        "_protocol",
+        "_received",
+        "_sent",
+    )
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike[str]],
+        *,
+        codec: typing.Optional[codec_.Codec] = None,
+        logger: typing.Optional[logging.Logger] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._path = os.fspath(path)
+        self._codec = codec or codec_impl.BinaryCodec()
+        self._logger = logger
+        self._protocol: typing.Optional[_FrameProtocol] = None
+        # Frames emitted during one loop iteration go out in a single write.
+        self._outgoing: typing.List[bytes] = []
+        self._flush_handle: typing.Optional[asyncio.Handle] = None
+        self._sent = 0
+        self._received = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._protocol is not None and self._protocol.transport is not None
+
+    @property
+    def sent(self) -> int:
+        return self._sent
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    async def connect(self) -> None:
+        if self.connected:
+            return
+
+        _, protocol = await util.get_loop().create_unix_connection(
+            lambda: _FrameProtocol(self._receive, self._disconnect), self._path
+        )
+        self._protocol = protocol
+
+    def emit(self, event: event_.Event, /) -> asyncio.Future[typing.Any]:
+        # Exception events carry local handlers and tracebacks, they stay here.
+        if self._protocol is not None and not isinstance(event, event_.ExceptionEvent):
+            payload = self._codec.encode(event)
+            self._outgoing.append(_HEADER.pack(len(payload)))
+            self._outgoing.append(payload)
+            if self._flush_handle is None:
+                self._flush_handle = util.get_loop().call_soon(self._write)
+
+        return super().emit(event)
+
+    async def flush(self) -> None:
+        self._write()
+        await super().flush()
+
+    async def close(self) -> None:
+        self._write()
+        protocol, self._protocol = self._protocol, None
+        if protocol is not None and protocol.transport is not None:
+            protocol.transport.close()
+            await protocol.wait_closed()
+
+        await super().close()
+
+    def _write(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._outgoing:
+            return
+
+        outgoing, self._outgoing = self._outgoing, []
+        protocol = self._protocol
+        if protocol is None or protocol.transport is None:
+            return
+
+        protocol.transport.write(b"".join(outgoing))
+        self._sent += len(outgoing) // 2
+
+    def _receive(
+        self,
+        _: _FrameProtocol,
+        __: memoryview,
+        frames: typing.List[memoryview],
+    ) -> None:
+        decode = self._codec.decode
+        for frame in frames:
+            try:
+                # Codecs take bytes, e.g. json.loads rejects a memoryview.
+                event = decode(bytes(frame))
+            except Exception:
+                # One bad frame must not cost the rest of the connection.
+                if self._logger is not None:
+                    self._logger.exception("Failed to decode a received event.")
+
+                continue
+
+            self._received += 1
+            # Dispatched locally only, the broker already fanned it out.
+            super().emit(event).add_done_callback(_consume_result)
+
+    def _disconnect(self, protocol: _FrameProtocol) -> None:
+        if self._protocol is protocol:
+            self._protocol = None
+
+
+def _consume_result(future: asyncio.Future[typing.Any]) -> None:
+    # Nobody awaits a remote event, its failures must not go unretrieved.
+    if not future.cancelled():
+        future.exception()
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections.abc
 import inspect
 import sys
+import types
 import typing
 
 from freedom import sentinel
@@ -12,6 +14,7 @@ FROZEN_STR: typing.Final[str] = "__frozen__"
 UNFREEZE_ATTRS_STR: typing.Final[str] = "__unfreeze_attrs__"
 
 _T = typing.TypeVar("_T")
+_R = typing.TypeVar("_R")
 
 
 def __frozen_setattr__(
@@ -25,7 +28,10 @@ def __frozen_setattr__(
     ):
         raise ImmutableObjectError("Object is immutable.")
 
-    if hasattr(self, "__dict__"):
+    # Slots are data descriptors and shadow __dict__, write those normally.
+    if hasattr(self, "__dict__") and not isinstance(
+        getattr(type(self), key, None), types.MemberDescriptorType
+    ):
         self.__dict__[key] = value
         return
 
@@ -63,6 +69,127 @@ def as_completed_future(
     return future
 
 
+async def aenumerate(
+    items: typing.Union[typing.Iterable[_T], typing.AsyncIterable[_T]],
+) -> typing.AsyncIterator[typing.Tuple[int, _T]]:
+    index = 0
+    if isinstance(items, typing.AsyncIterable):
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for item in items:
+            yield index, item
+            index += 1
+
+
+async def bounded_map(
+    func: typing.Callable[[_T], typing.Awaitable[_R]],
+    items: typing.Union[typing.Iterable[_T], typing.AsyncIterable[_T]],
+    *,
+    max_concurrency: int,
+) -> typing.AsyncIterator[typing.Tuple[int, _R]]:
+    # Yields (input index, result) as they complete. A fixed set of workers
+    # pulls items lazily, so the input may be an unbounded stream.
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be positive.")
+
+    # No point in more workers than items, when their count is known.
+    if isinstance(items, collections.abc.Sized):
+        max_concurrency = max(1, min(max_concurrency, len(items)))
+
+    iterator = aenumerate(items)
+    lock = asyncio.Lock()
+    # Bounded, so a slow consumer holds the workers back instead of results
+    # piling up while the input is drained.
+    results: asyncio.Queue[typing.Any] = asyncio.Queue(max_concurrency)
+
+    async def worker() -> None:
+        try:
+            while True:
+                async with lock:
+                    try:
+                        index, item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+
+                await results.put((index, await func(item)))
+        except Exception as exc:
+            await results.put(exc)
+
+        await results.put(sentinel.NOTHING)
+
+    loop = get_loop()
+    workers = [loop.create_task(worker()) for _ in range(max_concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result = await results.get()
+            if result is sentinel.NOTHING:
+                running -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+_SCALAR_TYPES: typing.Final[typing.Tuple[typing.Type[typing.Any], ...]] = (
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    type(None),
+)
+
+
+def structural_key(obj: typing.Any) -> typing.Hashable:
+    # Value objects compare by identity, this gives a hashable key that is
+    # equal for equal values (same type, same attributes).
+    if isinstance(obj, _SCALAR_TYPES):
+        return typing.cast(typing.Hashable, obj)
+
+    if isinstance(obj, (list, tuple)):
+        return type(obj), tuple(structural_key(item) for item in obj)
+
+    if isinstance(obj, (set, frozenset)):
+        return type(obj), frozenset(structural_key(item) for item in obj)
+
+    if isinstance(obj, dict):
+        return dict, frozenset(
+            (structural_key(k), structural_key(v)) for k, v in obj.items()
+        )
+
+    state = []
+    if hasattr(obj, "__dict__"):
+        state.extend(vars(obj).items())
+
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                state.append((slot, getattr(obj, slot)))
+
+    if not state:
+        return typing.cast(typing.Hashable, obj)
+
+    state.sort(key=lambda item: typing.cast(str, item[0]))
+    return type(obj), tuple((name, structural_key(value)) for name, value in state)
+
+
+def get_aggregate_key(message: typing.Any) -> typing.Optional[typing.Hashable]:
+    aggregate_id = getattr(message, "aggregate_id", None)
+    if aggregate_id is None:
+        return None
+
+    return structural_key(aggregate_id)
+
+
 def get_type_hints(
     obj: typing.Any,
     *,
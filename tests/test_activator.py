@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from freedom.application import lifetime as lifetime_
+from freedom.infrastructure import activator as activator_impl
+from freedom.infrastructure import provider as provider_impl
+
+
+class Clock:
+    pass
+
+
+@lifetime_.lifetime(lifetime_.Lifetime.SINGLETON)
+class SingletonHandler:
+    def __init__(self, clock: Clock) -> None:
+        self.clock = clock
+
+
+@lifetime_.lifetime(lifetime_.Lifetime.SCOPED)
+class ScopedHandler:
+    pass
+
+
+class TransientHandler:
+    pass
+
+
+def test_singleton_handler_is_reused_until_dependency_changes() -> None:
+    provider = provider_impl.InMemoryDependencyProvider({Clock: Clock()})
+    activator = activator_impl.HandlerActivator(provider)
+
+    handler, _ = activator.activate(SingletonHandler)
+    assert activator.activate(SingletonHandler)[0] is handler
+
+    clock = Clock()
+    provider.register_dependency(Clock, clock)
+    handler, _ = activator.activate(SingletonHandler)
+    assert handler.clock is clock
+
+    activator.forget(SingletonHandler)
+    assert activator.activate(SingletonHandler)[0] is not handler
+
+
+def test_scoped_handler_is_reused_within_a_scope() -> None:
+    activator = activator_impl.HandlerActivator()
+
+    token = lifetime_.enter_scope()
+    try:
+        handler, _ = activator.activate(ScopedHandler)
+        assert activator.activate(ScopedHandler)[0] is handler
+    finally:
+        lifetime_.exit_scope(token)
+
+    token = lifetime_.enter_scope()
+    try:
+        assert activator.activate(ScopedHandler)[0] is not handler
+    finally:
+        lifetime_.exit_scope(token)
+
+    # Without a scope a scoped handler behaves like a transient one.
+    assert activator.activate(ScopedHandler)[0] is not handler
+
+
+def test_transient_handler_is_created_every_time() -> None:
+    activator = activator_impl.HandlerActivator()
+
+    assert lifetime_.get_lifetime(TransientHandler) is lifetime_.Lifetime.TRANSIENT
+    handler, _ = activator.activate(TransientHandler)
+    assert activator.activate(TransientHandler)[0] is not handler
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from freedom.application import application as application_
+from freedom.domain import command as command_
+from freedom.domain import command_handler as command_handler_
+from freedom.domain import event as event_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import provider as provider_impl
+
+
+class PlaceOrder(command_.Command):
+    pass
+
+
+class ChargeCard(command_.Command):
+    pass
+
+
+class ShipOrders(command_.Command):
+    pass
+
+
+class OrderPlaced(event_.Event):
+    pass
+
+
+class CardCharged(event_.Event):
+    pass
+
+
+class OrderShipped(event_.Event):
+    def __init__(self, aggregate_id: str, sequence: int) -> None:
+        self.aggregate_id = aggregate_id
+        self.sequence = sequence
+
+
+class PlaceOrderHandler(command_handler_.CommandHandler[PlaceOrder]):
+    async def handle(self, command: PlaceOrder, /) -> command_handler_.CommandResult:
+        return command_handler_.CommandResult.success(events=[OrderPlaced()])
+
+
+class ChargeCardHandler(command_handler_.CommandHandler[ChargeCard]):
+    async def handle(self, command: ChargeCard, /) -> command_handler_.CommandResult:
+        return command_handler_.CommandResult.success(events=[CardCharged()])
+
+
+class ShipOrdersHandler(command_handler_.CommandHandler[ShipOrders]):
+    async def handle(self, command: ShipOrders, /) -> command_handler_.CommandResult:
+        return command_handler_.CommandResult.success(
+            events=[
+                OrderShipped("a", 1),
+                OrderShipped("b", 1),
+                OrderShipped("a", 2),
+                OrderShipped("b", 2),
+            ]
+        )
+
+
+def create_application(
+    event_emitter: event_emitter_impl.InMemoryEventEmitter,
+    **kwargs: typing.Any,
+) -> application_.Application:
+    provider = provider_impl.InMemoryDependencyProvider()
+    command_bus = command_bus_impl.InMemoryCommandBus(provider=provider)
+    command_bus.subscribe(PlaceOrderHandler, PlaceOrder)
+    command_bus.subscribe(ChargeCardHandler, ChargeCard)
+    command_bus.subscribe(ShipOrdersHandler, ShipOrders)
+    return application_.Application(
+        "test",
+        1,
+        command_bus=command_bus,
+        event_emitter=event_emitter,
+        dependency_provider=provider,
+        **kwargs,
+    )
+
+
+def test_event_handler_may_execute_follow_up_command() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    application = create_application(event_emitter)
+    follow_ups: typing.List[bool] = []
+
+    async def on_order_placed(event: OrderPlaced) -> None:
+        result = await application.execute_command(ChargeCard())
+        follow_ups.append(result.is_success())
+
+    event_emitter.subscribe(on_order_placed, OrderPlaced)
+
+    async def main() -> None:
+        await application.execute_command(PlaceOrder())
+        await application.execute_command(PlaceOrder())
+
+    asyncio.run(main())
+    assert follow_ups == [True, True]
+
+
+def test_event_handler_may_not_reenter_its_transaction() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    application = create_application(event_emitter)
+    errors: typing.List[BaseException] = []
+
+    async def on_order_placed(event: OrderPlaced) -> None:
+        context = application_.current_transaction()
+        assert context is not None
+        try:
+            await context.execute_command(ChargeCard())
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    event_emitter.subscribe(on_order_placed, OrderPlaced)
+    asyncio.run(application.execute_command(PlaceOrder()))
+    assert len(errors) == 1
+
+
+def test_execute_many_returns_results_in_input_order() -> None:
+    application = create_application(event_emitter_impl.InMemoryEventEmitter())
+    commands = [PlaceOrder(), ChargeCard(), PlaceOrder()]
+
+    async def main() -> typing.List[command_handler_.CommandResult]:
+        return await application.execute_many(commands, max_concurrency=2)
+
+    results = asyncio.run(main())
+    assert len(results) == 3
+    assert all(result.is_success() for result in results)
+
+
+def test_follow_up_command_with_event_worker_pool() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(workers=1)
+    application = create_application(event_emitter)
+    charged: typing.List[event_.Event] = []
+
+    async def on_order_placed(event: OrderPlaced) -> None:
+        await application.execute_command(ChargeCard())
+
+    async def on_card_charged(event: CardCharged) -> None:
+        charged.append(event)
+
+    event_emitter.subscribe(on_order_placed, OrderPlaced)
+    event_emitter.subscribe(on_card_charged, CardCharged)
+
+    async def main() -> None:
+        await asyncio.wait_for(application.execute_command(PlaceOrder()), timeout=1)
+        await event_emitter.close()
+
+    asyncio.run(main())
+    assert len(charged) == 1
+
+
+def dispatch_shipments(**kwargs: typing.Any) -> typing.List[typing.Tuple[str, int]]:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    application = create_application(event_emitter, **kwargs)
+    handled: typing.List[typing.Tuple[str, int]] = []
+
+    async def on_order_shipped(event: OrderShipped) -> None:
+        await asyncio.sleep(0.001)
+        handled.append((event.aggregate_id, event.sequence))
+
+    event_emitter.subscribe(on_order_shipped, OrderShipped)
+    asyncio.run(application.execute_command(ShipOrders()))
+    return handled
+
+
+def test_events_are_dispatched_serially_by_default() -> None:
+    assert dispatch_shipments() == [("a", 1), ("b", 1), ("a", 2), ("b", 2)]
+
+
+def test_partitioned_dispatch_keeps_order_per_aggregate() -> None:
+    handled = dispatch_shipments(concurrent_event_dispatch=True)
+    assert sorted(handled) == [("a", 1), ("a", 2), ("b", 1), ("b", 2)]
+    for aggregate_id in "ab":
+        sequences = [sequence for key, sequence in handled if key == aggregate_id]
+        assert sequences == [1, 2]
+
+    # Both partitions ran at once, so their events interleave.
+    assert handled[:2] in ([("a", 1), ("b", 1)], [("b", 1), ("a", 1)])
+
+
+def test_partitioned_dispatch_respects_event_concurrency() -> None:
+    handled = dispatch_shipments(concurrent_event_dispatch=True, event_concurrency=1)
+    assert handled[:2] == [("a", 1), ("a", 2)]
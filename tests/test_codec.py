@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import decimal
+import enum
+import typing
+import uuid
+
+import pytest
+
+from freedom.domain import event as event_
+from freedom.domain import valueobject
+from freedom.infrastructure import codec as codec_impl
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import event_log as event_log_impl
+from freedom.infrastructure import outbox as outbox_impl
+
+
+class Currency(enum.Enum):
+    EUR = "eur"
+    USD = "usd"
+
+
+class Money(valueobject.ValueObject):
+    def __init__(self, amount: decimal.Decimal, currency: Currency) -> None:
+        self.amount = amount
+        self.currency = currency
+
+
+class OrderPlaced(event_.Event):
+    def __init__(
+        self,
+        order_id: uuid.UUID,
+        quantity: int,
+        weight: float,
+        express: bool,
+        note: typing.Optional[str],
+        tags: typing.List[str],
+        dimensions: typing.Tuple[int, int, int],
+        lines: typing.Dict[str, int],
+        total: Money,
+        placed_at: datetime.datetime,
+        signature: bytes,
+    ) -> None:
+        self.order_id = order_id
+        self.quantity = quantity
+        self.weight = weight
+        self.express = express
+        self.note = note
+        self.tags = tags
+        self.dimensions = dimensions
+        self.lines = lines
+        self.total = total
+        self.placed_at = placed_at
+        self.signature = signature
+
+
+class OrderCancelled(event_.Event):
+    pass
+
+
+class Untyped(event_.Event):
+    def __init__(self, reason) -> None:  # type: ignore[no-untyped-def]
+        self.reason = reason
+
+
+def create_order() -> OrderPlaced:
+    return OrderPlaced(
+        order_id=uuid.uuid4(),
+        quantity=3,
+        weight=1.5,
+        express=True,
+        note=None,
+        tags=["gift", "fragile"],
+        dimensions=(1, 2, 3),
+        lines={"apple": 2, "pear": 1},
+        total=Money(decimal.Decimal("9.99"), Currency.EUR),
+        placed_at=datetime.datetime(2024, 1, 2, 3, 4, 5),
+        signature=b"\x00\xff",
+    )
+
+
+def assert_same_order(decoded: typing.Any, order: OrderPlaced) -> None:
+    assert isinstance(decoded, OrderPlaced)
+    for field in (
+        "order_id",
+        "quantity",
+        "weight",
+        "express",
+        "note",
+        "tags",
+        "dimensions",
+        "lines",
+        "placed_at",
+        "signature",
+    ):
+        assert getattr(decoded, field) == getattr(order, field)
+
+    assert decoded.total.amount == order.total.amount
+    assert decoded.total.currency is order.total.currency
+
+
+CODECS = [codec_impl.BinaryCodec, codec_impl.JsonCodec]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip(codec: typing.Callable[[], typing.Any]) -> None:
+    order = create_order()
+    encoder, decoder = codec(), codec()
+    assert_same_order(decoder.decode(encoder.encode(order)), order)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_round_trip_of_event_without_fields(
+    codec: typing.Callable[[], typing.Any],
+) -> None:
+    decoded = codec().decode(codec().encode(OrderCancelled()))
+    assert isinstance(decoded, OrderCancelled)
+
+
+def test_binary_batch_round_trip() -> None:
+    codec = codec_impl.BinaryCodec()
+    order = create_order()
+    decoded = codec.decode_batch(codec.encode_batch([order, OrderCancelled(), order]))
+    assert [type(event) for event in decoded] == [
+        OrderPlaced,
+        OrderCancelled,
+        OrderPlaced,
+    ]
+    assert_same_order(decoded[2], order)
+
+
+def test_schema_id_is_stable_across_registries() -> None:
+    first = codec_impl.SchemaRegistry().get_schema_id(OrderPlaced)
+    assert codec_impl.SchemaRegistry().get_schema_id(OrderPlaced) == first
+    assert codec_impl.SchemaRegistry().get_schema_id(OrderCancelled) != first
+
+
+def test_class_without_layout_is_rejected() -> None:
+    with pytest.raises(TypeError, match="reason"):
+        codec_impl.BinaryCodec().encode(Untyped("late"))
+
+
+def test_event_without_fields_is_emitted_through_event_log() -> None:
+    async def main() -> typing.List[typing.Any]:
+        event_log = event_log_impl.SqliteEventLog(codec=codec_impl.BinaryCodec())
+        event_emitter = event_emitter_impl.InMemoryEventEmitter(event_log=event_log)
+        await event_emitter.emit(OrderCancelled())
+        await event_log.flush()
+        records = await event_log.read(0, 10)
+        await event_log.close()
+        return [event for _, event in records]
+
+    (event,) = asyncio.run(main())
+    assert isinstance(event, OrderCancelled)
+
+
+def test_stores_do_not_pickle_by_default() -> None:
+    async def main() -> None:
+        outbox = outbox_impl.SqliteOutbox()
+        with pytest.raises(TypeError):
+            await outbox.append([Untyped("late")])
+
+        await outbox.close()
+
+        event_log = event_log_impl.SqliteEventLog()
+        with pytest.raises(TypeError):
+            event_log.append(Untyped("late"))
+
+        await event_log.close()
+
+    asyncio.run(main())
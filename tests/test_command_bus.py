@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+import warnings
+
+import pytest
+
+from freedom.domain import command as command_
+from freedom.domain import command_handler as command_handler_
+from freedom.domain import event as event_
+from freedom.infrastructure import command_bus as command_bus_impl
+
+
+class Resize(command_.Command):
+    pass
+
+
+class Repository:
+    pass
+
+
+class Resized(event_.Event):
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+
+
+@command_bus_impl.run_in_process
+class ProcessResizeHandler(command_handler_.CommandHandler[Resize]):
+    async def handle(self, command: Resize, /) -> command_handler_.CommandResult:
+        return command_handler_.CommandResult.success(events=[Resized(os.getpid())])
+
+
+def test_process_handler_with_dependencies_is_rejected() -> None:
+    with pytest.raises(TypeError, match="repository"):
+
+        @command_bus_impl.run_in_process
+        class ResizeHandler(command_handler_.CommandHandler[Resize]):
+            def __init__(self, repository: Repository) -> None:
+                self.repository = repository
+
+            async def handle(
+                self, command: Resize, /
+            ) -> command_handler_.CommandResult:
+                return command_handler_.CommandResult.success()
+
+
+def test_process_handler_is_checked_on_subscribe() -> None:
+    class ResizeHandler(command_handler_.CommandHandler[Resize]):
+        def __init__(self, repository: Repository) -> None:
+            self.repository = repository
+
+        async def handle(self, command: Resize, /) -> command_handler_.CommandResult:
+            return command_handler_.CommandResult.success()
+
+    setattr(ResizeHandler, command_bus_impl.RUN_IN_PROCESS_STR, True)
+    command_bus = command_bus_impl.InMemoryCommandBus()
+    with pytest.raises(TypeError, match="worker process"):
+        command_bus.subscribe(ResizeHandler, Resize)
+
+    assert command_bus.get_handler_for(Resize) is None
+
+
+def test_process_handler_runs_in_worker_process() -> None:
+    async def main() -> command_handler_.CommandResult:
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            command_bus = command_bus_impl.InMemoryCommandBus(executor=executor)
+            command_bus.subscribe(ProcessResizeHandler, Resize)
+            return await command_bus.execute(Resize())
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        result = asyncio.run(main())
+
+    assert result.is_success()
+    (event,) = result.events
+    assert isinstance(event, Resized)
+    assert event.pid != os.getpid()
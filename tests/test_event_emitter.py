@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+from freedom.domain import event as event_
+from freedom.domain import event_handler as event_handler_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+
+
+class AccountEvent(event_.Event):
+    def __init__(self, account: str = "a") -> None:
+        self.account = account
+
+
+class Deposited(AccountEvent):
+    pass
+
+
+class Withdrawn(AccountEvent):
+    pass
+
+
+def test_handler_of_base_event_receives_subclasses() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    received: typing.List[typing.Tuple[str, str]] = []
+
+    async def on_account_event(event: AccountEvent) -> None:
+        received.append(("base", type(event).__name__))
+
+    async def on_deposited(event: Deposited) -> None:
+        received.append(("deposited", type(event).__name__))
+
+    event_emitter.subscribe(on_account_event, AccountEvent)
+    event_emitter.subscribe(on_deposited, Deposited)
+
+    async def main() -> None:
+        await event_emitter.emit(Deposited())
+        await event_emitter.emit(Withdrawn())
+
+    asyncio.run(main())
+    # Handlers of the most derived type come first.
+    assert received == [
+        ("deposited", "Deposited"),
+        ("base", "Deposited"),
+        ("base", "Withdrawn"),
+    ]
+
+
+def test_handler_subscribed_to_base_and_subclass_runs_once() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    received: typing.List[event_.Event] = []
+
+    async def on_event(event: AccountEvent) -> None:
+        received.append(event)
+
+    event_emitter.subscribe(on_event, AccountEvent)
+    event_emitter.subscribe(on_event, Deposited)
+
+    async def main() -> None:
+        await event_emitter.emit(Deposited())
+
+    asyncio.run(main())
+    assert len(received) == 1
+
+
+def test_dispatch_table_follows_subscriptions() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    received: typing.List[event_.Event] = []
+
+    async def on_event(event: AccountEvent) -> None:
+        received.append(event)
+
+    async def main() -> None:
+        await event_emitter.emit(Deposited())
+        event_emitter.subscribe(on_event, AccountEvent)
+        await event_emitter.emit(Deposited())
+        event_emitter.unsubscribe(on_event, AccountEvent)
+        await event_emitter.emit(Deposited())
+
+    asyncio.run(main())
+    assert len(received) == 1
+
+
+def test_worker_pool_runs_handlers_by_priority() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(workers=1)
+    received: typing.List[str] = []
+
+    async def audit(event: Deposited) -> None:
+        received.append("audit")
+
+    @event_emitter_impl.priority(-1)
+    async def notify(event: Deposited) -> None:
+        received.append("notify")
+
+    event_emitter.subscribe(audit, Deposited)
+    event_emitter.subscribe(notify, Deposited)
+
+    async def main() -> None:
+        await event_emitter.emit(Deposited())
+        await event_emitter.close()
+
+    asyncio.run(main())
+    assert received == ["notify", "audit"]
+
+
+def test_worker_pool_handles_nested_emit() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(workers=1)
+    received: typing.List[event_.Event] = []
+
+    async def on_deposited(event: Deposited) -> None:
+        await event_emitter.emit(Withdrawn())
+
+    async def on_withdrawn(event: Withdrawn) -> None:
+        received.append(event)
+
+    event_emitter.subscribe(on_deposited, Deposited)
+    event_emitter.subscribe(on_withdrawn, Withdrawn)
+
+    async def main() -> None:
+        await asyncio.wait_for(event_emitter.emit(Deposited()), timeout=1)
+        await event_emitter.close()
+
+    asyncio.run(main())
+    assert len(received) == 1
+
+
+def test_worker_pool_caps_concurrency_per_event_type() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(
+        workers=4, concurrency_limits={AccountEvent: 1}
+    )
+    running = 0
+    peak = 0
+
+    async def on_event(event: AccountEvent) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    event_emitter.subscribe(on_event, AccountEvent)
+
+    async def main() -> None:
+        await asyncio.gather(
+            *(event_emitter.emit(Deposited()) for _ in range(3)),
+            event_emitter.emit(Withdrawn()),
+        )
+        await event_emitter.close()
+
+    asyncio.run(main())
+    assert peak == 1
+
+
+def test_close_fails_jobs_left_in_the_queue() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(workers=1)
+
+    async def main() -> typing.List[typing.Any]:
+        started = asyncio.Event()
+
+        async def on_deposited(event: Deposited) -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        event_emitter.subscribe(on_deposited, Deposited)
+        running = event_emitter.emit(Deposited())
+        queued = event_emitter.emit(Deposited())
+        await started.wait()
+        await event_emitter.close()
+        return await asyncio.gather(running, queued, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+BATCHES: typing.List[typing.List[str]] = []
+
+
+class DepositBatchHandler(event_handler_.BatchEventHandler[Deposited]):
+    max_batch_size = 3
+    max_latency = 0.01
+
+    async def handle_batch(self, events: typing.Sequence[Deposited], /) -> None:
+        BATCHES.append([event.account for event in events])
+        failures = [
+            (event, ValueError(event.account))
+            for event in events
+            if event.account == "bad"
+        ]
+        if failures:
+            raise event_handler_.BatchHandleError(failures)
+
+
+def test_batch_handler_flushes_on_size_and_latency() -> None:
+    BATCHES.clear()
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    event_emitter.subscribe(DepositBatchHandler, Deposited)
+
+    async def main() -> None:
+        await asyncio.gather(*(event_emitter.emit(Deposited(str(i))) for i in range(4)))
+
+    asyncio.run(main())
+    assert BATCHES == [["0", "1", "2"], ["3"]]
+
+
+def test_batch_handler_failures_are_reported_per_event() -> None:
+    BATCHES.clear()
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(dispatch_on_exc=False)
+    event_emitter.subscribe(DepositBatchHandler, Deposited)
+
+    async def main() -> typing.List[typing.Any]:
+        futures = [event_emitter.emit(Deposited(account)) for account in ("a", "bad")]
+        await event_emitter.flush()
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    good, bad = asyncio.run(main())
+    assert good == [None]
+    assert isinstance(bad, ValueError)
+    assert BATCHES == [["a", "bad"]]
+
+
+def test_wait_for_matches_key_and_predicate() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.Tuple[event_.Event, event_.Event]:
+        by_key = asyncio.ensure_future(
+            event_emitter.wait_for(Deposited, timeout=1, key=("account", "b"))
+        )
+        by_predicate = asyncio.ensure_future(
+            event_emitter.wait_for(
+                Deposited, timeout=1, predicate=lambda event: event.account == "c"
+            )
+        )
+        await asyncio.sleep(0)
+        for account in "abc":
+            await event_emitter.emit(Deposited(account))
+
+        return await by_key, await by_predicate
+
+    by_key, by_predicate = asyncio.run(main())
+    assert isinstance(by_key, Deposited) and by_key.account == "b"
+    assert isinstance(by_predicate, Deposited) and by_predicate.account == "c"
+
+
+def test_wait_for_any_and_all() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.Tuple[event_.Event, typing.List[event_.Event]]:
+        first = asyncio.ensure_future(
+            event_emitter.wait_for_any(
+                Deposited, timeout=1, attribute="account", values=["b", "c"]
+            )
+        )
+        every = asyncio.ensure_future(
+            event_emitter.wait_for_all(
+                Deposited, timeout=1, attribute="account", values=["c", "a"]
+            )
+        )
+        await asyncio.sleep(0)
+        for account in "abc":
+            await event_emitter.emit(Deposited(account))
+
+        return await first, await every
+
+    first, every = asyncio.run(main())
+    assert typing.cast(Deposited, first).account == "b"
+    assert [typing.cast(Deposited, event).account for event in every] == ["c", "a"]
+
+
+def test_wait_for_times_out() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> None:
+        with pytest.raises(asyncio.TimeoutError):
+            await event_emitter.wait_for(Deposited, timeout=0.001, key=("account", "a"))
+
+        # The timed out waiter is gone, a later one still gets its event.
+        waiter = asyncio.ensure_future(
+            event_emitter.wait_for(Deposited, timeout=1, key=("account", "a"))
+        )
+        await asyncio.sleep(0)
+        await event_emitter.emit(Deposited("a"))
+        await waiter
+
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import typing
+
+import pytest
+
+from freedom.domain import event as event_
+from freedom.infrastructure import event_log as event_log_impl
+from freedom.infrastructure import event_stream as event_stream_impl
+
+
+class Ticked(event_.Event):
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class Reset(event_.Event):
+    pass
+
+
+def values(events: typing.Iterable[event_.Event]) -> typing.List[int]:
+    return [typing.cast(Ticked, event).value for event in events]
+
+
+def test_event_log_survives_reopening(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "events.sqlite"
+
+    async def append() -> typing.List[int]:
+        event_log = event_log_impl.SqliteEventLog(path)
+        positions = [event_log.append(Ticked(value)) for value in range(3)]
+        await event_log.close()
+        return positions
+
+    async def reopen() -> typing.Tuple[int, typing.List[int], int]:
+        event_log = event_log_impl.SqliteEventLog(path)
+        last_position = event_log.last_position
+        records = await event_log.read(1, 10)
+        position = event_log.append(Ticked(3))
+        await event_log.close()
+        return last_position, values(event for _, event in records), position
+
+    assert asyncio.run(append()) == [1, 2, 3]
+    assert asyncio.run(reopen()) == (3, [1, 2], 4)
+
+
+def test_catch_up_stream_replays_then_follows_live_events() -> None:
+    async def main() -> typing.Tuple[typing.List[int], int]:
+        event_log = event_log_impl.SqliteEventLog()
+        for value in range(5):
+            event_log.append(Ticked(value))
+
+        stream = event_stream_impl.CatchUpStream(
+            event_log, Ticked, after=1, timeout=0.01, batch_size=2
+        )
+        with stream:
+            received = [await stream.__anext__() for _ in range(2)]
+            event_log.append(Reset())
+            event_log.append(Ticked(5))
+            received.extend([event async for event in stream])
+
+        await event_log.close()
+        return values(received), stream.position
+
+    assert asyncio.run(main()) == ([1, 2, 3, 4, 5], 7)
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected", "dropped"),
+    [
+        (event_stream_impl.OverflowPolicy.BLOCK, list(range(10)), 0),
+        (event_stream_impl.OverflowPolicy.DROP_NEWEST, [0, 1, 2], 7),
+        (event_stream_impl.OverflowPolicy.DROP_OLDEST, [0, 7, 8, 9], 7),
+    ],
+)
+def test_catch_up_stream_bounds_live_buffer(
+    overflow: event_stream_impl.OverflowPolicy,
+    expected: typing.List[int],
+    dropped: int,
+) -> None:
+    async def main() -> typing.Tuple[typing.List[int], int]:
+        event_log = event_log_impl.SqliteEventLog()
+        stream = event_stream_impl.CatchUpStream(
+            event_log, timeout=0.01, limit=3, overflow=overflow
+        )
+        with stream:
+            event_log.append(Ticked(0))
+            received = [await stream.__anext__()]
+            assert not stream.replaying
+            for value in range(1, 10):
+                event_log.append(Ticked(value))
+
+            received.extend([event async for event in stream])
+
+        await event_log.close()
+        return values(received), stream.dropped
+
+    assert asyncio.run(main()) == (expected, dropped)
+
+
+def test_catch_up_stream_overflowing_while_waiting_loses_nothing() -> None:
+    async def main() -> typing.List[int]:
+        event_log = event_log_impl.SqliteEventLog()
+        stream = event_stream_impl.CatchUpStream(event_log, timeout=0.01, limit=2)
+        with stream:
+            waiting = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0.001)
+            for value in range(5):
+                event_log.append(Ticked(value))
+
+            received = [await waiting]
+            received.extend([event async for event in stream])
+
+        await event_log.close()
+        return values(received)
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+from freedom.domain import event as event_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import event_stream as event_stream_impl
+
+
+class Ticked(event_.Event):
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class Reset(event_.Event):
+    pass
+
+
+def values(events: typing.Iterable[event_.Event]) -> typing.List[int]:
+    return [typing.cast(Ticked, event).value for event in events]
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [
+        (event_stream_impl.OverflowPolicy.DROP_NEWEST, [0, 1, 2]),
+        (event_stream_impl.OverflowPolicy.DROP_OLDEST, [2, 3, 4]),
+    ],
+)
+def test_full_stream_drops_by_policy(
+    overflow: event_stream_impl.OverflowPolicy, expected: typing.List[int]
+) -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> event_stream_impl.EventStream:
+        stream = event_stream_impl.EventStream(
+            event_emitter, Ticked, timeout=0, limit=3, overflow=overflow
+        )
+        with stream:
+            for value in range(5):
+                await event_emitter.emit(Ticked(value))
+
+            assert values([event async for event in stream]) == expected
+
+        return stream
+
+    stream = asyncio.run(main())
+    assert (stream.received, stream.dropped, stream.queued) == (5, 2, 0)
+
+
+def test_blocking_stream_holds_emit_until_consumed() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.List[int]:
+        stream = event_stream_impl.EventStream(
+            event_emitter,
+            Ticked,
+            timeout=0.01,
+            limit=1,
+            overflow=event_stream_impl.OverflowPolicy.BLOCK,
+        )
+        with stream:
+            await event_emitter.emit(Ticked(0))
+            blocked = asyncio.ensure_future(event_emitter.emit(Ticked(1)))
+            await asyncio.sleep(0)
+            assert stream.blocked == 1 and not blocked.done()
+
+            received = [await stream.__anext__()]
+            await blocked
+            received.append(await stream.__anext__())
+
+        return values(received)
+
+    assert asyncio.run(main()) == [0, 1]
+
+
+def test_closing_releases_blocked_emits() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> int:
+        stream = event_stream_impl.EventStream(
+            event_emitter,
+            Ticked,
+            timeout=0,
+            limit=1,
+            overflow=event_stream_impl.OverflowPolicy.BLOCK,
+        )
+        stream.open()
+        await event_emitter.emit(Ticked(0))
+        blocked = asyncio.ensure_future(event_emitter.emit(Ticked(1)))
+        await asyncio.sleep(0)
+        stream.close()
+        await asyncio.wait_for(blocked, timeout=1)
+        return stream.dropped
+
+    assert asyncio.run(main()) == 1
+
+
+def test_watermarks_fire_on_edges() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    marks: typing.List[str] = []
+
+    async def main() -> None:
+        stream = event_stream_impl.EventStream(
+            event_emitter,
+            Ticked,
+            timeout=0,
+            high_water_mark=3,
+            low_water_mark=1,
+            on_high_water=lambda _: marks.append("high"),
+            on_low_water=lambda _: marks.append("low"),
+        )
+        with stream:
+            for value in range(4):
+                await event_emitter.emit(Ticked(value))
+
+            await stream.__anext__()
+            await stream.__anext__()
+            assert marks == ["high"]
+            await stream.__anext__()
+            assert marks == ["high", "low"]
+
+    asyncio.run(main())
+
+
+def test_filter_rejects_events_before_they_are_queued() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> event_stream_impl.EventStream:
+        stream = event_stream_impl.EventStream(
+            event_emitter, Ticked, timeout=0, limit=2
+        ).filter(lambda event: typing.cast(Ticked, event).value % 2 == 0)
+        with stream:
+            for value in range(5):
+                await event_emitter.emit(Ticked(value))
+
+            # The odd ones never took room, so only the limit dropped 4.
+            assert values([event async for event in stream]) == [0, 2]
+
+        return stream
+
+    stream = asyncio.run(main())
+    assert (stream.received, stream.dropped) == (3, 1)
+
+
+def test_filter_applies_to_queued_events() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.List[int]:
+        with event_stream_impl.EventStream(event_emitter, Ticked, timeout=0) as stream:
+            for value in range(4):
+                await event_emitter.emit(Ticked(value))
+
+            stream.filter(lambda event: typing.cast(Ticked, event).value > 1)
+            return values([event async for event in stream])
+
+    assert asyncio.run(main()) == [2, 3]
+
+
+def test_stream_of_several_event_types() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.List[typing.Type[event_.Event]]:
+        stream = event_stream_impl.EventStream(
+            event_emitter, [Ticked, Reset], timeout=0
+        )
+        with stream:
+            await event_emitter.emit(Ticked(0))
+            await event_emitter.emit(Reset())
+            await event_emitter.emit(Ticked(1))
+            received = [type(event) async for event in stream]
+
+        # Closed streams stop receiving from every type.
+        await event_emitter.emit(Reset())
+        assert stream.queued == 0
+        return received
+
+    assert asyncio.run(main()) == [Ticked, Reset, Ticked]
+
+
+def test_batches_are_bounded_by_size() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.List[typing.List[int]]:
+        with event_stream_impl.EventStream(event_emitter, Ticked, timeout=0) as stream:
+            for value in range(5):
+                await event_emitter.emit(Ticked(value))
+
+            return [
+                values(batch)
+                async for batch in stream.batches(max_size=2, max_latency=0)
+            ]
+
+    assert asyncio.run(main()) == [[0, 1], [2, 3], [4]]
+
+
+def test_batch_waits_for_more_events_up_to_latency() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> typing.List[typing.List[int]]:
+        async def emit_later() -> None:
+            await event_emitter.emit(Ticked(0))
+            await asyncio.sleep(0.005)
+            await event_emitter.emit(Ticked(1))
+
+        stream = event_stream_impl.EventStream(event_emitter, Ticked, timeout=0.1)
+        with stream:
+            producer = asyncio.ensure_future(emit_later())
+            batches = stream.batches(max_size=10, max_latency=0.05)
+            batch = await batches.__anext__()
+            await producer
+            return [values(batch)]
+
+    assert asyncio.run(main()) == [[0, 1]]
+
+
+def test_batches_require_open_stream() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    stream = event_stream_impl.EventStream(event_emitter, Ticked, timeout=0)
+
+    async def main() -> None:
+        async for _ in stream.batches():
+            pass
+
+    with pytest.raises(TypeError):
+        asyncio.run(main())
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import typing
+
+from freedom.application import inbox as inbox_
+from freedom.domain import entity_id
+from freedom.domain import event as event_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import inbox as inbox_impl
+
+
+class Paid(event_.Event):
+    def __init__(self, event_id: typing.Any) -> None:
+        self.event_id = event_id
+
+
+def test_redelivered_event_is_handled_once_per_handler() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(
+        inbox=inbox_impl.InMemoryInbox()
+    )
+    received: typing.List[str] = []
+
+    async def send_receipt(event: Paid) -> None:
+        received.append("receipt")
+
+    async def update_ledger(event: Paid) -> None:
+        received.append("ledger")
+
+    event_emitter.subscribe(send_receipt, Paid)
+    event_emitter.subscribe(update_ledger, Paid)
+
+    async def main() -> None:
+        # Value object ids are matched by value, not by identity.
+        await event_emitter.emit(Paid(entity_id.EntityIdSequential(1)))
+        await event_emitter.emit(Paid(entity_id.EntityIdSequential(1)))
+        await event_emitter.emit(Paid(entity_id.EntityIdSequential(2)))
+
+    asyncio.run(main())
+    assert sorted(received) == ["ledger", "ledger", "receipt", "receipt"]
+
+
+def test_events_without_id_are_always_handled() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(
+        inbox=inbox_impl.InMemoryInbox()
+    )
+    received: typing.List[Paid] = []
+
+    async def on_paid(event: Paid) -> None:
+        received.append(event)
+
+    event_emitter.subscribe(on_paid, Paid)
+
+    async def main() -> None:
+        await event_emitter.emit(Paid(None))
+        await event_emitter.emit(Paid(None))
+
+    asyncio.run(main())
+    assert len(received) == 2
+
+
+def test_failed_handler_sees_the_event_again() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(
+        inbox=inbox_impl.InMemoryInbox(), dispatch_on_exc=False
+    )
+    attempts = 0
+
+    async def on_paid(event: Paid) -> None:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionError
+
+    event_emitter.subscribe(on_paid, Paid)
+
+    async def main() -> None:
+        try:
+            await event_emitter.emit(Paid("a"))
+        except ConnectionError:
+            pass
+
+        await event_emitter.emit(Paid("a"))
+        await event_emitter.emit(Paid("a"))
+
+    asyncio.run(main())
+    assert attempts == 2
+
+
+def test_in_memory_inbox_is_bounded() -> None:
+    inbox = inbox_impl.InMemoryInbox(max_size=10)
+
+    async def main() -> None:
+        for i in range(100):
+            await inbox.add(i, "handler")
+
+    asyncio.run(main())
+    assert len(inbox) <= 10
+
+
+def test_sqlite_inbox_survives_reopening(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "inbox.sqlite"
+
+    async def add() -> None:
+        inbox = inbox_impl.SqliteInbox(path)
+        await inbox.add("a", "handler")
+        await inbox.close()
+
+    async def contains() -> typing.List[bool]:
+        inbox = inbox_impl.SqliteInbox(path, max_size=2)
+        found = [
+            await inbox.contains("a", "handler"),
+            await inbox.contains("a", "other"),
+            await inbox.contains("b", "handler"),
+        ]
+        await inbox.close()
+        return found
+
+    asyncio.run(add())
+    assert asyncio.run(contains()) == [True, False, False]
+
+
+def test_inbox_name_overrides_handler_name() -> None:
+    @inbox_.inbox_name("receipts")
+    async def send_receipt(event: Paid) -> None:
+        pass
+
+    assert inbox_.get_handler_name(send_receipt) == "receipts"
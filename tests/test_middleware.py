@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+from freedom.domain import command as command_
+from freedom.domain import command_handler as command_handler_
+from freedom.infrastructure import middleware as middleware_impl
+
+
+async def execute(message: typing.Any, _: typing.Any) -> typing.Any:
+    return message
+
+
+def recorder(
+    calls: typing.List[str], name: str
+) -> typing.Callable[[typing.Any, typing.Any], typing.Awaitable[typing.Any]]:
+    async def middleware(
+        message: typing.Any, next_middleware: typing.Any
+    ) -> typing.Any:
+        calls.append(name)
+        return await next_middleware(message)
+
+    return middleware
+
+
+def test_chain_runs_middlewares_in_order() -> None:
+    calls: typing.List[str] = []
+    chain = middleware_impl.MiddlewareChain(
+        execute, [recorder(calls, "first"), recorder(calls, "second")]
+    )
+
+    assert asyncio.run(chain("message")) == "message"
+    assert calls == ["first", "second"]
+
+
+def test_chain_is_compiled_once_and_on_change() -> None:
+    calls: typing.List[str] = []
+    chain = middleware_impl.MiddlewareChain(execute)
+    compiled = chain.chain
+    asyncio.run(chain("message"))
+    assert chain.chain is compiled
+
+    chain.add_middleware(recorder(calls, "added"))
+    assert chain.chain is not compiled
+    asyncio.run(chain("message"))
+    assert calls == ["added"]
+
+
+def test_remove_middleware_removes_one_occurrence() -> None:
+    calls: typing.List[str] = []
+    middleware = recorder(calls, "twice")
+    chain = middleware_impl.MiddlewareChain(execute, [middleware, middleware])
+
+    chain.remove_middleware(middleware)
+    assert chain.middlewares == (middleware,)
+    asyncio.run(chain("message"))
+    assert calls == ["twice"]
+
+    chain.remove_middleware(middleware)
+    with pytest.raises(ValueError):
+        chain.remove_middleware(middleware)
+
+
+class Charge(command_.Command):
+    def __init__(self, idempotency_key: str) -> None:
+        self.idempotency_key = idempotency_key
+
+
+class Handler:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(
+        self, message: typing.Any, _: typing.Any = None
+    ) -> command_handler_.CommandResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return command_handler_.CommandResult.success(entity_id=self.calls)
+
+
+def test_idempotency_replays_stored_result() -> None:
+    now = 0.0
+    handler = Handler()
+    middleware = middleware_impl.IdempotencyMiddleware(ttl=10.0, clock=lambda: now)
+    chain = middleware_impl.MiddlewareChain(handler, [middleware])
+
+    async def main() -> None:
+        nonlocal now
+        assert (await chain(Charge("a"))).entity_id == 1
+        assert (await chain(Charge("a"))).entity_id == 1
+        assert (await chain(Charge("b"))).entity_id == 2
+        now = 11.0
+        assert (await chain(Charge("a"))).entity_id == 3
+
+    asyncio.run(main())
+    assert (middleware.hits, middleware.misses) == (1, 3)
+
+
+def test_idempotency_is_bounded() -> None:
+    middleware = middleware_impl.IdempotencyMiddleware(max_size=2)
+    chain = middleware_impl.MiddlewareChain(Handler(), [middleware])
+
+    async def main() -> None:
+        for key in "abc":
+            await chain(Charge(key))
+
+    asyncio.run(main())
+    assert len(middleware) == 2
+
+
+def test_idempotency_runs_concurrent_duplicates_once() -> None:
+    handler = Handler(delay=0.01)
+    chain = middleware_impl.MiddlewareChain(
+        handler, [middleware_impl.IdempotencyMiddleware()]
+    )
+
+    async def main() -> typing.List[command_handler_.CommandResult]:
+        return await asyncio.gather(chain(Charge("a")), chain(Charge("a")))
+
+    first, second = asyncio.run(main())
+    assert handler.calls == 1
+    assert first.entity_id == second.entity_id == 1
+
+
+def test_idempotency_duplicate_runs_command_when_first_caller_is_cancelled() -> None:
+    handler = Handler(delay=0.01)
+    chain = middleware_impl.MiddlewareChain(
+        handler, [middleware_impl.IdempotencyMiddleware()]
+    )
+
+    async def main() -> command_handler_.CommandResult:
+        first = asyncio.ensure_future(chain(Charge("a")))
+        second = asyncio.ensure_future(chain(Charge("a")))
+        third = asyncio.ensure_future(chain(Charge("a")))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert (await third).entity_id == 2
+        return await second
+
+    assert asyncio.run(main()).entity_id == 2
+    assert handler.calls == 2
+
+
+def admission_chain(
+    handler: Handler, **kwargs: typing.Any
+) -> typing.Tuple[
+    middleware_impl.MiddlewareChain, middleware_impl.AdmissionControlMiddleware
+]:
+    middleware = middleware_impl.AdmissionControlMiddleware(**kwargs)
+    return middleware_impl.MiddlewareChain(handler, [middleware]), middleware
+
+
+def test_admission_rejects_beyond_queue_bound() -> None:
+    chain, middleware = admission_chain(
+        Handler(delay=0.01), max_in_flight=1, max_queue=1
+    )
+
+    async def main() -> typing.List[typing.Any]:
+        return await asyncio.gather(
+            *(chain(Charge(str(i))) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert isinstance(results[2], middleware_impl.AdmissionRejectedError)
+    assert [result.entity_id for result in results[:2]] == [1, 2]
+    assert (middleware.admitted, middleware.rejected) == (2, 1)
+    assert (middleware.in_flight, middleware.queue_depth) == (0, 0)
+
+
+def test_admission_queue_is_bounded_by_default() -> None:
+    chain, middleware = admission_chain(Handler(), max_in_flight=1)
+
+    async def main() -> typing.List[typing.Any]:
+        return await asyncio.gather(
+            *(chain(Charge(str(i))) for i in range(1100)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert middleware.rejected > 0
+    assert any(
+        isinstance(result, middleware_impl.AdmissionRejectedError) for result in results
+    )
+
+
+def test_admission_reject_policy_does_not_queue() -> None:
+    chain, middleware = admission_chain(
+        Handler(delay=0.01),
+        max_in_flight=1,
+        policy=middleware_impl.AdmissionPolicy.REJECT,
+    )
+
+    async def main() -> typing.List[typing.Any]:
+        return await asyncio.gather(
+            chain(Charge("a")), chain(Charge("b")), return_exceptions=True
+        )
+
+    _, rejected = asyncio.run(main())
+    assert isinstance(rejected, middleware_impl.AdmissionRejectedError)
+
+
+def test_admission_timeout_rejects_waiter() -> None:
+    chain, middleware = admission_chain(
+        Handler(delay=0.05), max_in_flight=1, timeout=0.001
+    )
+
+    async def main() -> typing.List[typing.Any]:
+        return await asyncio.gather(
+            chain(Charge("a")), chain(Charge("b")), return_exceptions=True
+        )
+
+    _, rejected = asyncio.run(main())
+    assert isinstance(rejected, middleware_impl.AdmissionRejectedError)
+    assert middleware.in_flight == 0
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import typing
+
+from freedom.domain import event as event_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import outbox as outbox_impl
+
+
+class Shipped(event_.Event):
+    def __init__(self, order: int) -> None:
+        self.order = order
+
+
+def test_outbox_persists_until_acknowledged(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "outbox.sqlite"
+
+    async def append() -> None:
+        outbox = outbox_impl.SqliteOutbox(path)
+        await outbox.append([Shipped(1), Shipped(2), Shipped(3)])
+        records = await outbox.fetch(2)
+        await outbox.acknowledge(records[0][0])
+        await outbox.close()
+
+    async def reopen() -> typing.List[int]:
+        outbox = outbox_impl.SqliteOutbox(path)
+        records = await outbox.fetch(10)
+        await outbox.close()
+        return [typing.cast(Shipped, event).order for _, event in records]
+
+    asyncio.run(append())
+    assert asyncio.run(reopen()) == [2, 3]
+
+
+def test_relay_emits_and_acknowledges_in_batches() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    received: typing.List[int] = []
+
+    async def on_shipped(event: Shipped) -> None:
+        received.append(event.order)
+
+    event_emitter.subscribe(on_shipped, Shipped)
+
+    async def main() -> int:
+        outbox = outbox_impl.SqliteOutbox()
+        relay = outbox_impl.OutboxRelay(outbox, event_emitter, batch_size=2)
+        await outbox.append([Shipped(i) for i in range(3)])
+        assert await relay.relay_once() == 2
+        assert await relay.relay_once() == 1
+        assert await relay.relay_once() == 0
+        await outbox.close()
+        return relay.relayed
+
+    assert asyncio.run(main()) == 3
+    assert received == [0, 1, 2]
+
+
+def test_relay_redelivers_events_that_failed() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter(dispatch_on_exc=False)
+    received: typing.List[int] = []
+
+    async def on_shipped(event: Shipped) -> None:
+        if event.order == 1 and 1 not in received:
+            received.append(event.order)
+            raise ConnectionError
+
+        received.append(event.order)
+
+    event_emitter.subscribe(on_shipped, Shipped)
+
+    async def main() -> None:
+        outbox = outbox_impl.SqliteOutbox()
+        relay = outbox_impl.OutboxRelay(outbox, event_emitter)
+        await outbox.append([Shipped(0), Shipped(1), Shipped(2)])
+        try:
+            await relay.relay_once()
+        except ConnectionError:
+            pass
+
+        assert await relay.relay_once() == 2
+        await outbox.close()
+
+    asyncio.run(main())
+    assert received == [0, 1, 1, 2]
+
+
+def test_started_relay_picks_up_appended_events() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+
+    async def main() -> int:
+        received: asyncio.Queue[Shipped] = asyncio.Queue()
+
+        async def on_shipped(event: Shipped) -> None:
+            received.put_nowait(event)
+
+        event_emitter.subscribe(on_shipped, Shipped)
+        outbox = outbox_impl.SqliteOutbox()
+        relay = outbox_impl.OutboxRelay(outbox, event_emitter, poll_interval=10)
+        relay.start()
+        assert relay.running
+        await outbox.append([Shipped(7)])
+        event = await asyncio.wait_for(received.get(), timeout=1)
+        await relay.stop()
+        assert not relay.running
+        await outbox.close()
+        return event.order
+
+    assert asyncio.run(main()) == 7
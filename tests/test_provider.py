@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from freedom.application import lifetime
+from freedom.infrastructure import provider as provider_impl
+
+
+class Clock:
+    pass
+
+
+class Mailer:
+    pass
+
+
+class Handler:
+    def __init__(self, clock: Clock, mailer: Mailer) -> None:
+        self.clock = clock
+        self.mailer = mailer
+
+
+def test_injection_plan_is_compiled_once() -> None:
+    provider = provider_impl.InMemoryDependencyProvider()
+
+    plan = provider.compile_handler(Handler)
+    assert dict(plan) == {"clock": Clock, "mailer": Mailer}
+    assert provider.compile_handler(Handler) is plan
+
+
+def test_resolved_dependencies_are_cached_until_registered_again() -> None:
+    clock = Clock()
+    provider = provider_impl.InMemoryDependencyProvider(
+        {Clock: clock, Mailer: Mailer()}
+    )
+
+    resolved = provider.get_handler_dependencies(Handler)
+    assert resolved["clock"] is clock
+    assert provider.get_handler_dependencies(Handler) is resolved
+
+    other_clock = Clock()
+    provider.register_dependency(Clock, other_clock)
+    assert provider.get_handler_dependencies(Handler)["clock"] is other_clock
+
+
+def test_scoped_dependency_is_created_once_per_scope() -> None:
+    provider = provider_impl.InMemoryDependencyProvider({Clock: Clock()})
+    provider.register_scoped_dependency(Mailer, Mailer)
+
+    token = lifetime.enter_scope()
+    try:
+        resolved = provider.get_handler_dependencies(Handler)
+        assert provider.get_handler_dependencies(Handler) is resolved
+        assert provider.get_dependency(Mailer) is resolved["mailer"]
+    finally:
+        lifetime.exit_scope(token)
+
+    token = lifetime.enter_scope()
+    try:
+        mailer = provider.get_handler_dependencies(Handler)["mailer"]
+        assert mailer is not resolved["mailer"]
+    finally:
+        lifetime.exit_scope(token)
+
+    # Outside of any scope every resolution gets a fresh instance.
+    assert provider.get_dependency(Mailer) is not provider.get_dependency(Mailer)
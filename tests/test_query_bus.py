@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from freedom.domain import event as event_
+from freedom.domain import query as query_
+from freedom.domain import query_handler as query_handler_
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import query_bus as query_bus_impl
+
+BALANCES: typing.Dict[str, int] = {}
+
+
+class GetBalance(query_.Query):
+    def __init__(self, account: str) -> None:
+        self.account = account
+
+
+class GetAccounts(query_.Query):
+    pass
+
+
+class Deposited(event_.Event):
+    pass
+
+
+class LargeDeposited(Deposited):
+    pass
+
+
+class GetBalanceHandler(query_handler_.QueryHandler[GetBalance, int]):
+    async def handle(self, query: GetBalance, /) -> int:
+        return BALANCES[query.account]
+
+
+class GetAccountsHandler(query_handler_.QueryHandler[GetAccounts, int]):
+    async def handle(self, query: GetAccounts, /) -> int:
+        return len(BALANCES)
+
+
+def create_query_bus(
+    event_emitter: event_emitter_impl.InMemoryEventEmitter,
+) -> query_bus_impl.InMemoryQueryBus:
+    BALANCES.clear()
+    BALANCES["a"] = 1
+    query_bus = query_bus_impl.InMemoryQueryBus(emitter=event_emitter)
+    query_bus.subscribe(GetBalanceHandler, GetBalance, invalidated_by=[Deposited])
+    query_bus.subscribe(GetAccountsHandler, GetAccounts)
+    return query_bus
+
+
+def test_results_are_cached_until_invalidated_by_event() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    query_bus = create_query_bus(event_emitter)
+
+    async def main() -> None:
+        assert await query_bus.execute(GetBalance("a")) == 1
+        BALANCES["a"] = 2
+        assert await query_bus.execute(GetBalance("a")) == 1
+        # Subclasses of the declared event invalidate as well.
+        await event_emitter.emit(LargeDeposited())
+        assert await query_bus.execute(GetBalance("a")) == 2
+
+    asyncio.run(main())
+    assert (query_bus.hits, query_bus.misses) == (1, 2)
+
+
+def test_queries_without_invalidating_events_are_not_cached() -> None:
+    query_bus = create_query_bus(event_emitter_impl.InMemoryEventEmitter())
+
+    async def main() -> None:
+        assert await query_bus.execute(GetAccounts()) == 1
+        BALANCES["b"] = 0
+        assert await query_bus.execute(GetAccounts()) == 2
+
+    asyncio.run(main())
+    assert query_bus.hits == 0
+
+
+def test_unsubscribe_removes_event_listener_with_last_query() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    query_bus = create_query_bus(event_emitter)
+    assert event_emitter.get_handler_for(Deposited)
+
+    query_bus.unsubscribe(GetBalance)
+    assert not event_emitter.get_handler_for(Deposited)
+    assert query_bus.get_handler_for(GetBalance) is None
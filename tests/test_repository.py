@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from freedom.domain import aggregate as aggregate_
+from freedom.domain import entity_id
+from freedom.domain import event as event_
+from freedom.infrastructure import repository as repository_impl
+
+
+class Renamed(event_.Event):
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Product(aggregate_.AggregateRoot[entity_id.EntityIdSequential]):
+    def rename(self, name: str) -> None:
+        self.record_that(Renamed(name))
+
+
+class ProductRepository(repository_impl.InMemoryRepository[typing.Any, Product]):
+    pass
+
+
+def names(events: typing.Iterable[event_.Event]) -> typing.List[str]:
+    return [typing.cast(Renamed, event).name for event in events]
+
+
+def test_collect_events_of_touched_aggregates_in_touch_order() -> None:
+    ids = [entity_id.EntityIdSequential(i) for i in range(3)]
+
+    async def main() -> typing.List[typing.List[str]]:
+        repository = ProductRepository()
+        products = [Product(id_) for id_ in ids]
+        for product in products:
+            await repository.insert(product)
+
+        products[2].rename("c")
+        products[0].rename("a")
+        products[2].rename("cc")
+        collected = [names(repository.collect_events())]
+        # Collected events are gone, untouched aggregates stay clean.
+        collected.append(names(repository.collect_events()))
+        products[1].rename("b")
+        collected.append(names(repository.collect_events()))
+        return collected
+
+    assert asyncio.run(main()) == [["c", "cc", "a"], [], ["b"]]
+
+
+def test_events_recorded_before_insert_are_collected() -> None:
+    async def main() -> typing.List[str]:
+        repository = ProductRepository()
+        product = Product(entity_id.EntityIdSequential(1))
+        product.rename("created")
+        await repository.insert(product)
+        return names(repository.collect_events())
+
+    assert asyncio.run(main()) == ["created"]
+
+
+def test_replaced_and_removed_aggregates_are_no_longer_tracked() -> None:
+    product_id = entity_id.EntityIdSequential(1)
+
+    async def main() -> typing.List[str]:
+        repository = ProductRepository()
+        original = Product(product_id)
+        await repository.insert(original)
+        original.rename("stale")
+
+        replacement = Product(product_id)
+        await repository.save(replacement)
+        original.rename("ignored")
+        replacement.rename("fresh")
+        collected = names(repository.collect_events())
+
+        await repository.remove(replacement)
+        replacement.rename("removed")
+        assert repository.collect_events() == []
+        return collected
+
+    assert asyncio.run(main()) == ["fresh"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from freedom.domain import command as command_
+from freedom.domain import command_handler as command_handler_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import scheduler as scheduler_impl
+
+LOG: typing.List[typing.Tuple[str, int]] = []
+
+
+class Withdraw(command_.Command):
+    def __init__(self, aggregate_id: str, sequence: int, delay: float) -> None:
+        self.aggregate_id = aggregate_id
+        self.sequence = sequence
+        self.delay = delay
+
+
+class WithdrawHandler(command_handler_.CommandHandler[Withdraw]):
+    async def handle(self, command: Withdraw, /) -> command_handler_.CommandResult:
+        LOG.append(("start", command.sequence))
+        await asyncio.sleep(command.delay)
+        LOG.append(("end", command.sequence))
+        return command_handler_.CommandResult.success()
+
+
+def create_command_bus(max_workers: int) -> scheduler_impl.PartitionedCommandBus:
+    LOG.clear()
+    command_bus = command_bus_impl.InMemoryCommandBus()
+    command_bus.subscribe(WithdrawHandler, Withdraw)
+    return scheduler_impl.PartitionedCommandBus(command_bus, max_workers=max_workers)
+
+
+def test_commands_of_one_aggregate_run_in_order() -> None:
+    command_bus = create_command_bus(max_workers=4)
+
+    async def main() -> None:
+        await asyncio.gather(
+            command_bus.execute(Withdraw("a", 1, 0.02)),
+            command_bus.execute(Withdraw("a", 2, 0.0)),
+            command_bus.execute(Withdraw("a", 3, 0.01)),
+        )
+
+    asyncio.run(main())
+    assert LOG == [
+        ("start", 1),
+        ("end", 1),
+        ("start", 2),
+        ("end", 2),
+        ("start", 3),
+        ("end", 3),
+    ]
+    assert command_bus.partitions == 0
+
+
+def test_commands_of_different_aggregates_run_in_parallel() -> None:
+    command_bus = create_command_bus(max_workers=4)
+
+    async def main() -> None:
+        await asyncio.gather(
+            command_bus.execute(Withdraw("a", 1, 0.01)),
+            command_bus.execute(Withdraw("b", 2, 0.01)),
+        )
+
+    asyncio.run(main())
+    assert LOG[:2] == [("start", 1), ("start", 2)]
+
+
+def test_max_workers_bounds_parallel_partitions() -> None:
+    command_bus = create_command_bus(max_workers=1)
+
+    async def main() -> None:
+        await asyncio.gather(
+            command_bus.execute(Withdraw("a", 1, 0.01)),
+            command_bus.execute(Withdraw("b", 2, 0.01)),
+        )
+
+    asyncio.run(main())
+    assert LOG == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+def test_cancelled_command_keeps_its_partition_in_order() -> None:
+    command_bus = create_command_bus(max_workers=4)
+
+    async def main() -> None:
+        first = asyncio.ensure_future(command_bus.execute(Withdraw("a", 1, 0.02)))
+        second = asyncio.ensure_future(command_bus.execute(Withdraw("a", 2, 0.0)))
+        third = asyncio.ensure_future(command_bus.execute(Withdraw("a", 3, 0.0)))
+        await asyncio.sleep(0)
+        second.cancel()
+        await asyncio.gather(first, second, third, return_exceptions=True)
+
+    asyncio.run(main())
+    assert LOG == [("start", 1), ("end", 1), ("start", 3), ("end", 3)]
+    assert command_bus.partitions == 0
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+from freedom.application import application as application_
+from freedom.application import unit_of_work as unit_of_work_
+from freedom.domain import aggregate as aggregate_
+from freedom.domain import command as command_
+from freedom.domain import command_handler as command_handler_
+from freedom.domain import entity_id
+from freedom.domain import event as event_
+from freedom.infrastructure import command_bus as command_bus_impl
+from freedom.infrastructure import event_emitter as event_emitter_impl
+from freedom.infrastructure import outbox as outbox_impl
+from freedom.infrastructure import provider as provider_impl
+from freedom.infrastructure import repository as repository_impl
+
+ACCOUNT_ID: typing.Final[entity_id.EntityIdSequential] = entity_id.EntityIdSequential(1)
+
+
+class Deposited(event_.Event):
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+class Account(aggregate_.AggregateRoot[entity_id.EntityIdSequential]):
+    def __init__(self, id: entity_id.EntityIdSequential) -> None:
+        super().__init__(id)
+        self.balance = 0
+
+    def deposit(self, amount: int) -> None:
+        self.balance += amount
+        self.record_that(Deposited(amount))
+
+
+class AccountRepository(repository_impl.InMemoryRepository[typing.Any, Account]):
+    pass
+
+
+class Deposit(command_.Command):
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+class DepositHandler(command_handler_.CommandHandler[Deposit]):
+    def __init__(self, repository: AccountRepository) -> None:
+        self.repository = repository
+
+    async def handle(self, command: Deposit, /) -> command_handler_.CommandResult:
+        account = await self.repository.get_by_id(ACCOUNT_ID)
+        assert account is not None
+        account.deposit(command.amount)
+        if account.balance < 0:
+            return command_handler_.CommandResult.failure("Insufficient funds.")
+
+        await self.repository.save(account)
+        return command_handler_.CommandResult.success()
+
+
+def create_application(
+    repository: AccountRepository,
+    event_emitter: event_emitter_impl.InMemoryEventEmitter,
+    outbox: typing.Optional[outbox_impl.SqliteOutbox] = None,
+    use_unit_of_work: bool = True,
+) -> application_.Application:
+    provider = provider_impl.InMemoryDependencyProvider()
+    if use_unit_of_work:
+        provider.register_scoped_dependency(
+            AccountRepository, unit_of_work_.tracked(repository)
+        )
+    else:
+        provider.register_dependency(AccountRepository, repository)
+
+    command_bus = command_bus_impl.InMemoryCommandBus(provider=provider)
+    command_bus.subscribe(DepositHandler, Deposit)
+    return application_.Application(
+        "test",
+        1,
+        command_bus=command_bus,
+        event_emitter=event_emitter,
+        dependency_provider=provider,
+        outbox=outbox,
+    )
+
+
+async def open_account() -> AccountRepository:
+    repository = AccountRepository()
+    await repository.insert(Account(ACCOUNT_ID))
+    return repository
+
+
+def test_rolled_back_command_dispatches_no_events() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    amounts: typing.List[int] = []
+
+    async def on_deposited(event: Deposited) -> None:
+        amounts.append(event.amount)
+
+    event_emitter.subscribe(on_deposited, Deposited)
+
+    async def main() -> None:
+        application = create_application(await open_account(), event_emitter)
+        assert (await application.execute_command(Deposit(5))).is_success()
+        assert not (await application.execute_command(Deposit(-8))).is_success()
+
+    asyncio.run(main())
+    assert amounts == [5]
+
+
+def test_rolled_back_command_leaves_stored_aggregate_untouched() -> None:
+    async def main() -> typing.Tuple[int, int]:
+        repository = await open_account()
+        stored = await repository.get_by_id(ACCOUNT_ID)
+        assert stored is not None
+        application = create_application(
+            repository, event_emitter_impl.InMemoryEventEmitter()
+        )
+        await application.execute_command(Deposit(5))
+        await application.execute_command(Deposit(-8))
+        after_rollback = await repository.get_by_id(ACCOUNT_ID)
+        assert after_rollback is not None
+        return stored.balance, after_rollback.balance
+
+    assert asyncio.run(main()) == (0, 5)
+
+
+def test_failed_command_without_unit_of_work_dispatches_no_events() -> None:
+    event_emitter = event_emitter_impl.InMemoryEventEmitter()
+    amounts: typing.List[int] = []
+
+    async def on_deposited(event: Deposited) -> None:
+        amounts.append(event.amount)
+
+    event_emitter.subscribe(on_deposited, Deposited)
+
+    async def main() -> None:
+        application = create_application(
+            await open_account(), event_emitter, use_unit_of_work=False
+        )
+        assert (await application.execute_command(Deposit(5))).is_success()
+        assert not (await application.execute_command(Deposit(-8))).is_success()
+
+    asyncio.run(main())
+    assert amounts == [5]
+
+
+def test_rolled_back_command_appends_no_events_to_outbox() -> None:
+    async def main() -> typing.List[int]:
+        outbox = outbox_impl.SqliteOutbox()
+        application = create_application(
+            await open_account(),
+            event_emitter_impl.InMemoryEventEmitter(),
+            outbox,
+        )
+        await application.execute_command(Deposit(5))
+        await application.execute_command(Deposit(-8))
+        records = await outbox.fetch(10)
+        await outbox.close()
+        return [event.amount for _, event in records]
+
+    assert asyncio.run(main()) == [5]
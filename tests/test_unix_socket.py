@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import pathlib
+import struct
+import typing
+
+import pytest
+
+from freedom.domain import event as event_
+from freedom.infrastructure import codec as codec_impl
+from freedom.infrastructure import unix_socket as unix_socket_impl
+
+
+class Shipped(event_.Event):
+    def __init__(self, order: int) -> None:
+        self.order = order
+
+
+async def wait_received(
+    emitter: unix_socket_impl.UnixSocketEventEmitter, count: int
+) -> None:
+    while emitter.received < count:
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.parametrize(
+    "codec", [codec_impl.PickleCodec, codec_impl.BinaryCodec, codec_impl.JsonCodec]
+)
+def test_events_fan_out_through_broker(
+    tmp_path: pathlib.Path, codec: typing.Callable[[], typing.Any]
+) -> None:
+    path = tmp_path / "broker.sock"
+
+    async def main() -> typing.Tuple[typing.List[int], typing.List[int]]:
+        sender = unix_socket_impl.UnixSocketEventEmitter(path, codec=codec())
+        receiver = unix_socket_impl.UnixSocketEventEmitter(path, codec=codec())
+        local: typing.List[int] = []
+        remote: typing.List[int] = []
+
+        async def on_sent(event: Shipped) -> None:
+            local.append(event.order)
+
+        async def on_received(event: Shipped) -> None:
+            remote.append(event.order)
+
+        sender.subscribe(on_sent, Shipped)
+        receiver.subscribe(on_received, Shipped)
+        async with unix_socket_impl.UnixSocketBroker(path):
+            await sender.connect()
+            await receiver.connect()
+            for order in range(3):
+                await sender.emit(Shipped(order))
+
+            await sender.flush()
+            await asyncio.wait_for(wait_received(receiver, 3), timeout=1)
+            await sender.close()
+            await receiver.close()
+
+        return local, remote
+
+    local, remote = asyncio.run(main())
+    assert local == remote == [0, 1, 2]
+
+
+def test_malformed_frame_is_skipped(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    path = tmp_path / "broker.sock"
+
+    async def main() -> typing.List[int]:
+        receiver = unix_socket_impl.UnixSocketEventEmitter(
+            path, codec=codec_impl.JsonCodec(), logger=logging.getLogger(__name__)
+        )
+        remote: typing.List[int] = []
+
+        async def on_received(event: Shipped) -> None:
+            remote.append(event.order)
+
+        receiver.subscribe(on_received, Shipped)
+        async with unix_socket_impl.UnixSocketBroker(path):
+            await receiver.connect()
+            _, writer = await asyncio.open_unix_connection(str(path))
+            payload = codec_impl.JsonCodec().encode(Shipped(1))
+            for frame in (b"not json", payload):
+                writer.write(struct.pack("!I", len(frame)) + frame)
+
+            await asyncio.wait_for(wait_received(receiver, 1), timeout=1)
+            assert receiver.connected
+            writer.close()
+            await receiver.close()
+
+        return remote
+
+    assert asyncio.run(main()) == [1]
+    assert "Failed to decode" in caplog.text
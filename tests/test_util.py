@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+from freedom import util
+
+
+def test_bounded_map_limits_concurrency() -> None:
+    running = 0
+    peak = 0
+
+    async def double(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (5 - value))
+        running -= 1
+        return value * 2
+
+    async def main() -> typing.List[typing.Tuple[int, int]]:
+        return [
+            result
+            async for result in util.bounded_map(double, range(5), max_concurrency=2)
+        ]
+
+    results = asyncio.run(main())
+    assert peak == 2
+    assert sorted(results) == [(0, 0), (1, 2), (2, 4), (3, 6), (4, 8)]
+
+
+def test_bounded_map_pulls_async_iterables_lazily() -> None:
+    pulled: typing.List[int] = []
+
+    async def items() -> typing.AsyncIterator[int]:
+        for value in range(100):
+            pulled.append(value)
+            yield value
+
+    async def identity(value: int) -> int:
+        return value
+
+    async def main() -> None:
+        results = util.bounded_map(identity, items(), max_concurrency=1)
+        assert await results.__anext__() == (0, 0)
+        await typing.cast(typing.AsyncGenerator[typing.Any, None], results).aclose()
+
+    asyncio.run(main())
+    assert len(pulled) < 100
+
+
+def test_bounded_map_raises_the_first_error() -> None:
+    async def fail(value: int) -> int:
+        raise LookupError(value)
+
+    async def main() -> None:
+        async for _ in util.bounded_map(fail, [1, 2], max_concurrency=2):
+            pass
+
+    with pytest.raises(LookupError):
+        asyncio.run(main())
+
+
+def test_bounded_map_requires_positive_concurrency() -> None:
+    async def identity(value: int) -> int:
+        return value
+
+    async def main() -> None:
+        async for _ in util.bounded_map(identity, [1], max_concurrency=0):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())